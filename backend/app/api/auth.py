@@ -2,55 +2,57 @@
 # FICHIER : backend/app/api/auth.py
 # ============================================
  
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models.models import User, LoginAttempt
+from app.models.models import User
 from app.schemas.auth import LoginRequest, TokenResponse, UserResponse, ChangePasswordRequest
-from app.core.security import verify_password, get_password_hash, create_access_token
-from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.security import (
+    verify_password,
+    submit_password_check,
+    get_password_hash,
+    create_access_token,
+    PasswordHasherBusy
+)
+from app.core.throttle import build_login_throttle
+from app.api.deps import Principal, get_current_user
  
 router = APIRouter()
  
 MAX_ATTEMPTS = 5
 LOCKOUT_MINUTES = 30
  
+login_throttle = build_login_throttle(
+    settings.login_throttle_backend, MAX_ATTEMPTS, LOCKOUT_MINUTES, workers=settings.web_concurrency
+)
+ 
 def check_attempts_before_login(db: Session, email: str):
     """Étape 1 : Vérifier si l'IP/Email est déjà bloqué avant même de tester le mdp"""
-    attempt = db.query(LoginAttempt).filter(LoginAttempt.email == email).first()
+    locked_until = login_throttle.locked_until(db, email)
    
-    if attempt and attempt.locked_until:
+    if locked_until:
         now = datetime.utcnow()
-        if attempt.locked_until > now:
-            minutes_remaining = int((attempt.locked_until - now).total_seconds() / 60)
-            # On renvoie 403 car c'est un blocage temporaire
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "message": "Compte temporairement bloqué",
-                    "locked_until": attempt.locked_until.isoformat(),
-                    "minutes_remaining": minutes_remaining
-                }
-            )
-    return attempt
+        minutes_remaining = int((locked_until - now).total_seconds() / 60)
+        # On renvoie 403 car c'est un blocage temporaire
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "message": "Compte temporairement bloqué",
+                "locked_until": locked_until.isoformat(),
+                "minutes_remaining": minutes_remaining
+            }
+        )
  
 def record_failed_attempt(db: Session, email: str):
     """Enregistre un échec et bloque si nécessaire"""
-    attempt = db.query(LoginAttempt).filter(LoginAttempt.email == email).first()
-   
-    if not attempt:
-        attempt = LoginAttempt(email=email)
-        db.add(attempt)
-   
-    now = datetime.utcnow()
-    attempt.attempts_count += 1
-    attempt.last_attempt = now
+    attempts_count, locked_until = login_throttle.record_failure(db, email)
    
     # Vérification si on dépasse la limite
-    if attempt.attempts_count >= MAX_ATTEMPTS:
-        attempt.locked_until = now + timedelta(minutes=LOCKOUT_MINUTES)
-        db.commit()
+    if locked_until:
         # On lève une 403 ici car le compte vient de passer en mode bloqué
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -60,38 +62,32 @@ def record_failed_attempt(db: Session, email: str):
             }
         )
    
-    db.commit()
     # On retourne le nombre d'essais restants pour l'affichage
-    return MAX_ATTEMPTS - attempt.attempts_count
+    return MAX_ATTEMPTS - attempts_count
  
 def reset_attempts(db: Session, email: str):
     """Réinitialise le compteur en cas de succès"""
-    attempt = db.query(LoginAttempt).filter(LoginAttempt.email == email).first()
-    if attempt:
-        attempt.attempts_count = 0
-        attempt.locked_until = None
-        db.commit()
+    login_throttle.reset(db, email)
  
-@router.post("/login", response_model=TokenResponse)
-def login(credentials: LoginRequest, db: Session = Depends(get_db)):
+def find_login_user(db: Session, email: str):
+    """Étapes 1-2 (thread du pool) : blocage éventuel puis lecture de l'utilisateur"""
     # 1. Vérifier si le compte est DÉJÀ bloqué (avant même de vérifier le mdp)
-    check_attempts_before_login(db, credentials.email)
- 
-    # 2. Récupérer l'utilisateur
-    user = db.query(User).filter(User.email == credentials.email).first()
+    check_attempts_before_login(db, email)
  
-    # 3. Vérification unifiée (Existe + Mot de passe)
-    # On utilise une variable pour savoir si c'est valide ou non
-    is_valid_user = False
-    print("user is : ", User)
-    print("password verified : ", verify_password(credentials.password, user.password_hash))
-
-    if user and verify_password(credentials.password, user.password_hash):
-        is_valid_user = True
+    # 2. Récupérer l'utilisateur (colonnes seules : la ligne reste lisible après commit)
+    user = db.query(
+        User.id, User.email, User.password_hash, User.is_admin, User.is_active, User.must_change_password
+    ).filter(User.email == email).first()
+    if user:
+        # Terminer la transaction de lecture pour rendre la connexion au pool pendant le hachage
+        db.commit()
+    return user
  
+def complete_login(db: Session, email: str, user, is_valid_user: bool) -> TokenResponse:
+    """Étapes 4-6 (thread du pool) : échec enregistré, ou reset des tentatives et token"""
     # 4. Si invalide : On enregistre l'échec et on lève l'erreur
     if not is_valid_user:
-        attempts_remaining = record_failed_attempt(db, credentials.email)
+        attempts_remaining = record_failed_attempt(db, email)
        
         # ICI : On utilise 400 (Bad Request) pour éviter le refresh du frontend
         # Et on ne dit pas si c'est l'email ou le mdp qui est faux
@@ -111,7 +107,7 @@ def login(credentials: LoginRequest, db: Session = Depends(get_db)):
         )
  
     # 6. Tout est bon : Reset des tentatives et Token
-    reset_attempts(db, credentials.email)
+    reset_attempts(db, email)
    
     access_token = create_access_token(
         data={
@@ -128,36 +124,66 @@ def login(credentials: LoginRequest, db: Session = Depends(get_db)):
         user=UserResponse.from_orm(user)
     )
  
+@router.post("/login", response_model=TokenResponse)
+async def login(credentials: LoginRequest, db: Session = Depends(get_db)):
+    # Route async : les accès base passent par le pool de threads, et l'attente du
+    # hachage bcrypt n'occupe aucun thread (seulement un worker du pool dédié)
+    user = await run_in_threadpool(find_login_user, db, credentials.email)
+ 
+    # 3. Vérification unifiée (Existe + Mot de passe)
+    # Une seule vérification bcrypt, sur le pool dédié (503 si saturé)
+    is_valid_user = False
+    if user:
+        try:
+            future = submit_password_check(credentials.password, user.password_hash)
+        except PasswordHasherBusy:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Trop de connexions simultanées, veuillez réessayer",
+                headers={"Retry-After": str(settings.password_hash_retry_after_seconds)}
+            )
+        is_valid_user = await asyncio.wrap_future(future)
+ 
+    return await run_in_threadpool(complete_login, db, credentials.email, user, is_valid_user)
+ 
 @router.post("/change-password")
 def change_password(
     request: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Change le mot de passe de l'utilisateur connecté"""
    
+    # current_user peut provenir du cache (objet détaché) : recharger la ligne
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Utilisateur introuvable"
+        )
+   
     # Vérifier le mot de passe actuel
-    if not verify_password(request.current_password, current_user.password_hash):
+    if not verify_password(request.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Mot de passe actuel incorrect"
         )
    
     # Vérifier que le nouveau mot de passe est différent
-    if verify_password(request.new_password, current_user.password_hash):
+    if verify_password(request.new_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Le nouveau mot de passe doit être différent de l'ancien"
         )
    
-    # Mettre à jour le mot de passe
-    current_user.password_hash = get_password_hash(request.new_password)
-    current_user.must_change_password = False
+    # Mettre à jour le mot de passe (invalide aussi l'entrée du cache des utilisateurs)
+    user.password_hash = get_password_hash(request.new_password)
+    user.must_change_password = False
     db.commit()
    
     return {"message": "Mot de passe modifié avec succès"}
  
 @router.post("/logout")
-def logout(current_user: User = Depends(get_current_user)):
+def logout(current_user: Principal = Depends(get_current_user)):
     """Déconnecte l'utilisateur (côté client, suppression du token)"""
     return {"message": "Déconnexion réussie"}
\ No newline at end of file
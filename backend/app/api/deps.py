@@ -2,19 +2,93 @@
 # FICHIER : backend/app/api/deps.py
 # ============================================
 
+from dataclasses import dataclass
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.models import User
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.security import decode_token
 
 security = HTTPBearer()
 
+# Cache des utilisateurs authentifiés, indexé par id.
+# Évite le SELECT sur `users` à chaque requête authentifiée ; les entrées sont
+# invalidées au commit de toute modification d'un utilisateur via l'ORM (changement
+# de mot de passe, désactivation, droits admin...). Le cache est propre à chaque process :
+# le TTL borne le délai de propagation entre workers.
+principal_cache = TTLCache(
+    maxsize=settings.principal_cache_max_size,
+    ttl=settings.principal_cache_ttl_seconds
+)
+
+PRINCIPAL_FIELDS = ("id", "email", "is_admin", "is_active", "must_change_password")
+
+# Incrémenté à chaque invalidation : une lecture commencée avant n'est pas mise en cache
+_generation = 0
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Utilisateur authentifié, en lecture seule (ni lié à une session, ni relations) :
+    recharger la ligne `User` pour la modifier ou accéder à ses relations."""
+    id: int
+    email: str
+    is_admin: bool
+    is_active: bool
+    must_change_password: bool
+
+
+def invalidate_principal(user_id: int = None) -> None:
+    """Retire un utilisateur (ou tous, sans argument) du cache, après toute modification de ses droits"""
+    global _generation
+    _generation += 1
+    if user_id is None:
+        principal_cache.clear()
+    else:
+        principal_cache.delete(user_id)
+
+
+# Invalidation au commit : supprimer l'entrée dès le flush laisserait une requête
+# concurrente remettre en cache l'ancienne ligne, encore visible avant le commit
+@event.listens_for(Session, "after_flush")
+def _collect_changed_principals(session, flush_context):
+    user_ids = {instance.id for instance in (*session.new, *session.dirty, *session.deleted) if isinstance(instance, User)}
+    if user_ids:
+        session.info.setdefault("changed_principals", set()).update(user_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_principals(orm_execute_state):
+    # UPDATE / DELETE en masse (update(User), Query.update) : lignes inconnues, tout vider
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ is User:
+            orm_execute_state.session.info.setdefault("changed_principals", set()).add(None)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_principals(session):
+    user_ids = session.info.pop("changed_principals", None)
+    if user_ids:
+        if None in user_ids:
+            invalidate_principal()
+        for user_id in user_ids - {None}:
+            invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_principals(session):
+    session.info.pop("changed_principals", None)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     """Récupère l'utilisateur actuel depuis le token JWT"""
     
     token = credentials.credentials
@@ -33,12 +107,19 @@ def get_current_user(
             detail="Token invalide"
         )
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user_id = int(user_id)
+    user = principal_cache.get(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Utilisateur introuvable"
-        )
+        generation = _generation
+        row = db.query(*(getattr(User, field) for field in PRINCIPAL_FIELDS)).filter(User.id == user_id).first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Utilisateur introuvable"
+            )
+        user = Principal(**row._asdict())
+        if generation == _generation:
+            principal_cache.set(user_id, user)
     
     if not user.is_active:
         raise HTTPException(
@@ -48,7 +129,7 @@ def get_current_user(
     
     return user
 
-def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+def get_current_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
     """Vérifie que l'utilisateur actuel est administrateur"""
     
     if current_user.is_admin != True:
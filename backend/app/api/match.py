@@ -1,21 +1,37 @@
+import csv
+import io
+import json
+import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from datetime import date, time
 from app.crud.match import (
     get_upcoming_matches, 
+    get_upcoming_matches_async,
     create_match, 
+    create_matches_bulk,
     update_match, 
     delete_match,
-    get_match_by_id
+    get_match_by_id,
+    get_match_by_id_async,
+    EXPORT_COLUMNS,
+    export_matches_statement,
+    iter_export_rows
 )
-from app.database import get_db
-from app.schemas.match import MatchCreate, MatchUpdate, MatchDetailResponse
+from app.core.config import settings
+from app.database import get_db, get_async_db
+from app.schemas.match import MatchCreate, MatchBulkCreate, MatchUpdate, MatchDetailResponse, AvailabilityResponse
+from app.crud.occupancy import court_occupancy
 from app.schemas.team import TeamInfo
 from app.schemas.player import PlayerInfo
-from app.api.deps import get_current_user, get_current_admin
-from app.models.models import User, Match
+from app.api.deps import Principal, get_current_user, get_current_admin
+from app.models.models import Match
 
 router = APIRouter(prefix="/matches", tags=["matches"])
+logger = logging.getLogger(__name__)
 
 def build_match_response(match: Match) -> MatchDetailResponse:
     """Construit une réponse MatchDetailResponse à partir d'un objet Match."""
@@ -56,23 +72,23 @@ def build_match_response(match: Match) -> MatchDetailResponse:
             event_id=match.event_id
         )
     except Exception as e:
-        print(f"ERROR building match response for match {match.id}: {str(e)}")
+        logger.error("Réponse du match %s impossible à construire : %s", match.id, e)
         raise
 
-@router.get("/", response_model=List[MatchDetailResponse])
 def read_upcoming_matches(
     show_all: bool = Query(False, description="Afficher tous les matchs (pour les joueurs)"),
     company: Optional[str] = Query(None, description="Filtrer par entreprise"),
     pool_id: Optional[int] = Query(None, description="Filtrer par poule"),
     status: Optional[str] = Query(None, description="Filtrer par statut"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Récupère la liste des matchs à venir dans les 30 prochains jours.
     """
     try:
-        print(f"[DEBUG] Requête matchs - user: {current_user.email}, admin: {current_user.is_admin}, show_all: {show_all}")
+        logger.debug("Requête matchs - user: %s, admin: %s, show_all: %s",
+                     current_user.email, current_user.is_admin, show_all)
         
         matches = get_upcoming_matches(
             db=db,
@@ -83,30 +99,38 @@ def read_upcoming_matches(
             status_filter=status
         )
         
-        print(f"[DEBUG] {len(matches)} matchs trouvés en base")
-        
-        result = []
-        for i, match in enumerate(matches):
-            try:
-                response = build_match_response(match)
-                result.append(response)
-            except Exception as e:
-                print(f"[ERROR] Erreur pour match {match.id}: {str(e)}")
-                raise
-        
-        print(f"[DEBUG] Retour de {len(result)} matchs au frontend")
+        logger.debug("%d matchs trouvés en base", len(matches))
+        result = [build_match_response(match) for match in matches]
         return result
     except Exception as e:
-        print(f"[ERROR] Exception dans read_upcoming_matches: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Exception dans read_upcoming_matches")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{match_id}", response_model=MatchDetailResponse)
+async def read_upcoming_matches_async(
+    show_all: bool = Query(False, description="Afficher tous les matchs (pour les joueurs)"),
+    company: Optional[str] = Query(None, description="Filtrer par entreprise"),
+    pool_id: Optional[int] = Query(None, description="Filtrer par poule"),
+    status: Optional[str] = Query(None, description="Filtrer par statut"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Récupère la liste des matchs à venir dans les 30 prochains jours (session asynchrone).
+    """
+    matches = await get_upcoming_matches_async(
+        db=db,
+        user=current_user,
+        show_all=show_all,
+        company_filter=company,
+        pool_filter=pool_id,
+        status_filter=status
+    )
+    return [build_match_response(match) for match in matches]
+
 def read_match(
     match_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Récupère un match par son ID.
@@ -117,12 +141,103 @@ def read_match(
 
     return build_match_response(match)
 
+async def read_match_async(
+    match_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Récupère un match par son ID (session asynchrone).
+    """
+    match = await get_match_by_id_async(db, match_id)
+    return build_match_response(match)
+
+@router.get("/availability", response_model=AvailabilityResponse)
+def read_availability(
+    day: date = Query(..., alias="date", description="Date (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Pistes libres et occupées pour chaque créneau du jour
+    (heures des événements et des matchs existants).
+    """
+    return AvailabilityResponse(match_date=day, slots=court_occupancy.availability(db, day))
+
+
+EXPORT_FORMATS = ("ndjson", "csv")
+# Lignes regroupées par morceau de réponse (moins d'écritures réseau)
+EXPORT_CHUNK_ROWS = 500
+
+
+def export_value(value):
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def ndjson_chunks(rows):
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({column: export_value(value) for column, value in zip(EXPORT_COLUMNS, row)}, ensure_ascii=False))
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def csv_chunks(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for i, row in enumerate(rows, start=1):
+        writer.writerow([export_value(value) for value in row])
+        if i % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+@router.get("/export")
+def export_matches(
+    format: str = Query("ndjson", description="ndjson ou csv"),
+    start: Optional[date] = Query(None, description="Date de début incluse (YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, description="Date de fin incluse (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Exporte tous les matchs (équipes, joueurs, scores) en NDJSON ou CSV.
+    Réponse en flux, lue par lots côté serveur : mémoire constante.
+    Réservé aux administrateurs.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Format d'export invalide (ndjson ou csv)")
+    rows = iter_export_rows(db, export_matches_statement(start, end))
+    if format == "csv":
+        return StreamingResponse(
+            csv_chunks(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="matches.csv"'}
+        )
+    return StreamingResponse(ndjson_chunks(rows), media_type="application/x-ndjson")
+
+# Lectures : chemin synchrone (threadpool) ou asynchrone selon la configuration
+if settings.async_db_enabled:
+    router.get("/", response_model=List[MatchDetailResponse])(read_upcoming_matches_async)
+    router.get("/{match_id}", response_model=MatchDetailResponse)(read_match_async)
+else:
+    router.get("/", response_model=List[MatchDetailResponse])(read_upcoming_matches)
+    router.get("/{match_id}", response_model=MatchDetailResponse)(read_match)
+
 
 @router.post("/", response_model=MatchDetailResponse)
 def create_new_match(
     match_data: MatchCreate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     """
     Crée un nouveau match.
@@ -136,12 +251,27 @@ def create_new_match(
     return build_match_response(match)
 
 
+@router.post("/bulk", response_model=List[MatchDetailResponse])
+def create_matches_in_bulk(
+    bulk_data: MatchBulkCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Crée plusieurs matchs en une transaction (tout ou rien).
+    Tous les conflits de terrain sont renvoyés en une fois (409).
+    Réservé aux administrateurs.
+    """
+    matches = create_matches_bulk(db, bulk_data.matches)
+    return [build_match_response(match) for match in matches]
+
+
 @router.patch("/{match_id}", response_model=MatchDetailResponse)
 def update_existing_match(
     match_id: int,
     match_data: MatchUpdate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     """
     Met à jour un match existant.
@@ -159,7 +289,7 @@ def update_existing_match(
 def delete_existing_match(
     match_id: int,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     """
     Supprime un match.
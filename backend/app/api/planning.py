@@ -5,10 +5,12 @@
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from app.database import get_db
-from app.api.deps import get_current_user
-from app.models.models import User
+from app.core.config import settings
+from app.database import get_db, get_async_db
+from app.api.deps import Principal, get_current_user
+from app.crud.planning_cache import cached, cached_async
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -19,48 +21,91 @@ def parse_date(s: str):
 	except Exception:
 		raise HTTPException(status_code=400, detail="Format de date attendu: YYYY-MM-DD")
 
-# Récupérer les événements et matchs dans une plage de dates
-@router.get("/")
-def events_range(start: str = Query(..., description="YYYY-MM-DD"), end: str = Query(..., description="YYYY-MM-DD"), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-	"""Retourne les événements et matchs entre deux dates (inclusives).
 
-	La réponse contient une liste d'objets { event_id, event_date, event_time, matches: [...] }
+# Appartenance de l'utilisateur aux équipes via team_members (recherche par clé primaire)
+EVENTS_RANGE_SQL = text(
 	"""
-	start_date = parse_date(start)
-	end_date = parse_date(end)
+	SELECT e.id as event_id, e.event_date, e.start_time as event_time,
+	       m.id as match_id, m.team1_id, m.team2_id, m.court_number, m.status, m.score_team1, m.score_team2,
+	       CASE WHEN tm1.team_id IS NULL THEN 0 ELSE 1 END as user_in_team1,
+	       CASE WHEN tm2.team_id IS NULL THEN 0 ELSE 1 END as user_in_team2
+	FROM events e
+	LEFT JOIN matches m ON m.event_id = e.id
+	LEFT JOIN team_members tm1 ON tm1.user_id = :uid AND tm1.team_id = m.team1_id
+	LEFT JOIN team_members tm2 ON tm2.user_id = :uid AND tm2.team_id = m.team2_id
+	WHERE e.event_date BETWEEN :start_date AND :end_date
+	ORDER BY e.event_date, e.start_time, m.court_number
+	"""
+)
 
-	# Inclure info sur joueurs pour calculer si l'utilisateur est dans une des équipes
-	sql = text(
-		"""
-		SELECT e.id as event_id, e.event_date, e.event_time,
-		       m.id as match_id, m.team1_id, m.team2_id, m.court_number, m.status, m.score_team1, m.score_team2,
-		       CASE WHEN (p1.user_id = :uid OR p2.user_id = :uid) THEN 1 ELSE 0 END as user_in_team1,
-		       CASE WHEN (p3.user_id = :uid OR p4.user_id = :uid) THEN 1 ELSE 0 END as user_in_team2
-		FROM events e
-		LEFT JOIN matches m ON m.event_id = e.id
-		LEFT JOIN teams t1 ON t1.id = m.team1_id
-		LEFT JOIN players p1 ON p1.id = t1.player1_id
-		LEFT JOIN players p2 ON p2.id = t1.player2_id
-		LEFT JOIN teams t2 ON t2.id = m.team2_id
-		LEFT JOIN players p3 ON p3.id = t2.player1_id
-		LEFT JOIN players p4 ON p4.id = t2.player2_id
-		WHERE e.event_date BETWEEN :start_date AND :end_date
-		ORDER BY e.event_date, e.event_time, m.court_number
-		"""
-	)
-	
-	res = db.execute(sql, {"start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "uid": current_user.id}).fetchall()
+# Requête pour récupérer les matchs et enrichir avec les infos d'équipes et joueurs
+PLANNING_DAY_SQL = text(
+	"""
+	SELECT m.id as match_id, m.court_number, m.status, m.score_team1, m.score_team2,
+		   e.id as event_id, e.start_time as event_time,
+		   t1.id as team1_id, t1.company as team1_company,
+		   p1.first_name as t1_p1_first, p1.last_name as t1_p1_last,
+		   p2.first_name as t1_p2_first, p2.last_name as t1_p2_last,
+		   t2.id as team2_id, t2.company as team2_company,
+		   p3.first_name as t2_p1_first, p3.last_name as t2_p1_last,
+		   p4.first_name as t2_p2_first, p4.last_name as t2_p2_last
+	FROM events e
+	JOIN matches m ON m.event_id = e.id
+	LEFT JOIN teams t1 ON t1.id = m.team1_id
+	LEFT JOIN players p1 ON p1.id = t1.player1_id
+	LEFT JOIN players p2 ON p2.id = t1.player2_id
+	LEFT JOIN teams t2 ON t2.id = m.team2_id
+	LEFT JOIN players p3 ON p3.id = t2.player1_id
+	LEFT JOIN players p4 ON p4.id = t2.player2_id
+	WHERE e.event_date = :target_date
+	ORDER BY m.court_number
+	"""
+)
+
+MY_EVENTS_SQL = text(
+	"""
+	SELECT m.id as match_id, m.court_number, m.status, m.score_team1, m.score_team2,
+		   e.id as event_id, e.event_date, e.start_time as event_time,
+		   t1.id as team1_id, t1.company as team1_company,
+		   p1.first_name as t1_p1_first, p1.last_name as t1_p1_last,
+		   p2.first_name as t1_p2_first, p2.last_name as t1_p2_last,
+		   t2.id as team2_id, t2.company as team2_company,
+		   p3.first_name as t2_p1_first, p3.last_name as t2_p1_last,
+		   p4.first_name as t2_p2_first, p4.last_name as t2_p2_last
+	FROM matches m
+	JOIN events e ON e.id = m.event_id
+	LEFT JOIN teams t1 ON t1.id = m.team1_id
+	LEFT JOIN players p1 ON p1.id = t1.player1_id
+	LEFT JOIN players p2 ON p2.id = t1.player2_id
+	LEFT JOIN teams t2 ON t2.id = m.team2_id
+	LEFT JOIN players p3 ON p3.id = t2.player1_id
+	LEFT JOIN players p4 ON p4.id = t2.player2_id
+	WHERE m.team1_id IN (SELECT team_id FROM team_members WHERE user_id = :uid)
+	   OR m.team2_id IN (SELECT team_id FROM team_members WHERE user_id = :uid)
+	ORDER BY e.event_date, m.court_number
+	"""
+)
 
-	# Grouper par event
+
+def format_date(value):
+	return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def format_time(value):
+	return str(value) if value is not None else None
+
+
+def group_events(rows) -> list:
+	"""Regroupe les lignes de EVENTS_RANGE_SQL par événement"""
 	events = {}
-	for row in res:
+	for row in rows:
 		rec = row._mapping if hasattr(row, "_mapping") else row
 		eid = rec["event_id"]
 		if eid not in events:
 			events[eid] = {
 				"event_id": eid,
-				"event_date": rec["event_date"].isoformat() if isinstance(rec["event_date"], datetime) else str(rec["event_date"]),
-				"event_time": str(rec["event_time"]) if rec["event_time"] is not None else None,
+				"event_date": format_date(rec["event_date"]),
+				"event_time": format_time(rec["event_time"]),
 				"matches": []
 			}
 
@@ -79,38 +124,9 @@ def events_range(start: str = Query(..., description="YYYY-MM-DD"), end: str = Q
 
 	return list(events.values())
 
-# Récupérer les matchs pour une date donnée
-@router.get("/day/{day}")
-def planning_day(day: str, db: Session = Depends(get_db)):
-	"""Retourne les détails (événements + matchs + équipes) pour une date donnée (YYYY-MM-DD)."""
-	target = parse_date(day)
-
-	# Requête pour récupérer les matchs et enrichir avec les infos d'équipes et joueurs
-	sql = text(
-		"""
-		SELECT m.id as match_id, m.court_number, m.status, m.score_team1, m.score_team2,
-			   e.id as event_id, e.event_time,
-			   t1.id as team1_id, t1.company as team1_company,
-			   p1.first_name as t1_p1_first, p1.last_name as t1_p1_last,
-			   p2.first_name as t1_p2_first, p2.last_name as t1_p2_last,
-			   t2.id as team2_id, t2.company as team2_company,
-			   p3.first_name as t2_p1_first, p3.last_name as t2_p1_last,
-			   p4.first_name as t2_p2_first, p4.last_name as t2_p2_last
-		FROM events e
-		JOIN matches m ON m.event_id = e.id
-		LEFT JOIN teams t1 ON t1.id = m.team1_id
-		LEFT JOIN players p1 ON p1.id = t1.player1_id
-		LEFT JOIN players p2 ON p2.id = t1.player2_id
-		LEFT JOIN teams t2 ON t2.id = m.team2_id
-		LEFT JOIN players p3 ON p3.id = t2.player1_id
-		LEFT JOIN players p4 ON p4.id = t2.player2_id
-		WHERE e.event_date = :target_date
-		ORDER BY m.court_number
-		"""
-	)
-
-	rows = db.execute(sql, {"target_date": target.isoformat()}).fetchall()
 
+def build_match_details(rows, with_date: bool = False) -> list:
+	"""Construit la liste des matchs (équipes + joueurs) à partir des lignes SQL"""
 	matches = []
 	for r in rows:
 		rec = r._mapping if hasattr(r, "_mapping") else r
@@ -127,14 +143,18 @@ def planning_day(day: str, db: Session = Depends(get_db)):
 			team2_players.append(f"{rec['t2_p2_first']} {rec['t2_p2_last']}")
 
 		# Ajouter le match avec toutes les infos
-		matches.append({
+		match = {
 			"match_id": rec["match_id"],
 			"court_number": rec["court_number"],
 			"status": rec["status"],
 			"score_team1": rec["score_team1"],
 			"score_team2": rec["score_team2"],
 			"event_id": rec["event_id"],
-			"event_time": str(rec["event_time"]) if rec["event_time"] is not None else None,
+		}
+		if with_date:
+			match["event_date"] = format_date(rec["event_date"])
+		match.update({
+			"event_time": format_time(rec["event_time"]),
 			"team1": {
 				"id": rec["team1_id"],
 				"company": rec["team1_company"],
@@ -146,80 +166,98 @@ def planning_day(day: str, db: Session = Depends(get_db)):
 				"players": team2_players
 			}
 		})
+		matches.append(match)
+
+	return matches
+
+
+def range_params(start: str, end: str, current_user: Principal) -> dict:
+	start_date = parse_date(start)
+	end_date = parse_date(end)
+	return {"start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "uid": current_user.id}
+
+
+def range_key(params: dict) -> tuple:
+	"""Clé de cache d'une plage (réponse propre à l'utilisateur : user_in_team1/2)"""
+	return ("range", params["start_date"], params["end_date"], params["uid"])
+
+
+# Récupérer les événements et matchs dans une plage de dates
+def events_range(start: str = Query(..., description="YYYY-MM-DD"), end: str = Query(..., description="YYYY-MM-DD"), db: Session = Depends(get_db), current_user: Principal = Depends(get_current_user)):
+	"""Retourne les événements et matchs entre deux dates (inclusives).
+
+	La réponse contient une liste d'objets { event_id, event_date, event_time, matches: [...] }
+	"""
+	params = range_params(start, end, current_user)
+	return cached(
+		db,
+		range_key(params),
+		lambda: group_events(db.execute(EVENTS_RANGE_SQL, params).fetchall())
+	)
+
 
-	return {"date": target.isoformat(), "matches": matches}
+async def events_range_async(start: str = Query(..., description="YYYY-MM-DD"), end: str = Query(..., description="YYYY-MM-DD"), db: AsyncSession = Depends(get_async_db), current_user: Principal = Depends(get_current_user)):
+	"""Retourne les événements et matchs entre deux dates (inclusives)."""
+	params = range_params(start, end, current_user)
+
+	async def compute():
+		return group_events((await db.execute(EVENTS_RANGE_SQL, params)).fetchall())
+
+	return await cached_async(db, range_key(params), compute)
+
+
+# Récupérer les matchs pour une date donnée
+def planning_day(day: str, db: Session = Depends(get_db)):
+	"""Retourne les détails (événements + matchs + équipes) pour une date donnée (YYYY-MM-DD)."""
+	target = parse_date(day)
+
+	def compute():
+		rows = db.execute(PLANNING_DAY_SQL, {"target_date": target.isoformat()}).fetchall()
+		return {"date": target.isoformat(), "matches": build_match_details(rows)}
+
+	return cached(db, ("day", target), compute)
+
+
+async def planning_day_async(day: str, db: AsyncSession = Depends(get_async_db)):
+	"""Retourne les détails (événements + matchs + équipes) pour une date donnée (YYYY-MM-DD)."""
+	target = parse_date(day)
+
+	async def compute():
+		rows = (await db.execute(PLANNING_DAY_SQL, {"target_date": target.isoformat()})).fetchall()
+		return {"date": target.isoformat(), "matches": build_match_details(rows)}
+
+	return await cached_async(db, ("day", target), compute)
 
 
 # Récupérer les événements et matchs liés à l'utilisateur connecté
-@router.get("/my-events")
-def my_events(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def my_events(db: Session = Depends(get_db), current_user: Principal = Depends(get_current_user)):
 	"""Retourne les matchs auxquels l'utilisateur connecté participe.
 
-	La participation est déterminée par `players.user_id` (les players rattachés à l'utilisateur).
+	La participation est déterminée par `team_members` (équipes des players rattachés à l'utilisateur).
 	Renvoie la liste des matchs avec info équipe, joueurs, date/heure d'événement, piste, statut et score.
 	"""
-	uid = current_user.id
-
-	sql = text(
-		"""
-		SELECT m.id as match_id, m.court_number, m.status, m.score_team1, m.score_team2,
-			   e.id as event_id, e.event_date, e.event_time,
-			   t1.id as team1_id, t1.company as team1_company,
-			   p1.first_name as t1_p1_first, p1.last_name as t1_p1_last,
-			   p2.first_name as t1_p2_first, p2.last_name as t1_p2_last,
-			   t2.id as team2_id, t2.company as team2_company,
-			   p3.first_name as t2_p1_first, p3.last_name as t2_p1_last,
-			   p4.first_name as t2_p2_first, p4.last_name as t2_p2_last
-		FROM matches m
-		JOIN events e ON e.id = m.event_id
-		LEFT JOIN teams t1 ON t1.id = m.team1_id
-		LEFT JOIN players p1 ON p1.id = t1.player1_id
-		LEFT JOIN players p2 ON p2.id = t1.player2_id
-		LEFT JOIN teams t2 ON t2.id = m.team2_id
-		LEFT JOIN players p3 ON p3.id = t2.player1_id
-		LEFT JOIN players p4 ON p4.id = t2.player2_id
-		WHERE (p1.user_id = :uid OR p2.user_id = :uid OR p3.user_id = :uid OR p4.user_id = :uid)
-		ORDER BY e.event_date, m.court_number
-		"""
-	)
+	def compute():
+		rows = db.execute(MY_EVENTS_SQL, {"uid": current_user.id}).fetchall()
+		return {"matches": build_match_details(rows, with_date=True)}
 
-	rows = db.execute(sql, {"uid": uid}).fetchall()
+	return cached(db, ("my", current_user.id), compute)
 
-	matches = []
-	for r in rows:
-		rec = r._mapping if hasattr(r, "_mapping") else r
-		team1_players = []
-		if rec["t1_p1_first"]:
-			team1_players.append(f"{rec['t1_p1_first']} {rec['t1_p1_last']}")
-		if rec["t1_p2_first"]:
-			team1_players.append(f"{rec['t1_p2_first']} {rec['t1_p2_last']}")
 
-		team2_players = []
-		if rec["t2_p1_first"]:
-			team2_players.append(f"{rec['t2_p1_first']} {rec['t2_p1_last']}")
-		if rec["t2_p2_first"]:
-			team2_players.append(f"{rec['t2_p2_first']} {rec['t2_p2_last']}")
+async def my_events_async(db: AsyncSession = Depends(get_async_db), current_user: Principal = Depends(get_current_user)):
+	"""Retourne les matchs auxquels l'utilisateur connecté participe."""
+	async def compute():
+		rows = (await db.execute(MY_EVENTS_SQL, {"uid": current_user.id})).fetchall()
+		return {"matches": build_match_details(rows, with_date=True)}
+
+	return await cached_async(db, ("my", current_user.id), compute)
 
-		# Ajouter le match avec toutes les infos
-		matches.append({
-			"match_id": rec["match_id"],
-			"court_number": rec["court_number"],
-			"status": rec["status"],
-			"score_team1": rec["score_team1"],
-			"score_team2": rec["score_team2"],
-			"event_id": rec["event_id"],
-			"event_date": rec["event_date"].isoformat() if isinstance(rec["event_date"], datetime) else str(rec["event_date"]),
-			"event_time": str(rec["event_time"]) if rec["event_time"] is not None else None,
-			"team1": {
-				"id": rec["team1_id"],
-				"company": rec["team1_company"],
-				"players": team1_players
-			},
-			"team2": {
-				"id": rec["team2_id"],
-				"company": rec["team2_company"],
-				"players": team2_players
-			}
-		})
 
-	return {"matches": matches}
\ No newline at end of file
+# Chemin synchrone (threadpool) ou asynchrone selon la configuration
+if settings.async_db_enabled:
+	router.get("/")(events_range_async)
+	router.get("/day/{day}")(planning_day_async)
+	router.get("/my-events")(my_events_async)
+else:
+	router.get("/")(events_range)
+	router.get("/day/{day}")(planning_day)
+	router.get("/my-events")(my_events)
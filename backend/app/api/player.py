@@ -1,18 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session, joinedload
 from typing import List
 
 from app.database import get_db
 from app.models.models import Player, User
 from app.schemas.player import PlayerCreate, PlayerUpdate, PlayerResponse
-from app.api.deps import get_current_admin
+from app.api.deps import Principal, get_current_admin
+from app.core.pagination import PageParams, paginate
 
 
 router = APIRouter(prefix="/players", tags=["players"])
 
 @router.get("/", response_model=List[PlayerResponse])
-def get_players(db: Session = Depends(get_db)):
-    players = db.query(Player).options(joinedload(Player.user)).all()
+def get_players(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    players = paginate(db.query(Player).options(joinedload(Player.user)), Player.id, page, response)
     # Définir email pour chaque player
     for player in players:
         if player.user:
@@ -29,7 +30,7 @@ def get_player(player_id: int, db: Session = Depends(get_db)):
     return player
 
 @router.post("/", response_model=PlayerResponse)
-def create_player(player_data: PlayerCreate, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def create_player(player_data: PlayerCreate, db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     # Vérifier si l'utilisateur existe
     user = db.query(User).filter(User.id == player_data.user_id).first()
     if not user:
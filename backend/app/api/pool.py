@@ -2,49 +2,36 @@
 # FICHIER : backend/app/api/pool.py
 # ============================================
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.database import get_db
 from app.models.models import Pool, Team
-from app.schemas.pool import PoolCreate, PoolResponse
+from app.schemas.pool import PoolCreate, PoolResponse, PoolTeamsMove, ScheduleRequest, ScheduleResponse, StandingResponse
+from app.schemas.team import TeamResponse
+from app.crud.pool import assign_teams, create_pool_with_teams, move_teams
+from app.crud.schedule import generate_schedule
+from app.crud.standings import pool_standings, recompute_standings
 from app.api.deps import get_current_admin
+from app.core.pagination import PageParams, paginate
 
 router = APIRouter(prefix="/pools", tags=["pools"])
 
 @router.post("/", response_model=PoolResponse)
 def create_pool(pool_data: PoolCreate, db: Session = Depends(get_db), current_admin = Depends(get_current_admin)):
-    # Vérifier qu'une poule avec ce nom n'existe pas déjà
-    existing_pool = db.query(Pool).filter(Pool.name == pool_data.name).first()
-    if existing_pool:
-        raise HTTPException(status_code=409, detail="Une poule avec ce nom existe déjà")
-    
-    # Vérifier que les équipes existent et ne sont pas déjà dans une autre poule
-    teams = []
-    for team_id in pool_data.team_ids:
-        team = db.query(Team).filter(Team.id == team_id).first()
-        if not team:
-            raise HTTPException(status_code=404, detail=f"Équipe {team_id} introuvable")
-        if team.pool_id is not None:
-            raise HTTPException(status_code=400, detail=f"Équipe {team_id} est déjà dans une poule")
-        teams.append(team)
-    
-    db_pool = Pool(name=pool_data.name)
-    db.add(db_pool)
-    db.commit()
-    db.refresh(db_pool)
-    
-    # Assigner les équipes à la poule
-    for team in teams:
-        team.pool_id = db_pool.id
-    db.commit()
-    
-    return db_pool
+    # Équipes chargées en une requête, affectées par un seul UPDATE (une transaction)
+    return create_pool_with_teams(db, pool_data.name, pool_data.team_ids)
+
+@router.post("/schedule", response_model=ScheduleResponse)
+def schedule_pools(request: ScheduleRequest, db: Session = Depends(get_db), current_admin = Depends(get_current_admin)):
+    """Génère les matchs toutes rondes des poules sur les événements de la période (dry_run : simulation)"""
+    return generate_schedule(db, request)
 
 @router.get("/", response_model=List[PoolResponse])
-def get_pools(db: Session = Depends(get_db)):
-    pools = db.query(Pool).all()
+def get_pools(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    pools = paginate(db.query(Pool), Pool.id, page, response)
     return pools
 
 @router.get("/{pool_id}", response_model=PoolResponse)
@@ -54,6 +41,23 @@ def get_pool(pool_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Poule introuvable")
     return pool
 
+@router.get("/{pool_id}/standings", response_model=List[StandingResponse])
+def get_pool_standings(pool_id: int, db: Session = Depends(get_db)):
+    """Classement de la poule (mis à jour à chaque match terminé)"""
+    return pool_standings(db, pool_id)
+
+@router.post("/{pool_id}/standings/recompute", response_model=List[StandingResponse])
+def recompute_pool_standings(pool_id: int, db: Session = Depends(get_db), current_admin = Depends(get_current_admin)):
+    """Recalcule le classement de la poule depuis les matchs terminés (réparation)"""
+    standings = pool_standings(db, pool_id)
+    recompute_standings(db, [entry["team_id"] for entry in standings])
+    return pool_standings(db, pool_id)
+
+@router.post("/{pool_id}/teams", response_model=List[TeamResponse])
+def move_teams_to_pool(pool_id: int, move: PoolTeamsMove, db: Session = Depends(get_db), current_admin = Depends(get_current_admin)):
+    """Déplace des équipes (libres ou d'une autre poule) dans la poule ; renvoie les équipes de la poule"""
+    return move_teams(db, pool_id, move.team_ids)
+
 @router.put("/{pool_id}", response_model=PoolResponse)
 def update_pool(pool_id: int, pool_data: PoolCreate, db: Session = Depends(get_db), current_admin = Depends(get_current_admin)):
     pool = db.query(Pool).filter(Pool.id == pool_id).first()
@@ -77,7 +81,7 @@ def delete_pool(pool_id: int, db: Session = Depends(get_db), current_admin = Dep
         raise HTTPException(status_code=404, detail="Poule introuvable")
     
     # Retirer les équipes de la poule
-    db.query(Team).filter(Team.pool_id == pool_id).update({Team.pool_id: None})
+    assign_teams(db, db.execute(select(Team.id).where(Team.pool_id == pool_id)).scalars().all(), None)
     
     db.delete(pool)
     db.commit()
@@ -3,7 +3,7 @@
 # FICHIER : backend/app/api/team.py
 # ============================================
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -11,6 +11,7 @@ from app.database import get_db
 from app.models.models import Team, Player, Match
 from app.schemas.team import TeamCreate, TeamUpdate, TeamResponse
 from app.api.deps import get_current_admin
+from app.core.pagination import PageParams, paginate
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
@@ -51,8 +52,8 @@ def create_team(team_data: TeamCreate, db: Session = Depends(get_db), current_ad
     return db_team
 
 @router.get("/", response_model=List[TeamResponse])
-def get_teams(db: Session = Depends(get_db)):
-    teams = db.query(Team).all()
+def get_teams(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    teams = paginate(db.query(Team), Team.id, page, response)
     return teams
 
 @router.get("/{team_id}", response_model=TeamResponse)
@@ -2,40 +2,31 @@
 # FICHIER : backend/app/api/user.py
 # ============================================
 
+import logging
 from datetime import datetime, timedelta
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.models import User, LoginAttempt
 from app.schemas.auth import LoginRequest, TokenResponse, UserResponse, ChangePasswordRequest, UserResponse
-from app.schemas.user import CreateUserRequest, CreateUserResponse, UserSelectResponse
+from app.schemas.user import CreateUserRequest, CreateUserResponse, UserSelectResponse, UserSearchResult
 from app.core.security import verify_password, get_password_hash, create_access_token
-from app.core.security import get_password_hash
-from app.api.deps import get_current_admin
-import secrets
-import string
+from app.core.security import get_password_hash, generate_password
+from app.api.deps import Principal, get_current_admin
+from app.core.pagination import PageParams, paginate
+from app.crud.search import SEARCH_MODES, search_statement, search_user_ids
+from app.crud.imports import import_rows, read_csv
+from app.schemas.imports import ImportReport
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
-def generate_password(length: int = 12) -> str:
-    # Génère un mot de passe sécurisé
-    characters = string.ascii_letters + string.digits + "!@#$%^&*"
-    password = ''.join(secrets.choice(characters) for _ in range(length))
-    
-    if (any(c.isupper() for c in password) and 
-        any(c.islower() for c in password) and 
-        any(c.isdigit() for c in password) and 
-        any(c in "!@#$%^&*" for c in password)):
-        return password
-    else:
-        return generate_password(length)
-
 @router.post("/users", response_model=CreateUserResponse)
-def createUser(user_data: CreateUserRequest, db: Session = Depends(get_db),current_admin: User = Depends(get_current_admin) ):
+def createUser(user_data: CreateUserRequest, db: Session = Depends(get_db),current_admin: Principal = Depends(get_current_admin) ):
     # Vérifier si l'email existe déjà
-    print(user_data.email)
+    logger.debug("Création du compte %s", user_data.email)
     existing_user = db.query(User).filter(User.email == user_data.email).first()
     if existing_user:
         raise HTTPException(status_code=409, detail="Email déjà utilisé")
@@ -59,21 +50,54 @@ def createUser(user_data: CreateUserRequest, db: Session = Depends(get_db),curre
         temporary_password=temporary_password
     )
 
+@router.post("/users/import", response_model=ImportReport)
+def import_users(
+    file: UploadFile = File(..., description="CSV : email, first_name, last_name, company, license_number, birth_date, is_admin, team"),
+    dry_run: bool = Query(False, description="Valider sans rien créer"),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """
+    Import en masse de comptes + joueurs (une ligne chacun) ; deux lignes avec
+    la même valeur `team` forment une équipe. Rapport ligne par ligne avec les
+    mots de passe temporaires des comptes créés.
+    """
+    try:
+        rows = read_csv(file.file.read().decode("utf-8-sig"))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Fichier CSV invalide : {e}")
+    return import_rows(db, rows, dry_run=dry_run)
+
 @router.get("/users/select", response_model=list[UserSelectResponse])
-def get_users_for_select(db: Session = Depends(get_db)):
-    users = db.query(User).all()
+def get_users_for_select(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    users = paginate(db.query(User.id, User.email), User.id, page, response)
     return users
 
 
+@router.get("/users/search", response_model=List[UserSearchResult])
+def search_users(
+    q: str = Query(..., min_length=1, max_length=100),
+    mode: str = Query("substring", description="prefix ou substring"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """Recherche d'utilisateurs / joueurs par email, nom, prénom ou entreprise, triée par pertinence"""
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail="Mode de recherche invalide (prefix ou substring)")
+    statement = search_statement(db.get_bind().dialect.name, q, mode).limit(limit)
+    return db.execute(statement).scalars().all()
+
+
 @router.get("/users", response_model=List[UserResponse])
 def getUsers(
+    response: Response,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=200),
+    current_admin: Principal = Depends(get_current_admin),
+    page: PageParams = Depends(),
     is_active: Optional[bool] = None,
     is_admin: Optional[bool] = None,
-    search: Optional[str] = None,  # recherche simple sur l'email
+    search: Optional[str] = None,  # recherche sur l'email / le joueur (index de recherche)
 ):
     query = db.query(User)
 
@@ -84,14 +108,10 @@ def getUsers(
         query = query.filter(User.is_admin == is_admin)
 
     if search:
-        query = query.filter(User.email.ilike(f"%{search}%"))
+        query = query.filter(User.id.in_(search_user_ids(db.get_bind().dialect.name, search)))
 
-    users = (
-        query.order_by(User.id.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    # Du plus récent au plus ancien, page suivante via X-Next-Cursor
+    users = paginate(query, User.id, page, response, descending=True)
 
     # UserResponse est un pydantic model -> renvoyer une liste d'objets "compatibles"
     return [UserResponse.from_orm(u) for u in users]
\ No newline at end of file
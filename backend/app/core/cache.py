@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Cache mémoire LRU avec expiration (TTL), thread-safe.
+
+    - `maxsize` : nombre maximum d'entrées, la moins récemment utilisée est évincée
+    - `ttl` : durée de vie d'une entrée en secondes (0 désactive le cache)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retourne la valeur en cache ou None si absente / expirée"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Compteurs succès / échecs et nombre d'entrées"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Un store partagé (ex. Redis) s'ajoute ici avec la même interface :
+# get / set / delete / clear / stats
+CACHE_BACKENDS = {
+    "memory": TTLCache,
+}
+
+
+def build_cache(backend: str, maxsize: int, ttl: float):
+    """Instancie le backend de cache configuré"""
+    try:
+        cache_class = CACHE_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Backend de cache inconnu : {backend}")
+    return cache_class(maxsize=maxsize, ttl=ttl)
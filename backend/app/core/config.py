@@ -3,10 +3,79 @@ from typing import List
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./padel_corpo.db"
+
+    # SQLite : pragmas appliqués à chaque connexion (lectures concurrentes en WAL)
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456  # 256 Mo
+    sqlite_cache_size: int = -65536  # négatif = en Kio (64 Mo)
+
+    # Vérification du schéma au démarrage (lifespan) : une requête, et création des tables / index
+    # + resynchronisation des tables dérivées seulement si les modèles ont changé depuis.
+    # False si `python -m scripts.prepare_database` est lancé à chaque déploiement
+    schema_check_on_startup: bool = True
+
+    # Pool de connexions (recyclage et pre-ping : bases autres que SQLite)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle_seconds: int = 1800
+    db_pool_timeout_seconds: int = 30
+
+    # Chemin asynchrone pour les lectures (planning, matchs) : nécessite aiosqlite / asyncpg
+    async_db_enabled: bool = False
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 1440
     allowed_origins: str = "http://localhost:5173"
+
+    # Cache des utilisateurs authentifiés (get_current_user), 0 pour désactiver
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_size: int = 10000
+
+    # Pool dédié à la vérification bcrypt (/auth/login)
+    password_hash_workers: int = 4
+    password_hash_queue_size: int = 16
+    password_hash_retry_after_seconds: int = 1
+
+    # Limitation des échecs de connexion : "memory" (compteurs propres à chaque process : avec N workers,
+    # jusqu'à N x MAX_ATTEMPTS essais par fenêtre, remis à zéro à chaque redémarrage), "database"
+    # (table login_attempts, partagée entre workers) ou "auto" : "database" dès que web_concurrency > 1
+    login_throttle_backend: str = "auto"
+
+    # Nombre de workers du serveur (WEB_CONCURRENCY, valeur par défaut de `uvicorn --workers`)
+    web_concurrency: int = 1
+
+    # Index d'occupation des pistes (par process) : durée avant rechargement d'une date,
+    # jours préchargés au démarrage (les autres dates sont chargées au premier accès)
+    court_occupancy_ttl_seconds: int = 60
+    court_occupancy_warm_days: int = 7
+
+    # Cache des réponses du planning (/events), vidé à chaque modification des matchs,
+    # événements, équipes ou joueurs ; 0 pour désactiver
+    planning_cache_backend: str = "memory"
+    planning_cache_ttl_seconds: int = 60
+    planning_cache_max_size: int = 2048
+
+    # Pagination par curseur des listes (users, players, teams, pools)
+    page_size_default: int = 100
+    page_size_max: int = 500
+
+    # Instrumentation (Server-Timing, /metrics) : désactivée par défaut.
+    # Au-delà de sql_statement_budget requêtes SQL, une requête HTTP est signalée (N+1 probable)
+    instrumentation_enabled: bool = False
+    sql_statement_budget: int = 30
+
+    # Import CSV des comptes / joueurs / équipes : lignes par transaction
+    import_batch_size: int = 500
+
+    # Logs : niveau racine, niveaux par module ("app.api.match=DEBUG,sqlalchemy.engine=WARNING"),
+    # format "json" ou "text", fraction des DEBUG conservés, taille de la file (au-delà : abandonnés)
+    log_level: str = "INFO"
+    log_levels: str = ""
+    log_format: str = "json"
+    log_debug_sample_rate: float = 1.0
+    log_queue_size: int = 10000
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,152 @@
+from datetime import date
+from hashlib import sha1
+from typing import Dict, Iterable, Tuple
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database import get_db
+from app.models.models import Event, Match, Player, ResourceVersion, Team
+
+ETAG_HEADER = "ETag"
+
+# Réponses propres à l'utilisateur : jamais dans un cache partagé, revalidées à chaque usage
+CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+# Ressource versionnée de chaque modèle
+MODEL_RESOURCES = {
+    Match: "matches",
+    Event: "events",
+    Team: "teams",
+    Player: "players",
+}
+ALL_RESOURCES = tuple(MODEL_RESOURCES.values())
+
+# Lectures conditionnelles : préfixe de chemin -> ressources dont dépend la réponse
+ETAG_ROUTES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("/api/v1/matches", ("matches", "events", "teams", "players")),
+    ("/api/v1/events", ("matches", "events", "teams", "players")),
+    ("/api/v1/teams", ("teams", "players")),
+    ("/api/v1/players", ("players",)),
+)
+
+
+def bump_resource_versions(connection: Connection, resources: Iterable[str]) -> None:
+    """Incrémente les versions dans la transaction en cours (à appeler après une
+    écriture hors ORM : scripts, SQL brut ; les sessions ORM le font d'elles-mêmes)"""
+    resources = sorted(set(resources))
+    if not resources:
+        return
+    connection.execute(
+        update(ResourceVersion).where(ResourceVersion.resource.in_(resources)).values(version=ResourceVersion.version + 1)
+    )
+    existing = set(connection.execute(
+        select(ResourceVersion.resource).where(ResourceVersion.resource.in_(resources))
+    ).scalars())
+    missing = [resource for resource in resources if resource not in existing]
+    if missing:
+        connection.execute(insert(ResourceVersion), [{"resource": resource, "version": 1} for resource in missing])
+
+
+def read_resource_versions(db: Session) -> Dict[str, int]:
+    """Versions actuelles de toutes les ressources, en une requête"""
+    return dict(db.execute(select(ResourceVersion.resource, ResourceVersion.version)).all())
+
+
+def route_resources(path: str) -> Tuple[str, ...]:
+    for prefix, resources in ETAG_ROUTES:
+        if path == prefix or path.startswith(prefix + "/"):
+            return resources
+    return ()
+
+
+def compute_etag(path: str, query: str, authorization: str, versions: Dict[str, int], resources: Tuple[str, ...]) -> str:
+    """
+    ETag faible d'une lecture : versions des ressources + requête (chemin, paramètres)
+    + identité (Authorization, les réponses dépendent de l'utilisateur) + date du jour
+    (listes « à venir »).
+    """
+    key = "|".join((
+        ".".join(str(versions.get(resource, 0)) for resource in resources),
+        path,
+        query,
+        authorization,
+        date.today().isoformat(),
+    ))
+    return f'W/"{sha1(key.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (candidate.strip() for candidate in if_none_match.split(","))
+
+
+def load_versions(app) -> Dict[str, int]:
+    """Lit les versions avec la session de l'application (get_db, ou sa surcharge)"""
+    sessions = app.dependency_overrides.get(get_db, get_db)()
+    try:
+        return read_resource_versions(next(sessions))
+    finally:
+        sessions.close()
+
+
+class ConditionalGetMiddleware:
+    """Middleware ASGI : ETag sur les lectures versionnées, 304 sans exécuter la route si inchangé.
+
+    À monter sous CORSMiddleware pour que les 304 portent aussi les en-têtes CORS.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        resources = route_resources(scope["path"]) if scope["type"] == "http" and scope["method"] == "GET" else ()
+        if not resources:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        versions = await run_in_threadpool(load_versions, scope["app"])
+        etag = compute_etag(scope["path"], scope["query_string"].decode("latin-1"),
+                            headers.get("authorization", ""), versions, resources)
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            await Response(status_code=304, headers={ETAG_HEADER: etag, **CACHE_HEADERS})(scope, receive, send)
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                response_headers = MutableHeaders(scope=message)
+                response_headers[ETAG_HEADER] = etag
+                for name, value in CACHE_HEADERS.items():
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+
+# --------------------------------------------------
+# Versions : incrémentées dans la transaction qui modifie la ressource (annulées avec elle)
+# --------------------------------------------------
+def _resources_of(instances) -> set:
+    return {MODEL_RESOURCES[type(instance)] for instance in instances if type(instance) in MODEL_RESOURCES}
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed(session, flush_context):
+    bump_resource_versions(session.connection(), _resources_of((*session.new, *session.dirty, *session.deleted)))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_bulk(orm_execute_state):
+    # UPDATE / DELETE en masse (update(Model), Query.update) : hors unité de travail
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        resource = MODEL_RESOURCES.get(mapper.class_) if mapper is not None else None
+        if resource:
+            bump_resource_versions(orm_execute_state.session.connection(), [resource])
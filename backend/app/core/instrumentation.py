@@ -0,0 +1,211 @@
+import logging
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Dict, Optional, Tuple
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    """Mesures d'une requête HTTP : requêtes SQL, temps base, lignes lues"""
+
+    __slots__ = ("statements", "db_time", "rows", "texts")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.texts: Counter = Counter()
+
+
+# Mesures de la requête en cours (partagées avec le thread de la route synchrone)
+current_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_stats", default=None)
+
+
+class CountingCursor:
+    """Curseur DB-API qui compte les lignes lues (fetchone / fetchmany / fetchall)"""
+
+    def __init__(self, cursor, stats: RequestStats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._stats.rows += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._stats.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._stats.rows += len(rows)
+        return rows
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._stats.rows += 1
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats.get()
+    if stats is None:
+        return
+    conn.info.setdefault("query_started", []).append(perf_counter())
+    if context is not None:
+        # Le résultat lit via context.cursor : compter les lignes au passage
+        context.cursor = CountingCursor(cursor, stats)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started:
+        return
+    stats.db_time += perf_counter() - started.pop()
+    stats.statements += 1
+    stats.texts[statement] += 1
+
+
+def _handle_error(exception_context):
+    # Requête en échec : after_cursor_execute n'est pas appelé, retirer son horodatage
+    # (sinon il reste sur la connexion, réutilisée par le pool)
+    conn = exception_context.connection
+    started = conn.info.get("query_started") if conn is not None else None
+    if started:
+        started.pop()
+
+
+class Metrics:
+    """Compteurs agrégés par route, exposés au format texte Prometheus"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.requests: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        # (méthode, route) -> [durée totale, temps base, requêtes SQL, lignes, dépassements du budget]
+        self.totals: Dict[Tuple[str, str], list] = defaultdict(lambda: [0.0, 0.0, 0, 0, 0])
+
+    def record(self, method: str, route: str, status: int, wall: float, stats: RequestStats, over_budget: bool) -> None:
+        with self._lock:
+            self.requests[(method, route, status)] += 1
+            totals = self.totals[(method, route)]
+            totals[0] += wall
+            totals[1] += stats.db_time
+            totals[2] += stats.statements
+            totals[3] += stats.rows
+            totals[4] += int(over_budget)
+
+    def render(self) -> str:
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{label}"' for key, label in labels)
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        with self._lock:
+            requests = sorted(self.requests.items())
+            totals = sorted(self.totals.items())
+        route_labels = lambda method, route: (("method", method), ("route", route))
+
+        family("http_requests_total", "counter", "Requêtes HTTP traitées",
+               [((*route_labels(method, route), ("status", status)), count) for (method, route, status), count in requests])
+        for index, name, help_text in (
+            (0, "http_request_duration_seconds_total", "Durée cumulée des requêtes"),
+            (1, "db_duration_seconds_total", "Temps cumulé passé en base"),
+            (2, "db_statements_total", "Requêtes SQL exécutées"),
+            (3, "db_rows_total", "Lignes lues en base"),
+            (4, "sql_budget_exceeded_total", "Requêtes HTTP au-delà du budget de requêtes SQL (N+1 probable)"),
+        ):
+            family(name, "counter", help_text,
+                   [(route_labels(method, route), round(values[index], 6)) for (method, route), values in totals])
+
+        # Caches applicatifs (succès / échecs)
+        from app.api.deps import principal_cache
+        from app.crud.planning_cache import planning_cache
+        caches = (("principal", principal_cache.stats()), ("planning", planning_cache.stats()))
+        family("cache_hits_total", "counter", "Succès de cache", [((("cache", name),), stats["hits"]) for name, stats in caches])
+        family("cache_misses_total", "counter", "Échecs de cache", [((("cache", name),), stats["misses"]) for name, stats in caches])
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def server_timing(wall: float, stats: RequestStats) -> str:
+    return (
+        f'app;dur={wall * 1000:.1f}, '
+        f'db;dur={stats.db_time * 1000:.1f};desc="sql={stats.statements} rows={stats.rows}"'
+    )
+
+
+def install_instrumentation(app: FastAPI, statement_budget: Optional[int] = None) -> None:
+    """
+    Active l'instrumentation (opt-in, INSTRUMENTATION_ENABLED) : en-tête
+    Server-Timing sur chaque réponse, compteurs par route sur /metrics et
+    avertissement quand une requête dépasse le budget de requêtes SQL.
+    """
+    budget = statement_budget if statement_budget is not None else settings.sql_statement_budget
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+    def record(request: Request, status: int, wall: float, stats: RequestStats) -> None:
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "inconnue")
+        over_budget = stats.statements > budget
+        if over_budget:
+            statement, count = stats.texts.most_common(1)[0]
+            logger.warning(
+                "N+1 probable : %s %s a exécuté %d requêtes SQL (budget %d), la plus fréquente %d fois : %s",
+                request.method, route_path, stats.statements, budget, count, statement[:200]
+            )
+        metrics.record(request.method, route_path, status, wall, stats, over_budget)
+
+    @app.middleware("http")
+    async def instrument_request(request: Request, call_next):
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        started = perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            current_stats.reset(token)
+        # Server-Timing : mesures jusqu'à l'envoi des en-têtes (hors corps d'une StreamingResponse)
+        response.headers["Server-Timing"] = server_timing(perf_counter() - started, stats)
+
+        # Le corps (export en flux) est produit par la tâche de la route, qui partage `stats` :
+        # /metrics et le budget comptent ses requêtes, enregistrées une fois le corps envoyé
+        body = response.body_iterator
+
+        async def body_then_record():
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                record(request, response.status_code, perf_counter() - started, stats)
+
+        response.body_iterator = body_then_record()
+        return response
+
+    @app.get("/metrics", include_in_schema=False)
+    def read_metrics():
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
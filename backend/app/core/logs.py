@@ -0,0 +1,189 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+from uuid import uuid4
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Identifiant de la requête HTTP en cours (repris dans chaque enregistrement de log)
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributs standard d'un LogRecord : tout le reste (extra=...) est sérialisé tel quel
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Une ligne JSON par enregistrement : horodatage, niveau, logger, message, request_id, extra"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"
+
+LOG_FORMATTERS = {
+    "json": JsonFormatter,
+    "text": lambda: logging.Formatter(TEXT_FORMAT),
+}
+
+
+class RequestIdFilter(logging.Filter):
+    """Ajoute l'identifiant de la requête en cours (lu dans le thread appelant)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get() or "-"
+        return True
+
+
+class DebugSampler(logging.Filter):
+    """Ne garde qu'une fraction `rate` des enregistrements DEBUG (les autres niveaux passent tous)"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Handler du chemin de requête : pousse l'enregistrement dans une file bornée,
+    sans attendre ; la mise en forme et l'écriture se font dans le thread du
+    QueueListener. File pleine : l'enregistrement est compté puis abandonné.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Fige le message (les arguments peuvent changer ensuite), sans le mettre en forme
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """ "app.api.match=DEBUG,sqlalchemy.engine=WARNING" -> {logger: niveau} """
+    levels = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, _, level = item.partition("=")
+        value = logging.getLevelName(level.strip().upper())
+        if not name.strip() or not isinstance(value, int):
+            raise ValueError(f"Niveau de log invalide : {item.strip()}")
+        levels[name.strip()] = value
+    return levels
+
+
+_listener: Optional[QueueListener] = None
+queue_handler: Optional[NonBlockingQueueHandler] = None
+
+
+def setup_logging(level: str = None, levels: str = None, log_format: str = None,
+                  debug_sample_rate: float = None, queue_size: int = None, stream=None) -> NonBlockingQueueHandler:
+    """
+    Configure les logs de l'application (paramètres par défaut : Settings) :
+    handler racine non bloquant vers une file, écriture sur stdout par un
+    QueueListener, niveaux par module, request_id et échantillonnage DEBUG.
+    Idempotent : un nouvel appel remplace la configuration précédente.
+    """
+    global _listener, queue_handler
+    level = level or settings.log_level
+    levels = settings.log_levels if levels is None else levels
+    log_format = log_format or settings.log_format
+    debug_sample_rate = settings.log_debug_sample_rate if debug_sample_rate is None else debug_sample_rate
+    queue_size = queue_size or settings.log_queue_size
+    if log_format not in LOG_FORMATTERS:
+        raise ValueError(f"Format de log invalide : {log_format}")
+
+    shutdown_logging()
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(LOG_FORMATTERS[log_format]())
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+    queue_handler.addFilter(DebugSampler(debug_sample_rate))
+    queue_handler.addFilter(RequestIdFilter())
+    _listener = QueueListener(queue_handler.queue, output, respect_handler_level=False)
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in [handler for handler in root.handlers if isinstance(handler, NonBlockingQueueHandler)]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(logging.getLevelName(level.upper()))
+    for name, module_level in parse_levels(levels).items():
+        logging.getLogger(name).setLevel(module_level)
+    return queue_handler
+
+
+def shutdown_logging() -> None:
+    """Retire le handler de file du logger racine et arrête le QueueListener
+    après avoir écrit les enregistrements en attente"""
+    global _listener, queue_handler
+    if queue_handler is not None:
+        logging.getLogger().removeHandler(queue_handler)
+        queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+class RequestIdMiddleware:
+    """Middleware ASGI : reprend X-Request-ID (ou en tire un) pour corréler les logs, le renvoie dans la réponse"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        value = (Headers(scope=scope).get(REQUEST_ID_HEADER) or uuid4().hex)[:64]
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = value
+            await send(message)
+
+        token = request_id.set(value)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id.reset(token)
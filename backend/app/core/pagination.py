@@ -0,0 +1,51 @@
+import base64
+import json
+from typing import Optional
+from fastapi import HTTPException, Query, Response
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    """Curseur opaque : identifiant du dernier élément de la page"""
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))["id"]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Curseur de pagination invalide")
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="Curseur de pagination invalide")
+    return last_id
+
+
+class PageParams:
+    """Paramètres communs des listes paginées (`cursor`, `limit`)"""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description=f"Curseur renvoyé dans l'en-tête {NEXT_CURSOR_HEADER}"),
+        limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def paginate(query, column, page: PageParams, response: Response, descending: bool = False) -> list:
+    """Applique la pagination par clé (keyset) sur `column` (unique, indexée).
+
+    Pas d'OFFSET : la page suivante reprend après le dernier identifiant vu.
+    L'en-tête `X-Next-Cursor` n'est présent que s'il reste des éléments.
+    """
+    if page.cursor:
+        last_id = decode_cursor(page.cursor)
+        query = query.filter(column < last_id if descending else column > last_id)
+    rows = query.order_by(column.desc() if descending else column).limit(page.limit + 1).all()
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(rows[-1], column.key))
+    return rows
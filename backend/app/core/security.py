@@ -1,19 +1,83 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+import secrets
+import string
+from threading import BoundedSemaphore
+from typing import Iterable, List, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt coûte ~100-250 ms de CPU (et libère le GIL) : les vérifications de
+# /auth/login passent par un pool dédié de taille fixe. Le nombre de
+# vérifications en cours ou en attente est borné ; au-delà on refuse
+# immédiatement (PasswordHasherBusy) au lieu d'accaparer les threads du serveur.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="bcrypt"
+)
+_hash_slots = BoundedSemaphore(settings.password_hash_workers + settings.password_hash_queue_size)
+
+
+class PasswordHasherBusy(Exception):
+    """Le pool de vérification des mots de passe est saturé"""
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Vérifie si le mot de passe correspond au hash"""
     return pwd_context.verify(plain_password, hashed_password)
 
+def submit_password_check(plain_password: str, hashed_password: str) -> Future:
+    """Soumet la vérification au pool dédié et retourne son Future (à attendre
+    avec asyncio.wrap_future depuis une route async).
+
+    Lève PasswordHasherBusy si trop de vérifications sont déjà en cours.
+    """
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    slots = _hash_slots
+    try:
+        future = _hash_executor.submit(verify_password, plain_password, hashed_password)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+def verify_password_bounded(plain_password: str, hashed_password: str) -> bool:
+    """Vérifie le mot de passe sur le pool dédié (bloque le thread appelant).
+
+    Lève PasswordHasherBusy si trop de vérifications sont déjà en cours.
+    """
+    return submit_password_check(plain_password, hashed_password).result()
+
 def get_password_hash(password: str) -> str:
     """Hash un mot de passe"""
     return pwd_context.hash(password)
 
+def hash_passwords(passwords: Iterable[str]) -> List[str]:
+    """Hash une série de mots de passe en parallèle (imports).
+
+    Pool temporaire distinct de celui de /auth/login : un import volumineux
+    ne retarde pas les connexions.
+    """
+    with ThreadPoolExecutor(max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt-import") as pool:
+        return list(pool.map(get_password_hash, passwords))
+
+def generate_password(length: int = 12) -> str:
+    # Génère un mot de passe sécurisé
+    characters = string.ascii_letters + string.digits + "!@#$%^&*"
+    password = ''.join(secrets.choice(characters) for _ in range(length))
+    
+    if (any(c.isupper() for c in password) and 
+        any(c.islower() for c in password) and 
+        any(c.isdigit() for c in password) and 
+        any(c in "!@#$%^&*" for c in password)):
+        return password
+    else:
+        return generate_password(length)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Crée un token JWT"""
     to_encode = data.copy()
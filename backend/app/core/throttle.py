@@ -0,0 +1,172 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Optional, Tuple
+from sqlalchemy.orm import Session
+from app.models.models import LoginAttempt
+
+
+class LoginThrottle(ABC):
+    """Compteur d'échecs de connexion par email (fenêtre glissante + blocage).
+
+    - `max_attempts` échecs dans la fenêtre de `window_minutes` bloquent le
+      compte pendant `lockout_minutes`
+    - un succès réinitialise le compteur
+    """
+
+    def __init__(self, max_attempts: int, lockout_minutes: int, window_minutes: Optional[int] = None):
+        self.max_attempts = max_attempts
+        self.lockout = timedelta(minutes=lockout_minutes)
+        self.window = timedelta(minutes=window_minutes or lockout_minutes)
+
+    @abstractmethod
+    def locked_until(self, db: Session, email: str) -> Optional[datetime]:
+        """Retourne la fin du blocage si l'email est actuellement bloqué"""
+
+    @abstractmethod
+    def record_failure(self, db: Session, email: str) -> Tuple[int, Optional[datetime]]:
+        """Enregistre un échec ; retourne (nombre d'échecs, fin du blocage éventuel)"""
+
+    @abstractmethod
+    def reset(self, db: Session, email: str) -> None:
+        """Réinitialise le compteur après une connexion réussie"""
+
+    @abstractmethod
+    def clear(self, db: Session) -> None:
+        """Efface tous les compteurs et blocages (tests, administration)"""
+
+
+class MemoryLoginThrottle(LoginThrottle):
+    """Compteurs en mémoire, répartis sur plusieurs verrous (shards).
+
+    Aucune requête SQL : le chemin nominal (connexion réussie sans échec
+    préalable) ne fait aucune écriture. L'état est propre au process et perdu
+    au redémarrage : avec N workers, un attaquant dispose d'environ
+    N x `max_attempts` essais par fenêtre. Réservé à un serveur à un seul
+    worker (choisi par "auto" dans ce cas).
+    """
+
+    SHARDS = 16
+    PRUNE_THRESHOLD = 1024
+
+    def __init__(self, max_attempts: int, lockout_minutes: int, window_minutes: Optional[int] = None):
+        super().__init__(max_attempts, lockout_minutes, window_minutes)
+        # email -> [deque des dates d'échec, fin du blocage]
+        self._shards = [({}, Lock()) for _ in range(self.SHARDS)]
+
+    def _shard(self, email: str):
+        return self._shards[hash(email) % self.SHARDS]
+
+    def _prune(self, entries: dict, now: datetime) -> None:
+        """Supprime les entrées sans échec récent ni blocage en cours"""
+        for key in [
+            key for key, (failures, locked_until) in entries.items()
+            if (not failures or failures[-1] <= now - self.window) and (not locked_until or locked_until <= now)
+        ]:
+            del entries[key]
+
+    def locked_until(self, db: Session, email: str) -> Optional[datetime]:
+        entries, lock = self._shard(email)
+        with lock:
+            entry = entries.get(email)
+            if entry and entry[1] and entry[1] > datetime.utcnow():
+                return entry[1]
+        return None
+
+    def record_failure(self, db: Session, email: str) -> Tuple[int, Optional[datetime]]:
+        now = datetime.utcnow()
+        entries, lock = self._shard(email)
+        with lock:
+            entry = entries.get(email)
+            if entry is None:
+                if len(entries) >= self.PRUNE_THRESHOLD:
+                    self._prune(entries, now)
+                entry = entries[email] = [deque(), None]
+
+            failures = entry[0]
+            while failures and failures[0] <= now - self.window:
+                failures.popleft()
+            failures.append(now)
+
+            if len(failures) >= self.max_attempts:
+                entry[1] = now + self.lockout
+                failures.clear()
+                return self.max_attempts, entry[1]
+            return len(failures), None
+
+    def reset(self, db: Session, email: str) -> None:
+        entries, lock = self._shard(email)
+        with lock:
+            entries.pop(email, None)
+
+    def clear(self, db: Session) -> None:
+        for entries, lock in self._shards:
+            with lock:
+                entries.clear()
+
+
+class DatabaseLoginThrottle(LoginThrottle):
+    """Compteurs persistés dans la table `login_attempts`.
+
+    Partagés entre workers et conservés au redémarrage. Le succès n'écrit que
+    s'il existe des échecs à effacer.
+    """
+
+    def _get(self, db: Session, email: str) -> Optional[LoginAttempt]:
+        return db.query(LoginAttempt).filter(LoginAttempt.email == email).first()
+
+    def locked_until(self, db: Session, email: str) -> Optional[datetime]:
+        attempt = self._get(db, email)
+        if attempt and attempt.locked_until and attempt.locked_until > datetime.utcnow():
+            return attempt.locked_until
+        return None
+
+    def record_failure(self, db: Session, email: str) -> Tuple[int, Optional[datetime]]:
+        now = datetime.utcnow()
+        attempt = self._get(db, email)
+        if not attempt:
+            attempt = LoginAttempt(email=email, attempts_count=0)
+            db.add(attempt)
+
+        # Sans échec depuis plus d'une fenêtre, le compteur repart de zéro
+        if attempt.last_attempt and attempt.last_attempt <= now - self.window:
+            attempt.attempts_count = 0
+        attempt.attempts_count = (attempt.attempts_count or 0) + 1
+        attempt.last_attempt = now
+
+        locked_until = None
+        if attempt.attempts_count >= self.max_attempts:
+            locked_until = attempt.locked_until = now + self.lockout
+            attempt.attempts_count = 0
+        count = self.max_attempts if locked_until else attempt.attempts_count
+        db.commit()
+        return count, locked_until
+
+    def reset(self, db: Session, email: str) -> None:
+        attempt = self._get(db, email)
+        if attempt and (attempt.attempts_count or attempt.locked_until):
+            attempt.attempts_count = 0
+            attempt.locked_until = None
+            db.commit()
+
+    def clear(self, db: Session) -> None:
+        db.query(LoginAttempt).delete(synchronize_session=False)
+        db.commit()
+
+
+THROTTLE_BACKENDS = {
+    "memory": MemoryLoginThrottle,
+    "database": DatabaseLoginThrottle,
+}
+
+
+def build_login_throttle(backend: str, max_attempts: int, lockout_minutes: int, workers: int = 1) -> LoginThrottle:
+    """Instancie le backend configuré (`memory`, `database`, ou `auto` : `database` si plusieurs workers)"""
+    if backend == "auto":
+        backend = "database" if workers > 1 else "memory"
+    try:
+        throttle_class = THROTTLE_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Backend de limitation inconnu : {backend}")
+    return throttle_class(max_attempts, lockout_minutes)
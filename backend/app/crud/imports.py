@@ -0,0 +1,205 @@
+# ============================================
+# FICHIER : backend/app/crud/imports.py
+# ============================================
+
+import csv
+import io
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import generate_password, hash_passwords
+from app.models.models import Player, Team, User
+from app.schemas.imports import ImportReport, ImportRow, ImportRowResult
+
+IMPORT_COLUMNS = ("email", "first_name", "last_name", "company", "license_number", "birth_date", "is_admin", "team")
+# Taille des listes IN (...) des vérifications d'existence
+LOOKUP_CHUNK = 500
+
+
+def read_csv(content: str) -> List[Tuple[int, dict]]:
+    """Lignes du CSV (séparateur , ou ;) : [(numéro de ligne, {colonne: valeur})]"""
+    dialect = csv.excel
+    try:
+        dialect = csv.Sniffer().sniff(content.split("\n", 1)[0], delimiters=",;")
+    except csv.Error:
+        pass
+    reader = csv.DictReader(io.StringIO(content), dialect=dialect)
+    missing = {"email", "first_name", "last_name", "company", "license_number"} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Colonnes manquantes : {', '.join(sorted(missing))}")
+    return [
+        (reader.line_num, {key.strip(): (value or "").strip() for key, value in raw.items() if key})
+        for raw in reader
+        if any((value or "").strip() for value in raw.values() if isinstance(value, str))
+    ]
+
+
+def existing_values(db: Session, column, values: Iterable[str]) -> Set[str]:
+    """Valeurs déjà présentes en base (une requête par paquet de LOOKUP_CHUNK)"""
+    values = sorted(set(values))
+    found = set()
+    for start in range(0, len(values), LOOKUP_CHUNK):
+        found.update(db.execute(select(column).where(column.in_(values[start:start + LOOKUP_CHUNK]))).scalars())
+    return found
+
+
+def validate_rows(db: Session, rows: List[Tuple[int, dict]]):
+    """
+    Valide toutes les lignes ; retourne (lignes valides, erreurs par ligne,
+    unités d'insertion, email saisi par ligne).
+    Une unité est une équipe (deux lignes) ou une ligne seule : elle est insérée entière ou pas du tout.
+    """
+    parsed: Dict[int, ImportRow] = {}
+    errors: Dict[int, List[str]] = defaultdict(list)
+    emails: Dict[int, str] = {}
+
+    for line, values in rows:
+        emails[line] = values.get("email", "").lower()
+        data = {key: value for key, value in values.items() if key in IMPORT_COLUMNS and value != ""}
+        try:
+            parsed[line] = ImportRow(**data)
+        except ValidationError as e:
+            errors[line].extend(
+                f"{'.'.join(str(part) for part in error['loc'])} : {error['msg']}" for error in e.errors()
+            )
+
+    # Doublons dans le fichier puis en base (requêtes groupées)
+    email_counts = Counter(row.email for row in parsed.values())
+    license_counts = Counter(row.license_number for row in parsed.values())
+    known_emails = existing_values(db, User.email, email_counts)
+    known_licenses = existing_values(db, Player.license_number, license_counts)
+    for line, row in parsed.items():
+        if email_counts[row.email] > 1:
+            errors[line].append("Email en double dans le fichier")
+        if row.email in known_emails:
+            errors[line].append("Email déjà utilisé")
+        if license_counts[row.license_number] > 1:
+            errors[line].append("Licence en double dans le fichier")
+        if row.license_number in known_licenses:
+            errors[line].append("Cette licence est déjà associée à un joueur")
+
+    # Équipes : exactement deux joueurs de la même entreprise, tous deux valides
+    # (regroupement sur la valeur brute : une ligne invalide compte dans son équipe)
+    teams: Dict[str, List[int]] = defaultdict(list)
+    for line, values in rows:
+        if values.get("team"):
+            teams[values["team"]].append(line)
+    units = [[line] for line, row in parsed.items() if not row.team]
+    for label, lines in teams.items():
+        if len(lines) != 2:
+            for line in lines:
+                errors[line].append(f"L'équipe {label} doit compter exactement 2 joueurs")
+            continue
+        first, second = lines
+        if first in parsed and second in parsed and parsed[first].company != parsed[second].company:
+            for line in lines:
+                errors[line].append(f"Les joueurs de l'équipe {label} doivent appartenir à la même entreprise")
+        for line, partner in ((first, second), (second, first)):
+            if errors.get(partner) and not errors.get(line):
+                errors[line].append(f"Coéquipier invalide (ligne {partner})")
+        units.append(lines)
+
+    valid = {line: row for line, row in parsed.items() if not errors.get(line)}
+    units = sorted((unit for unit in units if all(line in valid for line in unit)), key=lambda unit: unit[0])
+    return valid, errors, units, emails
+
+
+def batches(units: List[List[int]], batch_size: int) -> Iterable[List[List[int]]]:
+    """Regroupe les unités en lots d'au moins `batch_size` lignes (une équipe n'est jamais coupée)"""
+    batch, size = [], 0
+    for unit in units:
+        batch.append(unit)
+        size += len(unit)
+        if size >= batch_size:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def insert_batch(db: Session, valid: Dict[int, ImportRow], units: List[List[int]], passwords: Dict[int, Tuple[str, str]],
+                 results: Dict[int, ImportRowResult]) -> None:
+    """Insère un lot d'unités dans une transaction (comptes, joueurs, puis équipes)"""
+    lines = [line for unit in units for line in unit]
+    users = {
+        line: User(email=valid[line].email, password_hash=passwords[line][1], is_admin=valid[line].is_admin,
+                   is_active=True, must_change_password=True)
+        for line in lines
+    }
+    db.add_all(users.values())
+    db.flush()
+    players = {
+        line: Player(
+            first_name=valid[line].first_name, last_name=valid[line].last_name, company=valid[line].company,
+            license_number=valid[line].license_number, birth_date=valid[line].birth_date,
+            photo_url=valid[line].photo_url, user_id=users[line].id
+        )
+        for line in lines
+    }
+    db.add_all(players.values())
+    db.flush()
+    teams = {
+        tuple(unit): Team(company=valid[unit[0]].company, player1_id=players[unit[0]].id, player2_id=players[unit[1]].id)
+        for unit in units if len(unit) == 2
+    }
+    db.add_all(teams.values())
+    db.flush()
+
+    # Identifiants relevés avant le commit (qui expire les objets)
+    team_ids = {line: team.id for unit, team in teams.items() for line in unit}
+    created = {
+        line: ImportRowResult(
+            line=line, email=valid[line].email, status="created",
+            user_id=users[line].id, player_id=players[line].id, team_id=team_ids.get(line),
+            temporary_password=passwords[line][0]
+        )
+        for line in lines
+    }
+    db.commit()
+    results.update(created)
+
+
+def import_rows(db: Session, rows: List[Tuple[int, dict]], dry_run: bool = False,
+                batch_size: int = None) -> ImportReport:
+    """
+    Importe comptes, joueurs et équipes : validation complète d'abord, puis
+    hachage des mots de passe en parallèle et insertion par lots de
+    `batch_size` lignes (une transaction par lot). Rapport ligne par ligne.
+    """
+    batch_size = batch_size or settings.import_batch_size
+    valid, errors, units, emails = validate_rows(db, rows)
+
+    results: Dict[int, ImportRowResult] = {
+        line: ImportRowResult(line=line, email=emails[line] or None, status="error", errors=messages)
+        for line, messages in errors.items() if messages
+    }
+    if dry_run:
+        for line, row in valid.items():
+            results[line] = ImportRowResult(line=line, email=row.email, status="valid")
+    elif units:
+        lines = [line for unit in units for line in unit]
+        temporary = [generate_password() for _ in lines]
+        passwords = dict(zip(lines, zip(temporary, hash_passwords(temporary))))
+
+        for batch in batches(units, batch_size):
+            try:
+                insert_batch(db, valid, batch, passwords, results)
+            except Exception as e:
+                db.rollback()
+                for line in (line for unit in batch for line in unit):
+                    results[line] = ImportRowResult(
+                        line=line, email=valid[line].email, status="error",
+                        errors=[f"Erreur d'insertion du lot : {e.__class__.__name__}"]
+                    )
+
+    ordered = [results[line] for line in sorted(results)]
+    return ImportReport(
+        dry_run=dry_run,
+        created=sum(1 for result in ordered if result.status == "created"),
+        failed=sum(1 for result in ordered if result.status == "error"),
+        rows=ordered,
+    )
@@ -2,20 +2,36 @@
 # FICHIER : backend/app/crud/match.py
 # ============================================
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, tuple_, Select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, joinedload
 from fastapi import HTTPException, status
 from datetime import date, timedelta, datetime
 
 from app.models.models import Match, Team, Player, Pool, User
+from app.crud.occupancy import court_occupancy
 from app.schemas.match import MatchCreate, MatchUpdate, MatchDetailResponse
 from app.schemas.team import TeamInfo
 from app.schemas.player import PlayerInfo
 
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 SET_RE = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
 
+
+# Graphe match -> équipes -> joueurs chargé par jointures (relations many-to-one,
+# donc pas de duplication de lignes) : une seule requête, quel que soit le
+# nombre de matchs, au lieu de 6 lazy loads par match.
+MATCH_DETAIL_LOADERS = (
+    joinedload(Match.team1).joinedload(Team.player1),
+    joinedload(Match.team1).joinedload(Team.player2),
+    joinedload(Match.team2).joinedload(Team.player1),
+    joinedload(Match.team2).joinedload(Team.player2),
+)
+
+
 def parse_sets(score_str: str) -> List[Tuple[int, int]]:
     """
     "7-5, 6-4" -> [(7,5),(6,4)]
@@ -124,96 +140,156 @@ def check_court_availability(
     """
     Vérifie si un terrain est disponible à une date et heure données.
     Retourne True si disponible, False sinon.
+    Lu dans l'index d'occupation, sans requête pour une date déjà chargée (les
+    matchs annulés n'occupent pas de piste). Un créneau réservé entre-temps par
+    un autre process est refusé en base au commit (index unique ux_matches_court_slot).
     """
-    query = db.query(Match).filter(
-        Match.match_date == match_date,
-        Match.match_time == match_time,
-        Match.court_number == court_number,
-        Match.status != "ANNULE"  # On ne compte pas les matchs annulés
+    if exclude_match_id:
+        # Le créneau actuel du match modifié ne le bloque pas lui-même
+        current = db.get(Match, exclude_match_id)
+        if current is not None and current.status != "ANNULE" and \
+                (current.match_date, current.match_time, current.court_number) == (match_date, match_time, court_number):
+            return True
+
+    return court_occupancy.is_free(db, match_date, match_time, court_number)
+
+
+def taken_slots(db: Session, slots, exclude_match_id: int = None) -> set:
+    """Créneaux (date, heure, piste) parmi `slots` pris par un match non annulé, lus en base (index ix_matches_slot)"""
+    slots = set(slots)
+    if not slots:
+        return set()
+    statement = select(Match.match_date, Match.match_time, Match.court_number).where(
+        tuple_(Match.match_date, Match.match_time, Match.court_number).in_(slots),
+        Match.status != "ANNULE"
     )
-    
     if exclude_match_id:
-        query = query.filter(Match.id != exclude_match_id)
-    
-    existing_match = query.first()
-    return existing_match is None
+        statement = statement.where(Match.id != exclude_match_id)
+    return {tuple(row) for row in db.execute(statement).all()}
 
 
-def get_upcoming_matches(
-    db: Session,
+def flush_booking(db: Session, slots, exclude_match_id: int = None) -> set:
+    """
+    Écrit les matchs qui réservent `slots`. Si l'index unique refuse l'écriture
+    (créneau pris par un autre worker ou un script depuis le chargement de l'index),
+    la transaction est annulée et les créneaux pris en base sont retournés ; vide sinon.
+    """
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        taken = taken_slots(db, slots, exclude_match_id)
+        if not taken:
+            raise
+        return taken
+    return set()
+
+
+def upcoming_matches_statement(
     days: int = 30,
-    user: User = None,
-    show_all: bool = False,
+    team_ids: List[int] = None,
     company_filter: str = None,
     pool_filter: int = None,
     status_filter: str = None
-):
+) -> Select:
     """
-    Récupère les matchs à venir dans les X prochains jours.
-    Filtre selon le rôle de l'utilisateur et les paramètres demandés.
+    Construit la requête des matchs à venir dans les X prochains jours
+    (partagée par les chemins synchrone et asynchrone).
+    `team_ids` restreint aux matchs de ces équipes (vue joueur).
     """
     today = datetime.now().date()
     end_date = today + timedelta(days=days)
     
-    # Requête de base simple (sans joinedload d'abord)
-    query = db.query(Match).filter(
+    # Requête de base : le graphe équipes/joueurs est chargé dans la même requête
+    query = select(Match).options(*MATCH_DETAIL_LOADERS).where(
         Match.match_date >= today,
         Match.match_date <= end_date
     )
     
     # Filtre par statut
     if status_filter:
-        query = query.filter(Match.status == status_filter)
+        query = query.where(Match.status == status_filter)
     
-    # Si l'utilisateur est un joueur et ne veut pas voir tous les matchs
-    if user and not user.is_admin and not show_all:
-        # Récupérer le joueur associé à cet utilisateur
-        player = db.query(Player).filter(Player.user_id == user.id).first()
-        if player:
-            # Récupérer les équipes du joueur
-            player_teams = db.query(Team).filter(
-                (Team.player1_id == player.id) | (Team.player2_id == player.id)
-            ).all()
-            team_ids = [team.id for team in player_teams]
-            
-            # Filtrer les matchs où le joueur participe
-            if team_ids:
-                query = query.filter(
-                    (Match.team1_id.in_(team_ids)) | (Match.team2_id.in_(team_ids))
-                )
-            else:
-                # Si le joueur n'a pas d'équipes, retourner une liste vide
-                return []
+    # Filtrer les matchs où le joueur participe
+    if team_ids is not None:
+        query = query.where(
+            (Match.team1_id.in_(team_ids)) | (Match.team2_id.in_(team_ids))
+        )
     
-    # Filtres admin - utiliser une jointure mais pas avec joinedload
+    # Filtres admin - sous-requêtes sur les équipes
     if company_filter:
-        company_team_ids = db.query(Team.id).filter(Team.company == company_filter).subquery()
-        query = query.filter(
+        company_team_ids = select(Team.id).where(Team.company == company_filter)
+        query = query.where(
             (Match.team1_id.in_(company_team_ids)) |
             (Match.team2_id.in_(company_team_ids))
         )
     
     if pool_filter:
-        pool_team_ids = db.query(Team.id).filter(Team.pool_id == pool_filter).subquery()
-        query = query.filter(
+        pool_team_ids = select(Team.id).where(Team.pool_id == pool_filter)
+        query = query.where(
             (Match.team1_id.in_(pool_team_ids)) |
             (Match.team2_id.in_(pool_team_ids))
         )
     
     # Trier par date et heure
-    matches = query.order_by(Match.match_date, Match.match_time).all()
+    return query.order_by(Match.match_date, Match.match_time)
+
+
+def player_teams_statement(player_id: int) -> Select:
+    """Identifiants des équipes d'un joueur"""
+    return select(Team.id).where((Team.player1_id == player_id) | (Team.player2_id == player_id))
+
+
+def get_upcoming_matches(
+    db: Session,
+    days: int = 30,
+    user: User = None,
+    show_all: bool = False,
+    company_filter: str = None,
+    pool_filter: int = None,
+    status_filter: str = None
+):
+    """
+    Récupère les matchs à venir dans les X prochains jours.
+    Filtre selon le rôle de l'utilisateur et les paramètres demandés.
+    """
+    team_ids = None
     
-    # Force le chargement des relations
-    for match in matches:
-        # Accéder aux attributs force le lazy loading
-        _ = match.team1
-        _ = match.team1.player1
-        _ = match.team1.player2
-        _ = match.team2
-        _ = match.team2.player1
-        _ = match.team2.player2
+    # Si l'utilisateur est un joueur et ne veut pas voir tous les matchs
+    if user and not user.is_admin and not show_all:
+        # Récupérer le joueur associé à cet utilisateur, puis ses équipes
+        player_id = db.execute(select(Player.id).where(Player.user_id == user.id)).scalar()
+        if player_id:
+            team_ids = db.execute(player_teams_statement(player_id)).scalars().all()
+            if not team_ids:
+                # Si le joueur n'a pas d'équipes, retourner une liste vide
+                return []
     
-    return matches
+    statement = upcoming_matches_statement(days, team_ids, company_filter, pool_filter, status_filter)
+    return db.execute(statement).scalars().all()
+
+
+async def get_upcoming_matches_async(
+    db: AsyncSession,
+    days: int = 30,
+    user: User = None,
+    show_all: bool = False,
+    company_filter: str = None,
+    pool_filter: int = None,
+    status_filter: str = None
+):
+    """Version asynchrone de get_upcoming_matches"""
+    team_ids = None
+    
+    if user and not user.is_admin and not show_all:
+        player_id = (await db.execute(select(Player.id).where(Player.user_id == user.id))).scalar()
+        if player_id:
+            team_ids = (await db.execute(player_teams_statement(player_id))).scalars().all()
+            if not team_ids:
+                return []
+    
+    statement = upcoming_matches_statement(days, team_ids, company_filter, pool_filter, status_filter)
+    return (await db.execute(statement)).scalars().all()
 
 
 def create_match(db: Session, match_data: MatchCreate) -> Match:
@@ -252,24 +328,173 @@ def create_match(db: Session, match_data: MatchCreate) -> Match:
         score_team2=match_data.score_team2,
     )
     db.add(new_match)
+    if flush_booking(db, [(match_data.match_date, match_data.match_time, match_data.court_number)]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ce terrain est déjà réservé à cette date et heure"
+        )
     db.commit()
     db.refresh(new_match)
     return new_match
 
 
+def find_bulk_conflicts(matches: List[MatchCreate], occupied: set) -> List[dict]:
+    """
+    Conflits de piste d'un lot : avec les matchs existants (`occupied`)
+    et entre matchs du lot. Retourne tous les conflits, pas seulement le premier.
+    """
+    conflicts = []
+    batch_slots = {}
+    for index, match_data in enumerate(matches):
+        if match_data.status == "ANNULE":
+            continue
+        slot = (match_data.match_date, match_data.match_time, match_data.court_number)
+        conflict = {
+            "index": index,
+            "match_date": match_data.match_date.isoformat(),
+            "match_time": match_data.match_time.strftime("%H:%M"),
+            "court_number": match_data.court_number,
+        }
+        if slot in occupied:
+            conflicts.append({**conflict, "reason": "Terrain déjà réservé"})
+        elif slot in batch_slots:
+            conflicts.append({**conflict, "reason": "Même créneau qu'un autre match du lot", "conflicts_with": batch_slots[slot]})
+        else:
+            batch_slots[slot] = index
+    return conflicts
+
+
+def bulk_conflict_error(conflicts: List[dict]) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "message": f"{len(conflicts)} conflit(s) de terrain, aucun match créé",
+            "conflicts": conflicts
+        }
+    )
+
+
+def create_matches_bulk(db: Session, matches: List[MatchCreate]) -> List[Match]:
+    """
+    Crée un lot de matchs en une transaction : conflits lus dans l'index
+    d'occupation (dates manquantes chargées en une requête), puis insertion
+    groupée. Aucun match n'est créé si un conflit est détecté, y compris au
+    commit (créneau réservé entre-temps par un autre process).
+    """
+    occupied = court_occupancy.occupied(db, (match_data.match_date for match_data in matches))
+    conflicts = find_bulk_conflicts(matches, occupied)
+    if conflicts:
+        raise bulk_conflict_error(conflicts)
+
+    new_matches = [
+        Match(
+            team1_id=match_data.team1_id,
+            team2_id=match_data.team2_id,
+            event_id=match_data.event_id,
+            match_date=match_data.match_date,
+            match_time=match_data.match_time,
+            court_number=match_data.court_number,
+            status=match_data.status,
+            score_team1=match_data.score_team1,
+            score_team2=match_data.score_team2,
+        )
+        for match_data in matches
+    ]
+    db.add_all(new_matches)
+    taken = flush_booking(db, (
+        (match_data.match_date, match_data.match_time, match_data.court_number)
+        for match_data in matches if match_data.status != "ANNULE"
+    ))
+    if taken:
+        raise bulk_conflict_error(find_bulk_conflicts(matches, taken))
+    match_ids = [match.id for match in new_matches]
+    db.commit()
+
+    # Recharger le lot avec équipes et joueurs en une requête
+    return db.execute(
+        select(Match).options(*MATCH_DETAIL_LOADERS).where(Match.id.in_(match_ids)).order_by(Match.id)
+    ).scalars().all()
+
+
 def get_all_matches(db: Session):
     """Récupère tous les matchs."""
     return db.query(Match).all()
 
 
+# Colonnes de l'export (une ligne plate par match, joueurs en "Prénom Nom")
+EXPORT_COLUMNS = (
+    "match_id", "match_date", "match_time", "court_number", "status", "event_id",
+    "team1_id", "team1_company", "team1_player1", "team1_player2",
+    "team2_id", "team2_company", "team2_player1", "team2_player2",
+    "score_team1", "score_team2",
+)
+EXPORT_BATCH_SIZE = 1000
+
+
+def export_matches_statement(start_date: Optional[date] = None, end_date: Optional[date] = None) -> Select:
+    """Tous les matchs avec équipes, joueurs et scores, dans l'ordre de l'index ix_matches_slot"""
+    team1, team2 = aliased(Team), aliased(Team)
+    t1p1, t1p2, t2p1, t2p2 = (aliased(Player) for _ in range(4))
+
+    def full_name(player):
+        return player.first_name + " " + player.last_name
+
+    statement = (
+        select(
+            Match.id.label("match_id"), Match.match_date, Match.match_time, Match.court_number,
+            Match.status, Match.event_id,
+            team1.id.label("team1_id"), team1.company.label("team1_company"),
+            full_name(t1p1).label("team1_player1"), full_name(t1p2).label("team1_player2"),
+            team2.id.label("team2_id"), team2.company.label("team2_company"),
+            full_name(t2p1).label("team2_player1"), full_name(t2p2).label("team2_player2"),
+            Match.score_team1, Match.score_team2,
+        )
+        .join(team1, team1.id == Match.team1_id)
+        .join(team2, team2.id == Match.team2_id)
+        .outerjoin(t1p1, t1p1.id == team1.player1_id)
+        .outerjoin(t1p2, t1p2.id == team1.player2_id)
+        .outerjoin(t2p1, t2p1.id == team2.player1_id)
+        .outerjoin(t2p2, t2p2.id == team2.player2_id)
+        .order_by(Match.match_date, Match.match_time, Match.court_number, Match.id)
+    )
+    if start_date is not None:
+        statement = statement.where(Match.match_date >= start_date)
+    if end_date is not None:
+        statement = statement.where(Match.match_date <= end_date)
+    return statement
+
+
+def iter_export_rows(db: Session, statement: Select, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[tuple]:
+    """
+    Parcourt le résultat par lots via un curseur côté serveur (yield_per) :
+    mémoire constante quel que soit le nombre de matchs.
+    """
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    try:
+        for partition in result.partitions():
+            yield from partition
+    finally:
+        result.close()
+
+
 def get_match_by_id(db: Session, match_id: int) -> Match:
     """Récupère un match par son ID."""
-    match = db.query(Match).options(
-        joinedload(Match.team1).joinedload(Team.player1),
-        joinedload(Match.team1).joinedload(Team.player2),
-        joinedload(Match.team2).joinedload(Team.player1),
-        joinedload(Match.team2).joinedload(Team.player2)
-    ).filter(Match.id == match_id).first()
+    match = db.query(Match).options(*MATCH_DETAIL_LOADERS).filter(Match.id == match_id).first()
+
+    if not match:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Match non trouvé"
+        )
+
+    return match
+
+
+async def get_match_by_id_async(db: AsyncSession, match_id: int) -> Match:
+    """Version asynchrone de get_match_by_id."""
+    match = (await db.execute(
+        select(Match).options(*MATCH_DETAIL_LOADERS).where(Match.id == match_id)
+    )).scalar()
 
     if not match:
         raise HTTPException(
@@ -360,6 +585,11 @@ def update_match(db: Session, match_id: int, match_data: MatchUpdate) -> Match:
     for key, value in update_data.items():
         setattr(match, key, value)
 
+    if flush_booking(db, [(match.match_date, match.match_time, match.court_number)], exclude_match_id=match_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ce terrain est déjà réservé à cette date et heure"
+        )
     db.commit()
     db.refresh(match)
 
@@ -0,0 +1,71 @@
+# ============================================
+# FICHIER : backend/app/crud/match_sets.py
+# ============================================
+
+from typing import List, Tuple
+from sqlalchemy import delete, event, exists, inspect, insert, select
+from sqlalchemy.engine import Connection
+
+from app.models.models import Match, MatchSet
+from app.crud.match import parse_sets
+
+
+def finished_sets(match_status, score_team1) -> List[Tuple[int, int]]:
+    """Sets (jeux équipe 1, jeux équipe 2) d'un match terminé, [] sinon ou si le score est illisible"""
+    if match_status != "TERMINE" or not score_team1:
+        return []
+    try:
+        return parse_sets(score_team1)
+    except ValueError:
+        return []
+
+
+def sync_match_sets(connection: Connection, match_id: int, sets: List[Tuple[int, int]]) -> None:
+    """Remplace les sets enregistrés d'un match"""
+    connection.execute(delete(MatchSet).where(MatchSet.match_id == match_id))
+    if sets:
+        connection.execute(insert(MatchSet), [
+            {"match_id": match_id, "set_no": set_no, "games_team1": games1, "games_team2": games2}
+            for set_no, (games1, games2) in enumerate(sets, start=1)
+        ])
+
+
+def backfill_match_sets(connection: Connection) -> int:
+    """
+    Décompose les scores des matchs terminés qui n'ont pas encore de sets
+    (matchs saisis avant la table, ou hors ORM). Retourne le nombre de matchs traités.
+    """
+    rows = connection.execute(
+        select(Match.id, Match.status, Match.score_team1).where(
+            Match.status == "TERMINE",
+            ~exists().where(MatchSet.match_id == Match.id)
+        )
+    ).all()
+    values = [
+        {"match_id": match_id, "set_no": set_no, "games_team1": games1, "games_team2": games2}
+        for match_id, match_status, score_team1 in rows
+        for set_no, (games1, games2) in enumerate(finished_sets(match_status, score_team1), start=1)
+    ]
+    if values:
+        connection.execute(insert(MatchSet), values)
+    return len(rows)
+
+
+# Synchronisation à chaque flush d'un match (même transaction)
+@event.listens_for(Match, "after_insert")
+def _match_inserted(mapper, connection, target):
+    sets = finished_sets(target.status, target.score_team1)
+    if sets:
+        sync_match_sets(connection, target.id, sets)
+
+
+@event.listens_for(Match, "after_update")
+def _match_updated(mapper, connection, target):
+    state = inspect(target)
+    if state.attrs.status.history.has_changes() or state.attrs.score_team1.history.has_changes():
+        sync_match_sets(connection, target.id, finished_sets(target.status, target.score_team1))
+
+
+@event.listens_for(Match, "before_delete")
+def _match_deleted(mapper, connection, target):
+    connection.execute(delete(MatchSet).where(MatchSet.match_id == target.id))
@@ -0,0 +1,179 @@
+# ============================================
+# FICHIER : backend/app/crud/occupancy.py
+# ============================================
+
+from datetime import date, time, timedelta
+from threading import Lock
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import event, inspect, literal, select, union_all
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.models.models import Event, Match
+
+COURT_COUNT = 10  # pistes 1 à 10 (cf. schemas.match)
+ALL_COURTS = (1 << COURT_COUNT) - 1
+
+# (date, heure, piste) d'un match qui occupe une piste, None s'il est annulé
+Slot = Optional[Tuple[date, time, int]]
+
+
+class CourtOccupancy:
+    """Occupation des pistes : par date, {heure du créneau: bitmap des pistes occupées}.
+
+    - une date est chargée en une requête au premier accès, puis rechargée
+      après `ttl` secondes (le cache est propre à chaque process)
+    - les créations / modifications / suppressions de matchs sont appliquées
+      à la validation de la transaction (voir les événements ci-dessous)
+    - les heures d'événements du jour apparaissent comme créneaux, même vides
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._dates: Dict[date, Tuple[float, Dict[time, int]]] = {}
+        self._lock = Lock()
+
+    def _fresh(self, day: date) -> Optional[Dict[time, int]]:
+        entry = self._dates.get(day)
+        if entry is None or entry[0] <= monotonic():
+            return None
+        return entry[1]
+
+    def load(self, db: Session, days: Iterable[date]) -> Dict[date, Dict[time, int]]:
+        """Retourne les bitmaps des dates demandées, en chargeant les manquantes (une requête)"""
+        days = set(days)
+        with self._lock:
+            result = {day: self._fresh(day) for day in days}
+        missing = [day for day, slots in result.items() if slots is None]
+        if missing:
+            loaded = {day: {} for day in missing}
+            # Heures des événements (piste 0 : créneau sans match) et matchs non annulés
+            rows = db.execute(union_all(
+                select(Event.event_date, Event.start_time, literal(0)).where(Event.event_date.in_(missing)),
+                select(Match.match_date, Match.match_time, Match.court_number).where(
+                    Match.match_date.in_(missing),
+                    Match.status != "ANNULE"
+                ),
+            )).all()
+            for day, slot_time, court_number in rows:
+                slots = loaded[day]
+                slots[slot_time] = slots.get(slot_time, 0) | ((1 << (court_number - 1)) if court_number else 0)
+            expires_at = monotonic() + self.ttl
+            with self._lock:
+                for day, slots in loaded.items():
+                    self._dates[day] = (expires_at, slots)
+            result.update(loaded)
+        return result
+
+    def is_free(self, db: Session, match_date: date, match_time: time, court_number: int) -> bool:
+        slots = self.load(db, [match_date])[match_date]
+        return not slots.get(match_time, 0) & (1 << (court_number - 1))
+
+    def occupied(self, db: Session, days: Iterable[date]) -> Set[Tuple[date, time, int]]:
+        """Créneaux (date, heure, piste) occupés aux dates données"""
+        return {
+            (day, slot_time, court)
+            for day, slots in self.load(db, days).items()
+            for slot_time, mask in slots.items()
+            for court in range(1, COURT_COUNT + 1)
+            if mask & (1 << (court - 1))
+        }
+
+    def availability(self, db: Session, day: date) -> List[dict]:
+        """Créneaux du jour avec pistes libres / occupées, par heure"""
+        slots = self.load(db, [day])[day]
+        return [
+            {
+                "match_time": slot_time,
+                "free_courts": [court for court in range(1, COURT_COUNT + 1) if not mask & (1 << (court - 1))],
+                "occupied_courts": [court for court in range(1, COURT_COUNT + 1) if mask & (1 << (court - 1))],
+            }
+            for slot_time, mask in sorted(slots.items())
+        ]
+
+    def apply(self, changes: Iterable[Tuple[Slot, Slot]]) -> None:
+        """Applique des changements (ancien créneau, nouveau créneau) validés"""
+        with self._lock:
+            for old, new in changes:
+                if old and old[0] in self._dates:
+                    slots = self._dates[old[0]][1]
+                    slots[old[1]] = slots.get(old[1], 0) & ~(1 << (old[2] - 1)) & ALL_COURTS
+                if new and new[0] in self._dates:
+                    slots = self._dates[new[0]][1]
+                    slots[new[1]] = slots.get(new[1], 0) | (1 << (new[2] - 1))
+
+    def invalidate(self, days: Iterable[date]) -> None:
+        with self._lock:
+            for day in days:
+                self._dates.pop(day, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dates.clear()
+
+
+court_occupancy = CourtOccupancy(ttl=settings.court_occupancy_ttl_seconds)
+
+
+def warm_court_occupancy(db: Session, from_date: date, days: int) -> None:
+    """Charge au démarrage l'occupation des `days` prochains jours (une requête)"""
+    if days > 0:
+        court_occupancy.load(db, (from_date + timedelta(days=offset) for offset in range(days)))
+
+
+# --------------------------------------------------
+# Suivi des matchs modifiés : appliqué au commit, oublié au rollback
+# --------------------------------------------------
+def _slot(match_date, match_time, court_number, status) -> Slot:
+    if match_date is None or status == "ANNULE":
+        return None
+    return (match_date, match_time, court_number)
+
+
+def previous_value(state, name):
+    """Valeur d'un attribut avant le flush en cours (ou actuelle si inchangée)"""
+    history = state.attrs[name].history
+    if history.deleted:
+        return history.deleted[0]
+    return history.unchanged[0] if history.unchanged else getattr(state.obj(), name)
+
+
+def _record(target, old: Slot, new: Slot) -> None:
+    session = object_session(target)
+    if session is not None and old != new:
+        session.info.setdefault("court_occupancy_changes", []).append((old, new))
+
+
+@event.listens_for(Match, "after_insert")
+def _match_inserted(mapper, connection, target):
+    _record(target, None, _slot(target.match_date, target.match_time, target.court_number, target.status))
+
+
+@event.listens_for(Match, "after_update")
+def _match_updated(mapper, connection, target):
+    state = inspect(target)
+    old = _slot(*(previous_value(state, name) for name in ("match_date", "match_time", "court_number", "status")))
+    _record(target, old, _slot(target.match_date, target.match_time, target.court_number, target.status))
+
+
+@event.listens_for(Match, "after_delete")
+def _match_deleted(mapper, connection, target):
+    state = inspect(target)
+    old = _slot(*(previous_value(state, name) for name in ("match_date", "match_time", "court_number", "status")))
+    _record(target, old, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_court_changes(session):
+    changes = session.info.pop("court_occupancy_changes", None)
+    if changes:
+        court_occupancy.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_court_changes(session):
+    changes = session.info.pop("court_occupancy_changes", None)
+    if changes:
+        # Les dates touchées ont pu être chargées avec des lignes annulées
+        court_occupancy.invalidate({slot[0] for change in changes for slot in change if slot})
@@ -0,0 +1,100 @@
+# ============================================
+# FICHIER : backend/app/crud/planning_cache.py
+# ============================================
+
+from typing import Any, Awaitable, Callable, Hashable
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import build_cache
+from app.core.config import settings
+from app.models.models import Event, Match, Player, ResourceVersion, Team
+
+# Réponses du planning, par clé :
+#   ("day", date)                  -> GET /events/day/{day} (identique pour tous)
+#   ("range", début, fin, user_id) -> GET /events/?start&end
+#   ("my", user_id)                -> GET /events/my-events
+# complétée par les versions des ressources lues en base (resource_versions) : une écriture
+# d'un autre worker ou d'un script change la clé, l'ancienne entrée n'est plus lue
+planning_cache = build_cache(
+    settings.planning_cache_backend,
+    maxsize=settings.planning_cache_max_size,
+    ttl=settings.planning_cache_ttl_seconds
+)
+
+# Incrémenté à chaque invalidation : une réponse calculée pendant une
+# modification n'est pas mise en cache (elle peut déjà être périmée)
+_generation = 0
+
+# Modèles dont une modification change le contenu du planning, et leurs ressources versionnées
+PLANNING_MODELS = (Match, Event, Team, Player)
+PLANNING_RESOURCES = ("matches", "events", "teams", "players")
+
+VERSIONS_STATEMENT = select(ResourceVersion.resource, ResourceVersion.version).where(
+    ResourceVersion.resource.in_(PLANNING_RESOURCES)
+)
+
+
+def versioned_key(key: Hashable, rows) -> Hashable:
+    versions = dict(rows)
+    return key, tuple(versions.get(resource, 0) for resource in PLANNING_RESOURCES)
+
+
+def cached(db: Session, key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Retourne la réponse en cache pour les versions actuelles, ou la calcule et la met en cache"""
+    key = versioned_key(key, db.execute(VERSIONS_STATEMENT).all())
+    value = planning_cache.get(key)
+    if value is None:
+        generation = _generation
+        value = compute()
+        if generation == _generation:
+            planning_cache.set(key, value)
+    return value
+
+
+async def cached_async(db, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Variante de cached() pour le chemin asynchrone (AsyncSession)"""
+    key = versioned_key(key, (await db.execute(VERSIONS_STATEMENT)).all())
+    value = planning_cache.get(key)
+    if value is None:
+        generation = _generation
+        value = await compute()
+        if generation == _generation:
+            planning_cache.set(key, value)
+    return value
+
+
+def invalidate_planning() -> None:
+    global _generation
+    _generation += 1
+    planning_cache.clear()
+
+
+# --------------------------------------------------
+# Invalidation : au commit d'une transaction qui a modifié un modèle du planning
+# --------------------------------------------------
+@event.listens_for(Session, "after_flush")
+def _mark_planning_stale(session, flush_context):
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(instance, PLANNING_MODELS) for instance in changed):
+        session.info["planning_cache_stale"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_planning_stale_bulk(orm_execute_state):
+    # UPDATE / DELETE en masse (update(Model), Query.update) : hors unité de travail
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and issubclass(mapper.class_, PLANNING_MODELS):
+            orm_execute_state.session.info["planning_cache_stale"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_planning(session):
+    if session.info.pop("planning_cache_stale", False):
+        invalidate_planning()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_planning_flag(session):
+    session.info.pop("planning_cache_stale", None)
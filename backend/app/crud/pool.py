@@ -0,0 +1,77 @@
+# ============================================
+# FICHIER : backend/app/crud/pool.py
+# ============================================
+
+from typing import Dict, List
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.models import Pool, Team
+from app.crud.standings import resync_moved_teams
+
+
+def team_ids_label(team_ids: List[int]) -> str:
+    """ "Équipe 3" ou "Équipes 3, 7" """
+    ids = ", ".join(str(team_id) for team_id in sorted(team_ids))
+    return f"Équipe {ids}" if len(team_ids) == 1 else f"Équipes {ids}"
+
+
+def load_teams(db: Session, team_ids: List[int]) -> Dict[int, int]:
+    """
+    Poule actuelle de chaque équipe demandée, en une requête : {team_id: pool_id}.
+    Lève 404 en listant toutes les équipes introuvables.
+    """
+    team_ids = set(team_ids)
+    if not team_ids:
+        return {}
+    pools = dict(db.execute(select(Team.id, Team.pool_id).where(Team.id.in_(team_ids))).all())
+    missing = team_ids - set(pools)
+    if missing:
+        plural = "s" if len(missing) > 1 else ""
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{team_ids_label(missing)} introuvable{plural}"
+        )
+    return pools
+
+
+def assign_teams(db: Session, team_ids: List[int], pool_id) -> None:
+    """Affecte les équipes à la poule (None : les retire) en un seul UPDATE, sans commit"""
+    if team_ids:
+        db.execute(update(Team).where(Team.id.in_(set(team_ids))).values(pool_id=pool_id))
+        # UPDATE hors unité de travail : classements des poules quittées et rejointes
+        resync_moved_teams(db.connection(), team_ids)
+
+
+def create_pool_with_teams(db: Session, name: str, team_ids: List[int]) -> Pool:
+    """Crée la poule et y affecte les équipes libres, en une transaction"""
+    if db.query(Pool.id).filter(Pool.name == name).first():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Une poule avec ce nom existe déjà")
+
+    current = load_teams(db, team_ids)
+    assigned = [team_id for team_id, pool_id in current.items() if pool_id is not None]
+    if assigned:
+        verb = "sont déjà" if len(assigned) > 1 else "est déjà"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{team_ids_label(assigned)} {verb} dans une poule"
+        )
+
+    pool = Pool(name=name)
+    db.add(pool)
+    db.flush()
+    assign_teams(db, team_ids, pool.id)
+    db.commit()
+    db.refresh(pool)
+    return pool
+
+
+def move_teams(db: Session, pool_id: int, team_ids: List[int]) -> List[Team]:
+    """Déplace les équipes (quelle que soit leur poule actuelle) dans la poule, en une transaction"""
+    if db.get(Pool, pool_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Poule introuvable")
+    load_teams(db, team_ids)
+    assign_teams(db, team_ids, pool_id)
+    db.commit()
+    return db.query(Team).filter(Team.pool_id == pool_id).order_by(Team.id).all()
@@ -0,0 +1,180 @@
+# ============================================
+# FICHIER : backend/app/crud/schedule.py
+# ============================================
+
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.models.models import Event, Match, Pool, Team
+from app.schemas.pool import ScheduleRequest, ScheduleResponse, ScheduledMatch
+
+# Créneau = un événement (id, date, heure de début)
+Slot = Tuple[int, date, time]
+
+
+def round_robin(team_ids: List[int]) -> List[List[Tuple[int, int]]]:
+    """
+    Tournoi toutes rondes (méthode du cercle) : chaque équipe rencontre toutes
+    les autres une fois, au plus un match par équipe et par ronde.
+    Nombre impair d'équipes : une équipe exemptée à chaque ronde.
+    """
+    teams: List[Optional[int]] = list(team_ids)
+    if len(teams) < 2:
+        return []
+    if len(teams) % 2:
+        teams.append(None)
+    n = len(teams)
+    rounds = []
+    for r in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            home, away = teams[i], teams[n - 1 - i]
+            if home is not None and away is not None:
+                # Alterner l'ordre pour équilibrer team1 / team2
+                pairs.append((home, away) if r % 2 == 0 else (away, home))
+        rounds.append(pairs)
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+    return rounds
+
+
+def plan_schedule(
+    pools: Dict[int, List[int]],
+    slots: List[Slot],
+    courts: int,
+    occupied_courts: Optional[Dict[Tuple[date, time], Set[int]]] = None,
+    busy_teams: Optional[Dict[Tuple[date, time], Set[int]]] = None,
+    played: Optional[Set[frozenset]] = None,
+) -> Tuple[List[ScheduledMatch], List[ScheduledMatch]]:
+    """
+    Répartit les rencontres de chaque poule sur les créneaux en une passe
+    (premier créneau compatible, rondes dans l'ordre, poules entrelacées).
+
+    Contraintes : une équipe au plus une fois par créneau, `courts` pistes par
+    créneau moins celles déjà occupées. Les rencontres déjà programmées
+    (`played`) sont ignorées. Retourne (matchs placés, rencontres non placées).
+    """
+    occupied_courts = occupied_courts or {}
+    busy_teams = busy_teams or {}
+    played = played or set()
+
+    free = [
+        [court for court in range(1, courts + 1) if court not in occupied_courts.get((slot_date, slot_time), ())]
+        for _, slot_date, slot_time in slots
+    ]
+    busy = [set(busy_teams.get((slot_date, slot_time), ())) for _, slot_date, slot_time in slots]
+    first_open = 0
+
+    rounds = {pool_id: round_robin(team_ids) for pool_id, team_ids in pools.items()}
+    max_rounds = max((len(pool_rounds) for pool_rounds in rounds.values()), default=0)
+
+    scheduled, unscheduled = [], []
+    for r in range(max_rounds):
+        for pool_id in sorted(rounds):
+            if r >= len(rounds[pool_id]):
+                continue
+            for team1_id, team2_id in rounds[pool_id][r]:
+                if frozenset((team1_id, team2_id)) in played:
+                    continue
+                match = ScheduledMatch(pool_id=pool_id, round=r + 1, team1_id=team1_id, team2_id=team2_id)
+                for i in range(first_open, len(slots)):
+                    if free[i] and team1_id not in busy[i] and team2_id not in busy[i]:
+                        event_id, slot_date, slot_time = slots[i]
+                        match.event_id, match.match_date, match.match_time = event_id, slot_date, slot_time
+                        match.court_number = free[i].pop(0)
+                        busy[i].update((team1_id, team2_id))
+                        scheduled.append(match)
+                        break
+                else:
+                    unscheduled.append(match)
+                while first_open < len(slots) and not free[first_open]:
+                    first_open += 1
+    return scheduled, unscheduled
+
+
+def pool_teams(db: Session, pool_ids: Optional[Iterable[int]] = None) -> Dict[int, List[int]]:
+    """Équipes de chaque poule (toutes les poules si `pool_ids` est absent)"""
+    statement = select(Pool.id, Team.id).outerjoin(Team, Team.pool_id == Pool.id).order_by(Pool.id, Team.id)
+    if pool_ids is not None:
+        statement = statement.where(Pool.id.in_(pool_ids))
+    pools: Dict[int, List[int]] = {}
+    for pool_id, team_id in db.execute(statement).all():
+        pools.setdefault(pool_id, [])
+        if team_id is not None:
+            pools[pool_id].append(team_id)
+
+    if pool_ids is not None:
+        missing = sorted(set(pool_ids) - set(pools))
+        if missing:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Poule {missing[0]} introuvable")
+    return pools
+
+
+def generate_schedule(db: Session, request: ScheduleRequest) -> ScheduleResponse:
+    """
+    Génère (ou simule avec `dry_run`) les matchs des poules sur les événements
+    de la période. Tous les matchs sont créés dans une seule transaction.
+    """
+    pools = pool_teams(db, request.pool_ids)
+
+    start = max(request.start_date, datetime.now().date())
+    events = db.execute(
+        select(Event.id, Event.event_date, Event.start_time)
+        .where(Event.event_date >= start, Event.event_date <= request.end_date)
+        .order_by(Event.event_date, Event.start_time)
+    ).all()
+    if not events:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Aucun événement à venir sur la période demandée"
+        )
+    slots = [tuple(event) for event in events]
+
+    # Occupation existante des créneaux (pistes et équipes), en une requête
+    occupied_courts, busy_teams = defaultdict(set), defaultdict(set)
+    existing = db.execute(
+        select(Match.match_date, Match.match_time, Match.court_number, Match.team1_id, Match.team2_id).where(
+            Match.match_date.in_({slot_date for _, slot_date, _ in slots}),
+            Match.status != "ANNULE"
+        )
+    ).all()
+    for match_date, match_time, court_number, team1_id, team2_id in existing:
+        occupied_courts[(match_date, match_time)].add(court_number)
+        busy_teams[(match_date, match_time)].update((team1_id, team2_id))
+
+    # Rencontres déjà programmées ou jouées : ne pas les dupliquer
+    team_ids = [team_id for team_ids in pools.values() for team_id in team_ids]
+    played = set()
+    if team_ids:
+        played = {
+            frozenset(pair) for pair in db.execute(
+                select(Match.team1_id, Match.team2_id).where(
+                    or_(Match.team1_id.in_(team_ids), Match.team2_id.in_(team_ids)),
+                    Match.status != "ANNULE"
+                )
+            ).all()
+        }
+
+    scheduled, unscheduled = plan_schedule(pools, slots, request.courts, occupied_courts, busy_teams, played)
+
+    created = 0
+    if not request.dry_run and scheduled:
+        db.add_all([
+            Match(
+                team1_id=match.team1_id,
+                team2_id=match.team2_id,
+                event_id=match.event_id,
+                match_date=match.match_date,
+                match_time=match.match_time,
+                court_number=match.court_number,
+                status="A_VENIR",
+            )
+            for match in scheduled
+        ])
+        db.commit()
+        created = len(scheduled)
+
+    return ScheduleResponse(dry_run=request.dry_run, scheduled=scheduled, unscheduled=unscheduled, created=created)
@@ -0,0 +1,114 @@
+# ============================================
+# FICHIER : backend/app/crud/search.py
+# ============================================
+
+from typing import Iterable
+from sqlalchemy import and_, column, delete, event, func, insert, inspect, literal_column, or_, select, table
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+from app.models.models import Player, SearchDocument, User
+
+SEARCH_MODES = ("prefix", "substring")
+TRIGRAM = 3  # longueur minimale utilisable par les index trigrammes
+
+search_documents_fts = table("search_documents_fts", column("rowid"), column("rank"))
+
+
+def documents_statement(user_filter=None):
+    """Documents (email en minuscules + joueur éventuel) à indexer pour chaque utilisateur"""
+    statement = select(User.id, func.lower(User.email), Player.first_name, Player.last_name, Player.company).outerjoin(
+        Player, Player.user_id == User.id
+    )
+    if user_filter is not None:
+        statement = statement.where(user_filter)
+    return statement
+
+
+def sync_users(connection: Connection, user_ids: Iterable[int]) -> None:
+    """Recalcule les documents des utilisateurs donnés"""
+    user_ids = [user_id for user_id in set(user_ids) if user_id is not None]
+    if not user_ids:
+        return
+    connection.execute(delete(SearchDocument).where(SearchDocument.user_id.in_(user_ids)))
+    connection.execute(insert(SearchDocument).from_select(
+        ["user_id", "email", "first_name", "last_name", "company"], documents_statement(User.id.in_(user_ids))
+    ))
+
+
+def rebuild_search_documents(connection: Connection) -> None:
+    """Reconstruit tout l'index (données insérées hors ORM, base existante)"""
+    connection.execute(delete(SearchDocument))
+    connection.execute(insert(SearchDocument).from_select(
+        ["user_id", "email", "first_name", "last_name", "company"], documents_statement()
+    ))
+
+
+def fts_phrase(q: str) -> str:
+    return '"' + q.replace('"', '""') + '"'
+
+
+def like_pattern(q: str, mode: str) -> str:
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%" if mode == "prefix" else f"%{escaped}%"
+
+
+def search_statement(dialect: str, q: str, mode: str = "substring") -> Select:
+    """Documents correspondant à `q`, les plus pertinents d'abord.
+
+    - `prefix` : un des champs commence par `q`
+    - `substring` : `q` apparaît dans un des champs
+    Moins de 3 caractères (pas de trigramme) : préfixe d'un des champs dans les
+    deux modes, l'email par son index B-tree, les autres champs par LIKE.
+    """
+    q = q.strip().lower()
+    statement = select(SearchDocument)
+    fields = (SearchDocument.first_name, SearchDocument.last_name, SearchDocument.company)
+    if len(q) < TRIGRAM:
+        pattern = like_pattern(q, "prefix")
+        return statement.where(or_(
+            and_(SearchDocument.email >= q, SearchDocument.email < q + "\uffff"),
+            *(field.ilike(pattern, escape="\\") for field in fields)
+        )).order_by(SearchDocument.email)
+
+    if dialect == "sqlite":
+        match = fts_phrase(q) if mode == "substring" else "^" + fts_phrase(q)
+        return statement.join(
+            search_documents_fts, search_documents_fts.c.rowid == SearchDocument.user_id
+        ).where(literal_column("search_documents_fts").op("MATCH")(match)).order_by(search_documents_fts.c.rank)
+
+    # Autres bases : ILIKE servi par les index pg_trgm (PostgreSQL)
+    pattern = like_pattern(q, mode)
+    return statement.where(or_(
+        *(field.ilike(pattern, escape="\\") for field in (SearchDocument.email, *fields))
+    )).order_by(SearchDocument.email)
+
+
+def search_user_ids(dialect: str, q: str, mode: str = "substring") -> Select:
+    """Sous-requête des identifiants correspondants (filtre de la liste des utilisateurs)"""
+    return search_statement(dialect, q, mode).with_only_columns(SearchDocument.user_id).order_by(None)
+
+
+# Maintenance à chaque flush ORM des utilisateurs et des joueurs
+@event.listens_for(User, "after_insert")
+def _user_inserted(mapper, connection, target):
+    sync_users(connection, [target.id])
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target):
+    if inspect(target).attrs.email.history.has_changes():
+        sync_users(connection, [target.id])
+
+
+@event.listens_for(Player, "after_insert")
+@event.listens_for(Player, "after_delete")
+def _player_inserted_or_deleted(mapper, connection, target):
+    sync_users(connection, [target.user_id])
+
+
+@event.listens_for(Player, "after_update")
+def _player_updated(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("first_name", "last_name", "company", "user_id")):
+        # Ancien et nouveau compte si le joueur change d'utilisateur
+        sync_users(connection, [target.user_id, *state.attrs.user_id.history.deleted])
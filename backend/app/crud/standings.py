@@ -0,0 +1,203 @@
+# ============================================
+# FICHIER : backend/app/crud/standings.py
+# ============================================
+
+from typing import Dict, List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import case, delete, event, func, insert, inspect, select, union, union_all, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, aliased
+
+from app.models.models import Match, MatchSet, Pool, Team, TeamStanding
+from app.crud.match_sets import finished_sets
+from app.crud.occupancy import previous_value
+
+STAT_FIELDS = ("played", "wins", "losses", "sets_won", "sets_lost", "games_won", "games_lost")
+
+# Contribution d'un match terminé : {team_id: {champ: valeur}}
+Contribution = Dict[int, Dict[str, int]]
+
+
+def match_contribution(team1_id, team2_id, match_status, score_team1) -> Optional[Contribution]:
+    """Bilan apporté par un match terminé à chaque équipe (None sinon ou si le score est illisible)"""
+    sets = finished_sets(match_status, score_team1)
+    if not sets:
+        return None
+
+    sets1 = sum(1 for a, b in sets if a > b)
+    sets2 = len(sets) - sets1
+    games1 = sum(a for a, _ in sets)
+    games2 = sum(b for _, b in sets)
+    team1_wins = sets1 > sets2
+    return {
+        team1_id: {"played": 1, "wins": int(team1_wins), "losses": int(not team1_wins),
+                   "sets_won": sets1, "sets_lost": sets2, "games_won": games1, "games_lost": games2},
+        team2_id: {"played": 1, "wins": int(not team1_wins), "losses": int(team1_wins),
+                   "sets_won": sets2, "sets_lost": sets1, "games_won": games2, "games_lost": games1},
+    }
+
+
+def shared_pool(connection: Connection, team1_id, team2_id) -> Optional[int]:
+    """Poule commune actuelle des deux équipes (None si elles ne sont pas dans la même poule)"""
+    pools = dict(connection.execute(select(Team.id, Team.pool_id).where(Team.id.in_((team1_id, team2_id)))).all())
+    pool_id = pools.get(team1_id)
+    return pool_id if pool_id is not None and pool_id == pools.get(team2_id) else None
+
+
+def apply_contribution(connection: Connection, contribution: Contribution, sign: int) -> None:
+    """Ajoute (sign=1) ou retire (sign=-1) une contribution aux bilans des équipes dans leur poule commune"""
+    pool_id = shared_pool(connection, *contribution)
+    if pool_id is None:
+        return  # match hors poule : ne compte dans aucun classement
+    for team_id, stats in contribution.items():
+        result = connection.execute(
+            update(TeamStanding).where(TeamStanding.pool_id == pool_id, TeamStanding.team_id == team_id).values(
+                {getattr(TeamStanding, name): getattr(TeamStanding, name) + sign * stats[name] for name in STAT_FIELDS}
+            )
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(TeamStanding).values(
+                pool_id=pool_id, team_id=team_id, **{name: sign * stats[name] for name in STAT_FIELDS}
+            ))
+
+
+def standings_totals_statement(team_ids: Optional[List[int]] = None):
+    """Bilans par (poule, équipe) agrégés en SQL depuis match_sets : matchs terminés
+    entre deux équipes actuellement dans la même poule"""
+    per_match = (
+        select(
+            MatchSet.match_id,
+            func.sum(case((MatchSet.games_team1 > MatchSet.games_team2, 1), else_=0)).label("sets1"),
+            func.sum(case((MatchSet.games_team2 > MatchSet.games_team1, 1), else_=0)).label("sets2"),
+            func.sum(MatchSet.games_team1).label("games1"),
+            func.sum(MatchSet.games_team2).label("games2"),
+        )
+        .group_by(MatchSet.match_id)
+        .subquery()
+    )
+    team1, team2 = aliased(Team), aliased(Team)
+    # Une ligne par (match, équipe), du point de vue de chaque équipe
+    sides = union_all(*(
+        select(
+            team1.pool_id.label("pool_id"),
+            team_column.label("team_id"),
+            won_sets.label("sets_won"), lost_sets.label("sets_lost"),
+            won_games.label("games_won"), lost_games.label("games_lost"),
+        )
+        .join(per_match, per_match.c.match_id == Match.id)
+        .join(team1, team1.id == Match.team1_id)
+        .join(team2, team2.id == Match.team2_id)
+        .where(Match.status == "TERMINE", team1.pool_id.isnot(None), team1.pool_id == team2.pool_id)
+        for team_column, won_sets, lost_sets, won_games, lost_games in (
+            (Match.team1_id, per_match.c.sets1, per_match.c.sets2, per_match.c.games1, per_match.c.games2),
+            (Match.team2_id, per_match.c.sets2, per_match.c.sets1, per_match.c.games2, per_match.c.games1),
+        )
+    )).subquery()
+
+    statement = select(
+        sides.c.pool_id,
+        sides.c.team_id,
+        func.count().label("played"),
+        func.sum(case((sides.c.sets_won > sides.c.sets_lost, 1), else_=0)).label("wins"),
+        func.sum(case((sides.c.sets_won > sides.c.sets_lost, 0), else_=1)).label("losses"),
+        func.sum(sides.c.sets_won).label("sets_won"),
+        func.sum(sides.c.sets_lost).label("sets_lost"),
+        func.sum(sides.c.games_won).label("games_won"),
+        func.sum(sides.c.games_lost).label("games_lost"),
+    ).group_by(sides.c.pool_id, sides.c.team_id)
+    if team_ids is not None:
+        statement = statement.where(sides.c.team_id.in_(team_ids))
+    return statement
+
+
+def rebuild_standings(connection: Connection, team_ids: Optional[List[int]] = None) -> None:
+    """Reconstruit les bilans (de toutes les équipes, ou de `team_ids`) depuis les sets, sans commit"""
+    clear = delete(TeamStanding)
+    if team_ids is not None:
+        clear = clear.where(TeamStanding.team_id.in_(team_ids))
+    connection.execute(clear)
+    connection.execute(insert(TeamStanding).from_select(
+        ("pool_id", "team_id") + STAT_FIELDS, standings_totals_statement(team_ids)
+    ))
+
+
+def resync_moved_teams(connection: Connection, team_ids: List[int]) -> None:
+    """Équipes changées de poule : reconstruit leurs bilans et ceux de leurs adversaires, sans commit"""
+    team_ids = list(set(team_ids))
+    if not team_ids:
+        return
+    opponents = connection.execute(union(
+        select(Match.team2_id).where(Match.team1_id.in_(team_ids)),
+        select(Match.team1_id).where(Match.team2_id.in_(team_ids)),
+    )).scalars().all()
+    rebuild_standings(connection, list(set(team_ids) | set(opponents)))
+
+
+def recompute_standings(db: Session, team_ids: Optional[List[int]] = None) -> None:
+    """
+    Recalcule les bilans depuis les sets des matchs terminés (réparation).
+    `team_ids` limite le recalcul à ces équipes, sinon toutes.
+    """
+    rebuild_standings(db.connection(), team_ids)
+    db.commit()
+
+
+def pool_standings(db: Session, pool_id: int) -> List[dict]:
+    """Classement d'une poule : victoires, puis différence de sets, puis de jeux"""
+    if db.get(Pool, pool_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Poule introuvable")
+
+    rows = db.execute(
+        select(Team.id, Team.company, *(getattr(TeamStanding, name) for name in STAT_FIELDS))
+        .outerjoin(TeamStanding, (TeamStanding.team_id == Team.id) & (TeamStanding.pool_id == pool_id))
+        .where(Team.pool_id == pool_id)
+    ).all()
+
+    standings = []
+    for team_id, company, *stats in rows:
+        entry = {"team_id": team_id, "company": company, **{name: value or 0 for name, value in zip(STAT_FIELDS, stats)}}
+        entry["set_diff"] = entry["sets_won"] - entry["sets_lost"]
+        entry["game_diff"] = entry["games_won"] - entry["games_lost"]
+        standings.append(entry)
+
+    standings.sort(key=lambda e: (-e["wins"], -e["set_diff"], -e["game_diff"], e["team_id"]))
+    for rank, entry in enumerate(standings, start=1):
+        entry["rank"] = rank
+    return standings
+
+
+# Mise à jour incrémentale à chaque flush d'un match (même transaction) ; les
+# changements de poule en masse (UPDATE hors ORM) appellent resync_moved_teams
+@event.listens_for(Team, "after_update")
+def _team_updated(mapper, connection, target):
+    if inspect(target).attrs.pool_id.history.has_changes():
+        resync_moved_teams(connection, [target.id])
+
+
+@event.listens_for(Match, "after_insert")
+def _match_inserted(mapper, connection, target):
+    contribution = match_contribution(target.team1_id, target.team2_id, target.status, target.score_team1)
+    if contribution:
+        apply_contribution(connection, contribution, 1)
+
+
+@event.listens_for(Match, "after_update")
+def _match_updated(mapper, connection, target):
+    state = inspect(target)
+    names = ("team1_id", "team2_id", "status", "score_team1")
+    if not any(state.attrs[name].history.has_changes() for name in names):
+        return
+    old = match_contribution(*(previous_value(state, name) for name in names))
+    new = match_contribution(target.team1_id, target.team2_id, target.status, target.score_team1)
+    if old:
+        apply_contribution(connection, old, -1)
+    if new:
+        apply_contribution(connection, new, 1)
+
+
+@event.listens_for(Match, "after_delete")
+def _match_deleted(mapper, connection, target):
+    state = inspect(target)
+    old = match_contribution(*(previous_value(state, name) for name in ("team1_id", "team2_id", "status", "score_team1")))
+    if old:
+        apply_contribution(connection, old, -1)
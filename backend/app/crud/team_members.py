@@ -0,0 +1,74 @@
+# ============================================
+# FICHIER : backend/app/crud/team_members.py
+# ============================================
+
+from typing import Iterable
+from sqlalchemy import delete, event, insert, inspect, or_, select, union
+from sqlalchemy.engine import Connection
+from app.models.models import Player, Team, TeamMember
+
+
+def members_statement(team_filter=None):
+    """Couples (user_id, team_id) des deux joueurs de chaque équipe"""
+    selects = []
+    for player_column in (Team.player1_id, Team.player2_id):
+        statement = select(Player.user_id, Team.id).join(Player, Player.id == player_column).where(
+            Player.user_id.isnot(None)
+        )
+        if team_filter is not None:
+            statement = statement.where(team_filter)
+        selects.append(statement)
+    return union(*selects)
+
+
+def sync_teams(connection: Connection, team_ids: Iterable[int]) -> None:
+    """Recalcule les membres des équipes données"""
+    team_ids = list(team_ids)
+    if not team_ids:
+        return
+    connection.execute(delete(TeamMember).where(TeamMember.team_id.in_(team_ids)))
+    connection.execute(insert(TeamMember).from_select(
+        ["user_id", "team_id"], members_statement(Team.id.in_(team_ids))
+    ))
+
+
+def rebuild_team_members(connection: Connection) -> None:
+    """Reconstruit toute la table (données insérées hors ORM, base existante)"""
+    connection.execute(delete(TeamMember))
+    connection.execute(insert(TeamMember).from_select(["user_id", "team_id"], members_statement()))
+
+
+def player_team_ids(connection: Connection, player_id: int):
+    return connection.execute(
+        select(Team.id).where(or_(Team.player1_id == player_id, Team.player2_id == player_id))
+    ).scalars().all()
+
+
+# Maintenance à chaque flush ORM des équipes et des joueurs
+@event.listens_for(Team, "after_insert")
+def _team_inserted(mapper, connection, target):
+    sync_teams(connection, [target.id])
+
+
+@event.listens_for(Team, "after_update")
+def _team_updated(mapper, connection, target):
+    state = inspect(target)
+    if state.attrs.player1_id.history.has_changes() or state.attrs.player2_id.history.has_changes():
+        sync_teams(connection, [target.id])
+
+
+@event.listens_for(Team, "after_delete")
+def _team_deleted(mapper, connection, target):
+    connection.execute(delete(TeamMember).where(TeamMember.team_id == target.id))
+
+
+@event.listens_for(Player, "after_insert")
+@event.listens_for(Player, "after_delete")
+def _player_inserted_or_deleted(mapper, connection, target):
+    sync_teams(connection, player_team_ids(connection, target.id))
+
+
+@event.listens_for(Player, "after_update")
+def _player_updated(mapper, connection, target):
+    if inspect(target).attrs.user_id.history.has_changes():
+        sync_teams(connection, player_team_ids(connection, target.id))
@@ -1,15 +1,120 @@
-from sqlalchemy import create_engine
+from hashlib import sha1
+from importlib import import_module
+from sqlalchemy import create_engine, delete, event, insert, inspect, select
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(
-    settings.database_url,  # ← Changé de DATABASE_URL à database_url
-    connect_args={"check_same_thread": False}  # Nécessaire pour SQLite
-)
+
+def engine_options(database_url: str) -> dict:
+    """Options de create_engine selon le backend"""
+    url = make_url(database_url)
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+    }
+    if url.get_backend_name() == "sqlite":
+        options = {"connect_args": {"check_same_thread": False}}  # Nécessaire pour SQLite
+        if url.database and url.database != ":memory:":
+            # Fichier SQLite : même pool que les autres bases (pas de recyclage utile)
+            options.update(pool_options)
+        return options
+    return {
+        **pool_options,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": True,
+    }
+
+
+def sqlite_pragmas() -> list:
+    """Pragmas SQLite exécutés à l'ouverture de chaque connexion"""
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        f"PRAGMA cache_size={int(settings.sqlite_cache_size)}",
+    ]
+
+
+def install_sqlite_pragmas(engine) -> None:
+    """Applique sqlite_pragmas() à chaque nouvelle connexion du moteur"""
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(database_url: str = None):
+    """Crée le moteur SQLAlchemy.
+
+    SQLite : WAL (les lecteurs ne sont plus bloqués par l'écrivain),
+    synchronous=NORMAL, busy_timeout, mmap et cache configurés à la connexion.
+    Autres bases : taille / débordement / recyclage du pool configurables.
+    """
+    database_url = database_url or settings.database_url
+    engine = create_engine(database_url, **engine_options(database_url))
+
+    if engine.dialect.name == "sqlite":
+        install_sqlite_pragmas(engine)
+    return engine
+
+
+engine = create_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Pilotes asynchrones associés aux URL synchrones
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def async_database_url(database_url: str) -> str:
+    """Convertit une URL synchrone vers son pilote asynchrone"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Pas de pilote asynchrone connu pour {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(database_url: str = None):
+    """Crée le moteur asynchrone (mêmes réglages que create_db_engine)"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    database_url = database_url or settings.database_url
+    options = engine_options(database_url)
+    if "pool_size" in options and make_url(database_url).get_backend_name() == "sqlite":
+        # aiosqlite utilise NullPool par défaut : réutiliser les connexions
+        options["poolclass"] = AsyncAdaptedQueuePool
+    engine = create_async_engine(async_database_url(database_url), **options)
+
+    if engine.dialect.name == "sqlite":
+        install_sqlite_pragmas(engine.sync_engine)
+    return engine
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.async_db_enabled:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async_engine = create_async_db_engine()
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -20,12 +125,95 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """Générateur de session asynchrone (si async_db_enabled)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def create_missing_indexes(bind=None):
+    """Crée les index déclarés sur les modèles qui manquent dans une base existante
+    (create_all ne les ajoute pas aux tables déjà créées)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind or engine, checkfirst=True)
+
+# Modules dont l'import enregistre les écouteurs ORM (tables dérivées, versions ETag, caches)
+LISTENER_MODULES = (
+    "app.crud.team_members",
+    "app.crud.search",
+    "app.crud.match_sets",
+    "app.crud.standings",
+    "app.crud.occupancy",
+    "app.crud.planning_cache",
+    "app.core.etag",
+)
+
+def register_listeners():
+    """Importe les modules à écouteurs : à appeler par tout process qui écrit via l'ORM
+    (application, scripts), indépendamment de la vérification du schéma"""
+    for module in LISTENER_MODULES:
+        import_module(module)
+
+# À incrémenter quand le contenu d'une table dérivée change : relance leur reconstruction au démarrage
+DERIVED_DATA_VERSION = 2
+
+def schema_fingerprint() -> str:
+    """Empreinte des tables, colonnes et index déclarés par les modèles (et des tables dérivées)"""
+    import app.models.models  # noqa: F401  (enregistre les modèles)
+
+    parts = [f"derived:{DERIVED_DATA_VERSION}"]
+    for table in Base.metadata.sorted_tables:
+        parts.append(table.name)
+        parts.extend(f"{column.name}:{column.type!r}:{column.nullable}" for column in table.columns)
+        parts.extend(sorted(f"index:{index.name}" for index in table.indexes))
+    return sha1("|".join(parts).encode()).hexdigest()
+
+def prepare_database(force: bool = False) -> bool:
+    """
+    Met la base au niveau du schéma des modèles, une fois par déploiement :
+    tables et index manquants, puis resynchronisation des tables dérivées
+    (données insérées hors ORM : membres, recherche, sets, classements). Ignoré (une seule requête) si l'empreinte
+    enregistrée correspond déjà. Retourne True si le schéma a été appliqué.
+    """
+    from app.models.models import SchemaState, TeamStanding
+    from app.crud.standings import rebuild_standings
+    from app.crud.team_members import rebuild_team_members
+    from app.crud.search import rebuild_search_documents
+    from app.crud.match_sets import backfill_match_sets
+
+    fingerprint = schema_fingerprint()
+    if not force and inspect(engine).has_table(SchemaState.__tablename__):
+        with engine.connect() as connection:
+            stored = connection.execute(select(SchemaState.fingerprint).where(SchemaState.id == 1)).scalar()
+        if stored == fingerprint:
+            return False
+
+    with engine.begin() as connection:
+        # Tables dérivées dont les colonnes ont changé : recréées (create_all ne modifie
+        # pas une table existante), leur contenu est reconstruit ci-dessous
+        for table in (TeamStanding.__table__,):
+            if not inspect(connection).has_table(table.name):
+                continue
+            columns = {column["name"] for column in inspect(connection).get_columns(table.name)}
+            if columns != set(table.columns.keys()):
+                table.drop(connection)
+    Base.metadata.create_all(bind=engine)
+    create_missing_indexes()
+    with engine.begin() as connection:
+        rebuild_team_members(connection)
+        rebuild_search_documents(connection)
+        backfill_match_sets(connection)
+        rebuild_standings(connection)
+        connection.execute(delete(SchemaState))
+        connection.execute(insert(SchemaState).values(id=1, fingerprint=fingerprint))
+    return True
+
 def init_db():
     """Initialise la base de données avec un admin par défaut"""
-    from app.models.models import User, Base
+    from app.models.models import User
     from app.core.security import get_password_hash
     
-    Base.metadata.create_all(bind=engine)
+    prepare_database()
     
     db = SessionLocal()
     try:
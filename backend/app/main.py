@@ -1,74 +1,128 @@
+from contextlib import asynccontextmanager
+from datetime import date
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
-from app.api import auth, user, match, player, team, pool, planning
-from app.database import engine
-from app.models import models
-
-# Créer les tables
-models.Base.metadata.create_all(bind=engine)
-
-app = FastAPI(
-    title="Corpo Padel API",
-    description="API pour la gestion de tournois corporatifs de padel",
-    version="1.0.0"
-)
-
-# Configuration CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Middleware de sécurité
-@app.middleware("http")
-async def add_security_headers(request, call_next):
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    return response
-
-# Gestionnaire d'erreurs personnalisé pour traduire les messages en français
-@app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException):
-    # Traduire les messages d'erreur courants en français
-    french_messages = {
-        404: "Ressource introuvable",
-        403: "Accès refusé",
-        401: "Non autorisé",
-        400: "Requête invalide",
-        500: "Erreur interne du serveur"
-    }
-    
-    # Utiliser le message de l'exception s'il existe, sinon utiliser le message traduit
-    detail = exc.detail
-    if exc.detail == "Not Found":
-        detail = french_messages.get(exc.status_code, exc.detail)
-    
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": detail}
+from app.core.logs import REQUEST_ID_HEADER, RequestIdMiddleware, setup_logging, shutdown_logging
+
+# L'import de ce module ne touche pas la base : le schéma est vérifié au démarrage
+# (lifespan) et les routes ne sont importées qu'à la création de l'application.
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from app.database import SessionLocal, prepare_database
+    from app.crud.occupancy import warm_court_occupancy
+
+    # Logs structurés (file non bloquante, écrite par un thread dédié)
+    setup_logging()
+
+    # Schéma (tables, index, tables dérivées) : appliqué seulement s'il a changé depuis le dernier démarrage
+    if settings.schema_check_on_startup:
+        prepare_database()
+
+    # Occupation des pistes des prochains jours (fenêtre bornée : les autres dates à la demande)
+    with SessionLocal() as db:
+        warm_court_occupancy(db, date.today(), settings.court_occupancy_warm_days)
+    yield
+    shutdown_logging()
+
+
+def create_app() -> FastAPI:
+    """Construit l'application (middlewares, gestionnaire d'erreurs, routes)"""
+    from app.database import register_listeners
+    from app.core.pagination import NEXT_CURSOR_HEADER
+    from app.core.etag import ETAG_HEADER, ConditionalGetMiddleware
+    from app.core.instrumentation import install_instrumentation
+    from app.api import auth, user, match, player, team, pool, planning
+
+    # Écouteurs ORM (tables dérivées, ETag, caches) : enregistrés même sans vérification du schéma
+    register_listeners()
+
+    app = FastAPI(
+        title="Corpo Padel API",
+        description="API pour la gestion de tournois corporatifs de padel",
+        version="1.0.0",
+        lifespan=lifespan
     )
 
-# Routes
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
-app.include_router(planning.router, prefix="/api/v1", tags=["Events"])
-app.include_router(user.router, prefix="/api/v1/users", tags=["Creation Users"])
-app.include_router(match.router, prefix="/api/v1", tags=["Creation Matches"])
-app.include_router(player.router, prefix="/api/v1/players", tags=["players"])
-app.include_router(team.router, prefix="/api/v1/teams", tags=["teams"])
-app.include_router(pool.router, prefix="/api/v1/pools", tags=["pools"])
+    # Lectures conditionnelles (ETag / If-None-Match -> 304) ; ajoutées avant CORS,
+    # elles s'exécutent à l'intérieur : les 304 portent les en-têtes CORS
+    app.add_middleware(ConditionalGetMiddleware)
+
+    # Configuration CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.allowed_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER, REQUEST_ID_HEADER],
+    )
+
+    # Middleware de sécurité
+    @app.middleware("http")
+    async def add_security_headers(request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        return response
+
+    # Mesures par requête (Server-Timing, /metrics, budget de requêtes SQL) si activées
+    if settings.instrumentation_enabled:
+        install_instrumentation(app)
+
+    # Identifiant de requête (X-Request-ID) repris dans les logs ; ajouté en dernier, il englobe les autres middlewares
+    app.add_middleware(RequestIdMiddleware)
+
+    # Gestionnaire d'erreurs personnalisé pour traduire les messages en français
+    @app.exception_handler(HTTPException)
+    async def http_exception_handler(request: Request, exc: HTTPException):
+        # Traduire les messages d'erreur courants en français
+        french_messages = {
+            404: "Ressource introuvable",
+            403: "Accès refusé",
+            401: "Non autorisé",
+            400: "Requête invalide",
+            500: "Erreur interne du serveur"
+        }
+
+        # Utiliser le message de l'exception s'il existe, sinon utiliser le message traduit
+        detail = exc.detail
+        if exc.detail == "Not Found":
+            detail = french_messages.get(exc.status_code, exc.detail)
+
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"detail": detail},
+            headers=exc.headers
+        )
+
+    # Routes
+    app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
+    app.include_router(planning.router, prefix="/api/v1", tags=["Events"])
+    app.include_router(user.router, prefix="/api/v1/users", tags=["Creation Users"])
+    app.include_router(match.router, prefix="/api/v1", tags=["Creation Matches"])
+    app.include_router(player.router, prefix="/api/v1/players", tags=["players"])
+    app.include_router(team.router, prefix="/api/v1/teams", tags=["teams"])
+    app.include_router(pool.router, prefix="/api/v1/pools", tags=["pools"])
+
+    @app.get("/")
+    def read_root():
+        return {"message": "Bienvenue sur l'API Corpo Padel", "version": "1.0.0"}
+
+    @app.get("/health")
+    def health_check():
+        return {"status": "healthy"}
 
+    return app
 
-@app.get("/")
-def read_root():
-    return {"message": "Bienvenue sur l'API Corpo Padel", "version": "1.0.0"}
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+def __getattr__(name):
+    # `app.main:app` (uvicorn, tests) : application créée au premier accès seulement
+    if name == "app":
+        globals()["app"] = create_app()
+        return globals()["app"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 # FICHIER : backend/app/models/models.py
 # ============================================
 
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Date, Time
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Date, Time, Index, DDL, event, text
 from sqlalchemy.sql import func
 from app.database import Base
 from sqlalchemy.orm import relationship
@@ -30,6 +30,51 @@ class LoginAttempt(Base):
     locked_until = Column(DateTime(timezone=True), nullable=True)
 
 
+class SearchDocument(Base):
+    # Index de recherche : un document par utilisateur (email + joueur associé), app/crud/search.py
+    __tablename__ = "search_documents"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    email = Column(String, nullable=False, index=True)
+    first_name = Column(String, nullable=True)
+    last_name = Column(String, nullable=True)
+    company = Column(String, nullable=True)
+
+
+# SQLite : table FTS5 (trigrammes) adossée à search_documents, tenue à jour par triggers
+SEARCH_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts USING fts5(
+        email, first_name, last_name, company,
+        content='search_documents', content_rowid='user_id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS search_documents_ai AFTER INSERT ON search_documents BEGIN
+        INSERT INTO search_documents_fts(rowid, email, first_name, last_name, company)
+        VALUES (new.user_id, new.email, new.first_name, new.last_name, new.company);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_documents_ad AFTER DELETE ON search_documents BEGIN
+        INSERT INTO search_documents_fts(search_documents_fts, rowid, email, first_name, last_name, company)
+        VALUES ('delete', old.user_id, old.email, old.first_name, old.last_name, old.company);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_documents_au AFTER UPDATE ON search_documents BEGIN
+        INSERT INTO search_documents_fts(search_documents_fts, rowid, email, first_name, last_name, company)
+        VALUES ('delete', old.user_id, old.email, old.first_name, old.last_name, old.company);
+        INSERT INTO search_documents_fts(rowid, email, first_name, last_name, company)
+        VALUES (new.user_id, new.email, new.first_name, new.last_name, new.company);
+    END""",
+]
+for statement in SEARCH_FTS_DDL:
+    event.listen(SearchDocument.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(SearchDocument.__table__, "before_drop", DDL("DROP TABLE IF EXISTS search_documents_fts").execute_if(dialect="sqlite"))
+
+# PostgreSQL : index trigrammes (pg_trgm) pour les recherches ILIKE
+event.listen(SearchDocument.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+for column_name in ("email", "first_name", "last_name", "company"):
+    event.listen(SearchDocument.__table__, "after_create", DDL(
+        f"CREATE INDEX IF NOT EXISTS ix_search_documents_{column_name}_trgm "
+        f"ON search_documents USING gin ({column_name} gin_trgm_ops)"
+    ).execute_if(dialect="postgresql"))
+
+
 class Player(Base):
     __tablename__ = "players"
     id = Column(Integer, primary_key=True, index=True)
@@ -39,7 +84,7 @@ class Player(Base):
     license_number = Column(String, unique=True, nullable=False)
     birth_date = Column(Date, nullable=True)
     photo_url = Column(String, nullable=True)
-    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)  # unique => indexé
     user = relationship("User", backref="player", uselist=False)
 
 
@@ -56,11 +101,11 @@ class Team(Base):
     __tablename__ = "teams"
     
     id = Column(Integer, primary_key=True, index=True)
-    company = Column(String, nullable=False)
-    player1_id = Column(Integer, ForeignKey("players.id"), nullable=False)
-    player2_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    company = Column(String, nullable=False, index=True)
+    player1_id = Column(Integer, ForeignKey("players.id"), nullable=False, index=True)
+    player2_id = Column(Integer, ForeignKey("players.id"), nullable=False, index=True)
 
-    pool_id = Column(Integer, ForeignKey("pools.id"), nullable=True)
+    pool_id = Column(Integer, ForeignKey("pools.id"), nullable=True, index=True)
 
     player1 = relationship("Player", foreign_keys=[player1_id])
     player2 = relationship("Player", foreign_keys=[player2_id])
@@ -69,11 +114,35 @@ class Team(Base):
     matches_as_team2 = relationship("Match", back_populates="team2", foreign_keys='Match.team2_id')
 
 
+class TeamMember(Base):
+    # Correspondance utilisateur -> équipe, dérivée de teams/players (app/crud/team_members.py)
+    __tablename__ = "team_members"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), primary_key=True, index=True)
+
+
+class TeamStanding(Base):
+    # Bilan d'une équipe dans une poule : matchs terminés contre les autres équipes
+    # de la poule, tenu à jour par app/crud/standings.py
+    __tablename__ = "team_standings"
+
+    pool_id = Column(Integer, ForeignKey("pools.id"), primary_key=True)
+    team_id = Column(Integer, ForeignKey("teams.id"), primary_key=True, index=True)
+    played = Column(Integer, default=0, nullable=False)
+    wins = Column(Integer, default=0, nullable=False)
+    losses = Column(Integer, default=0, nullable=False)
+    sets_won = Column(Integer, default=0, nullable=False)
+    sets_lost = Column(Integer, default=0, nullable=False)
+    games_won = Column(Integer, default=0, nullable=False)
+    games_lost = Column(Integer, default=0, nullable=False)
+
+
 class Event(Base):
     __tablename__ = "events"
     
     id = Column(Integer, primary_key=True, index=True)
-    event_date = Column(Date, nullable=False)
+    event_date = Column(Date, nullable=False, index=True)
     start_time = Column(Time, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     matches = relationship("Match", back_populates="event")
@@ -87,13 +156,20 @@ class MatchStatus(str, enum.Enum):
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        # Plage de dates (matchs à venir, tri date/heure) et disponibilité d'une piste
+        Index("ix_matches_slot", "match_date", "match_time", "court_number", "status"),
+        # Une piste par créneau : garantie en base, entre workers (les matchs annulés ne l'occupent pas)
+        Index("ux_matches_court_slot", "match_date", "match_time", "court_number", unique=True,
+              sqlite_where=text("status != 'ANNULE'"), postgresql_where=text("status != 'ANNULE'")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    team1_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
-    team2_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    team1_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
+    team2_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
     match_date = Column(Date, nullable=False)
     match_time = Column(Time, nullable=False)
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=True)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=True, index=True)
     court_number = Column(Integer, nullable=False)
     status = Column(String, default=MatchStatus.A_VENIR, nullable=False)
     score_team1 = Column(String, nullable=True)
@@ -101,4 +177,30 @@ class Match(Base):
 
     team1 = relationship("Team", back_populates="matches_as_team1", foreign_keys=[team1_id])
     team2 = relationship("Team", back_populates="matches_as_team2", foreign_keys=[team2_id])
-    event = relationship("Event", back_populates="matches")
\ No newline at end of file
+    event = relationship("Event", back_populates="matches")
+
+
+class MatchSet(Base):
+    # Sets d'un match terminé (score_team1 décomposé), tenu à jour par app/crud/match_sets.py
+    __tablename__ = "match_sets"
+
+    match_id = Column(Integer, ForeignKey("matches.id"), primary_key=True)
+    set_no = Column(Integer, primary_key=True)
+    games_team1 = Column(Integer, nullable=False)
+    games_team2 = Column(Integer, nullable=False)
+
+class SchemaState(Base):
+    # Empreinte du schéma appliqué (app/database.py : prepare_database), une ligne
+    __tablename__ = "schema_state"
+
+    id = Column(Integer, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class ResourceVersion(Base):
+    # Version de chaque ressource lue par les GET conditionnels (app/core/etag.py),
+    # incrémentée dans la transaction qui la modifie : commune à tous les workers
+    __tablename__ = "resource_versions"
+
+    resource = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,56 @@
+# ============================================
+# FICHIER : backend/app/schemas/imports.py
+# ============================================
+
+from typing import List, Optional
+from pydantic import BaseModel, EmailStr, field_validator
+from app.schemas.player import PlayerBase
+import re
+
+
+class ImportRow(PlayerBase):
+    """Une ligne du CSV d'import : un compte + son joueur, `team` regroupe deux lignes en équipe"""
+    email: EmailStr
+    license_number: str
+    is_admin: bool = False
+    team: Optional[str] = None
+
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v):
+        return v.lower().strip()
+
+    @field_validator('license_number')
+    @classmethod
+    def validate_license_number(cls, v):
+        v = v.strip().upper()
+        if not v:
+            raise ValueError('Veuillez renseigner une licence')
+        if not re.match(r'^L\d{6}$', v):
+            raise ValueError('Licence invalide')
+        return v
+
+    @field_validator('team')
+    @classmethod
+    def validate_team(cls, v):
+        if v is not None:
+            v = v.strip()
+        return v or None
+
+
+class ImportRowResult(BaseModel):
+    line: int
+    email: Optional[str] = None
+    status: str  # "created", "valid" (simulation) ou "error"
+    errors: List[str] = []
+    user_id: Optional[int] = None
+    player_id: Optional[int] = None
+    team_id: Optional[int] = None
+    temporary_password: Optional[str] = None
+
+
+class ImportReport(BaseModel):
+    dry_run: bool
+    created: int
+    failed: int
+    rows: List[ImportRowResult]
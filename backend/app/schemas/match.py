@@ -3,7 +3,7 @@
 # ============================================
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, Union
+from typing import List, Optional, Union
 from enum import Enum
 from datetime import date, time, datetime
 from app.schemas.team import TeamInfo
@@ -50,6 +50,9 @@ class MatchCreate(MatchBase):
             raise ValueError('Les deux équipes doivent être différentes')
         return v
 
+class MatchBulkCreate(BaseModel):
+    matches: List[MatchCreate] = Field(..., min_length=1, max_length=200, description="Matchs créés ensemble (tout ou rien)")
+
 class MatchUpdate(BaseModel):
     match_date: Optional[date] = None
     match_time: Optional[time] = None
@@ -81,4 +84,14 @@ class MatchDetailResponse(BaseModel):
     event_id: Optional[int]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Pistes libres / occupées par créneau d'une date
+class SlotAvailability(BaseModel):
+    match_time: time
+    free_courts: List[int]
+    occupied_courts: List[int]
+
+class AvailabilityResponse(BaseModel):
+    match_date: date
+    slots: List[SlotAvailability]
@@ -2,8 +2,9 @@
 # FICHIER : backend/app/schemas/pool.py
 # ============================================
 
-from pydantic import BaseModel, field_validator
-from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
+from datetime import date, datetime, time
+from typing import List, Optional
 import re
 
 class PoolBase(BaseModel):
@@ -32,9 +33,65 @@ class PoolCreate(PoolBase):
                 raise ValueError('Chaque ID d\'équipe doit être un entier positif')
         return v
 
+class PoolTeamsMove(BaseModel):
+    team_ids: List[int] = Field(..., min_length=1)
+
+    @field_validator('team_ids')
+    @classmethod
+    def validate_team_ids(cls, v):
+        for id in v:
+            if id <= 0:
+                raise ValueError('Chaque ID d\'équipe doit être un entier positif')
+        return v
+
 class PoolResponse(PoolBase):
     id: int
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class ScheduleRequest(BaseModel):
+    pool_ids: Optional[List[int]] = Field(None, description="Poules à planifier (toutes si absent)")
+    start_date: date
+    end_date: date
+    courts: int = Field(10, ge=1, le=10, description="Nombre de pistes disponibles par événement")
+    dry_run: bool = Field(False, description="Calculer le planning sans créer les matchs")
+
+    @field_validator('end_date')
+    @classmethod
+    def validate_period(cls, v, info):
+        if 'start_date' in info.data and v < info.data['start_date']:
+            raise ValueError('La date de fin doit être postérieure à la date de début')
+        return v
+
+class ScheduledMatch(BaseModel):
+    pool_id: int
+    round: int
+    team1_id: int
+    team2_id: int
+    event_id: Optional[int] = None
+    match_date: Optional[date] = None
+    match_time: Optional[time] = None
+    court_number: Optional[int] = None
+
+class ScheduleResponse(BaseModel):
+    dry_run: bool
+    scheduled: List[ScheduledMatch]
+    unscheduled: List[ScheduledMatch]
+    created: int
+
+class StandingResponse(BaseModel):
+    rank: int
+    team_id: int
+    company: str
+    played: int
+    wins: int
+    losses: int
+    sets_won: int
+    sets_lost: int
+    set_diff: int
+    games_won: int
+    games_lost: int
+    game_diff: int
@@ -3,6 +3,7 @@
 # FICHIER : backend/app/schemas/user.py
 # ============================================
 
+from typing import Optional
 from pydantic import BaseModel, EmailStr, validator
 from app.schemas.auth import  UserResponse
 import re
@@ -34,3 +35,12 @@ class UserSelectResponse(BaseModel):
         orm_mode = True
 
 
+class UserSearchResult(BaseModel):
+    user_id: int
+    email: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    company: Optional[str] = None
+
+    class Config:
+        from_attributes = True
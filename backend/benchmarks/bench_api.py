@@ -0,0 +1,221 @@
+"""
+Benchmark : débit et latence des principaux endpoints de l'API.
+
+Génère une ligue synthétique (entreprises, joueurs, équipes, matchs) dans une
+base temporaire puis, endpoint par endpoint, envoie N requêtes avec C clients
+concurrents via le client ASGI en mémoire. Rapporte req/s et p50/p95/p99
+(instrumentation de l'application désactivée), puis le nombre de requêtes SQL
+par requête HTTP, compté dans une passe séparée et séquentielle par un
+écouteur que le harnais pose sur le moteur SQLAlchemy.
+
+    python -m benchmarks.bench_api --companies 20 --players-per-company 8 --matches 2000
+    python -m benchmarks.bench_api --only matches events-day --requests 1000
+    python -m benchmarks.bench_api --json resultats.json
+    python -m benchmarks.bench_api --compare main HEAD    # deux révisions git
+
+`--compare` extrait chaque révision dans un worktree temporaire et y lance ce
+même harnais (l'application testée est celle de la révision, le harnais celui
+de l'arbre courant), puis affiche les écarts.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from benchmarks.common import (
+    BENCH_PASSWORD, use_temp_database, create_schema, asgi_client, seed_league, percentile, revision_worktree, Timer
+)
+
+# nom -> (méthode, chemin, identité) ; le chemin est formaté avec le contexte de seed_league
+SCENARIOS = {
+    "login": ("POST", "/api/v1/auth/login", None),
+    "matches": ("GET", "/api/v1/matches/", "admin"),
+    "events": ("GET", "/api/v1/events/?start={start}&end={end}", "admin"),
+    "events-day": ("GET", "/api/v1/events/day/{start}", "admin"),
+    "my-events": ("GET", "/api/v1/events/my-events", "player"),
+    "players": ("GET", "/api/v1/players/players/", "admin"),
+    "teams": ("GET", "/api/v1/teams/teams/", "admin"),
+}
+
+
+async def run_scenario(client, method, path, headers, body, requests, concurrency):
+    latencies = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            try:
+                with Timer() as t:
+                    response = await client.request(method, path, headers=headers, json=body)
+            except Exception:
+                errors += 1  # exception remontée par l'application (le transport ASGI la propage)
+                continue
+            if response.status_code != 200:
+                errors += 1
+            latencies.append(t.ms)
+
+    began = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - began
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50": round(percentile(latencies, 50), 2),
+        "p95": round(percentile(latencies, 95), 2),
+        "p99": round(percentile(latencies, 99), 2),
+    }
+
+
+async def count_sql(client, method, path, headers, body, requests) -> Optional[float]:
+    """Requêtes SQL par requête HTTP : écouteur posé par le harnais sur les moteurs de
+    l'application (toute révision), requêtes envoyées une à une pour une attribution exacte"""
+    from sqlalchemy import event
+    from app import database
+
+    engines = [database.engine]
+    if getattr(database, "async_engine", None) is not None:
+        engines.append(database.async_engine.sync_engine)
+    statements = 0
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for _ in range(requests):
+            await client.request(method, path, headers=headers, json=body)
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return round(statements / requests, 1) if requests else None
+
+
+async def run(args) -> dict:
+    from app.main import app
+    from app.core.security import create_access_token
+
+    league = seed_league(args.companies, args.players_per_company, args.matches, days=args.days)
+    context = {"start": league["start"].isoformat(), "end": league["end"].isoformat()}
+    identities = {
+        "admin": {"Authorization": f"Bearer {create_access_token({'sub': str(league['admin_id'])})}"},
+        "player": {"Authorization": f"Bearer {create_access_token({'sub': str(league['player_user_id'])})}"},
+    }
+    login = {"email": league["admin_email"], "password": BENCH_PASSWORD}
+
+    results = {}
+    async with asgi_client(app) as client:
+        for name in args.only or SCENARIOS:
+            method, path, identity = SCENARIOS[name]
+            path = path.format(**context)
+            headers = identities.get(identity, {})
+            body = login if name == "login" else None
+            requests = args.login_requests if name == "login" else args.requests
+            # Échauffement (caches, compilation des requêtes) hors mesure
+            await run_scenario(client, method, path, headers, body, min(requests, args.warmup), args.concurrency)
+            results[name] = await run_scenario(client, method, path, headers, body, requests, args.concurrency)
+            results[name]["sql"] = await count_sql(client, method, path, headers, body, min(requests, args.sql_requests))
+    return results
+
+
+def report(results: dict, title: str) -> None:
+    print(f"--- {title}")
+    print(f"{'endpoint':<12} {'n':>6} {'err':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'sql/req':>8}")
+    for name, r in results.items():
+        sql = "-" if r["sql"] is None else f"{r['sql']:.1f}"
+        print(f"{name:<12} {r['requests']:>6} {r['errors']:>5} {r['rps']:>9.1f} "
+              f"{r['p50']:>9.1f} {r['p95']:>9.1f} {r['p99']:>9.1f} {sql:>8}")
+
+
+def report_comparison(base: dict, head: dict, base_rev: str, head_rev: str) -> None:
+    print(f"--- {base_rev} -> {head_rev} (écart relatif ; req/s : + = mieux, latences : - = mieux)")
+    print(f"{'endpoint':<12} {'req/s':>18} {'p50 ms':>18} {'p95 ms':>18} {'p99 ms':>18} {'sql/req':>12}")
+
+    def delta(key, a, b):
+        if a[key] is None or b[key] is None:
+            return "-"
+        change = f"{(b[key] - a[key]) / a[key] * 100:+.0f}%" if a[key] else ""
+        return f"{a[key]:.1f}>{b[key]:.1f} {change}"
+
+    for name in base:
+        if name in head:
+            a, b = base[name], head[name]
+            print(f"{name:<12} " + " ".join(f"{delta(key, a, b):>18}" for key in ("rps", "p50", "p95", "p99"))
+                  + f" {delta('sql', a, b):>12}")
+
+
+def run_revision(rev: str, args, output: str) -> dict:
+    """Lance le benchmark sur l'application de la révision `rev` (worktree temporaire)"""
+    with revision_worktree(rev) as app_dir:
+        command = [sys.executable, "-m", "benchmarks.bench_api", "--app-dir", app_dir, "--json", output,
+                   *forwarded_arguments(args)]
+        subprocess.run(command, check=True)
+    with open(output) as f:
+        return json.load(f)
+
+
+def forwarded_arguments(args) -> list:
+    forwarded = []
+    for option in ("companies", "players_per_company", "matches", "days", "requests", "login_requests",
+                   "concurrency", "warmup", "sql_requests"):
+        forwarded += [f"--{option.replace('_', '-')}", str(getattr(args, option))]
+    if args.only:
+        forwarded += ["--only", *args.only]
+    return forwarded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=10)
+    parser.add_argument("--players-per-company", type=int, default=8)
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--requests", type=int, default=500, help="requêtes mesurées par endpoint")
+    parser.add_argument("--login-requests", type=int, default=50, help="connexions mesurées (bcrypt)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--sql-requests", type=int, default=20, help="requêtes de la passe de comptage SQL")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS))
+    parser.add_argument("--json", help="écrit les résultats dans ce fichier")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"), help="compare deux révisions git")
+    parser.add_argument("--app-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        # Chaque révision dans un process neuf (la configuration est lue à l'import)
+        outputs = tempfile.mkdtemp(prefix="padel-bench-out-")
+        base, head = (run_revision(rev, args, os.path.join(outputs, f"{i}.json")) for i, rev in enumerate(args.compare))
+        report_comparison(base, head, *args.compare)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({args.compare[0]: base, args.compare[1]: head}, f, indent=2)
+        return
+
+    if args.app_dir:
+        sys.path.insert(0, args.app_dir)
+    use_temp_database()
+    os.environ["INSTRUMENTATION_ENABLED"] = "false"  # mesure à l'identique entre révisions
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    create_schema()
+
+    results = asyncio.run(run(args))
+    report(results, f"{args.app_dir or 'arbre courant'}  concurrence={args.concurrency}  "
+                    f"matchs={args.matches}  joueurs={args.companies * args.players_per_company}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark : lectures planning / matchs, chemin synchrone vs asynchrone.
+
+Lance le même scénario (N clients concurrents sur /matches/, /events/ et
+/events/day/{day}) dans deux process, avec ASYNC_DB_ENABLED=false puis true.
+
+    python -m benchmarks.bench_async_reads --concurrency 100 --requests 2000
+    python -m benchmarks.bench_async_reads --mode async   # un seul mode
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import use_temp_database, create_schema, asgi_client, seed_schedule, summarize, Timer
+
+
+async def run(args):
+    from app.main import app
+    from app.core.security import create_access_token
+
+    admin_id, start, end = seed_schedule(args.matches)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin_id)})}"}
+    paths = [
+        "/api/v1/matches/",
+        f"/api/v1/events/?start={start.isoformat()}&end={end.isoformat()}",
+        f"/api/v1/events/day/{start.isoformat()}",
+    ]
+    latencies = {path: [] for path in paths}
+    errors = 0
+    remaining = args.requests
+
+    async with asgi_client(app) as client:
+        async def worker(offset):
+            nonlocal remaining, errors
+            i = offset
+            while remaining > 0:
+                remaining -= 1
+                path = paths[i % len(paths)]
+                i += 1
+                with Timer() as t:
+                    response = await client.get(path, headers=headers)
+                if response.status_code != 200:
+                    errors += 1
+                latencies[path].append(t.ms)
+
+        began = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(args.concurrency)))
+        elapsed = time.perf_counter() - began
+
+    mode = "async" if os.environ.get("ASYNC_DB_ENABLED") == "true" else "sync"
+    total = [ms for values in latencies.values() for ms in values]
+    print(f"--- mode={mode}  concurrence={args.concurrency}  erreurs={errors}")
+    print(summarize("total", total, elapsed))
+    for path, values in latencies.items():
+        print(summarize(path.split("?")[0], values, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["sync", "async"])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=1500)
+    parser.add_argument("--matches", type=int, default=300)
+    args = parser.parse_args()
+
+    if args.mode is None:
+        # Chaque mode dans un process neuf (la configuration est lue à l'import)
+        for mode in ("sync", "async"):
+            subprocess.run([sys.executable, "-m", "benchmarks.bench_async_reads", "--mode", mode,
+                            "--concurrency", str(args.concurrency), "--requests", str(args.requests),
+                            "--matches", str(args.matches)], check=True)
+        return
+
+    os.environ["ASYNC_DB_ENABLED"] = "true" if args.mode == "async" else "false"
+    use_temp_database()
+    create_schema()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark : rafale de connexions (/auth/login) et latence des autres endpoints.
+
+Mesure le débit de connexions, le nombre de refus 503 (pool bcrypt saturé)
+et la latence d'un endpoint de lecture interrogé pendant la rafale.
+
+Usage (depuis backend/) :
+    python -m benchmarks.bench_login --users 50 --logins 300 --concurrency 60
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import use_temp_database, create_schema, asgi_client, summarize, Timer
+
+
+def seed_users(count: int):
+    from app.database import SessionLocal
+    from app.models.models import User
+    from app.core.security import get_password_hash
+
+    # Un seul hash pour tous les comptes : le coût bcrypt est le même à la vérification
+    password_hash = get_password_hash("BenchP@ssw0rd123")
+    db = SessionLocal()
+    try:
+        db.add_all([
+            User(email=f"bench{i}@padel.com", password_hash=password_hash, is_active=True)
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run(args):
+    from app.main import app
+
+    login_latencies, read_latencies = [], []
+    statuses = {}
+    done = asyncio.Event()
+
+    async with asgi_client(app) as client:
+        queue = asyncio.Queue()
+        for i in range(args.logins):
+            queue.put_nowait(i)
+
+        async def login_worker():
+            while not queue.empty():
+                i = queue.get_nowait()
+                with Timer() as t:
+                    response = await client.post("/api/v1/auth/login", json={
+                        "email": f"bench{i % args.users}@padel.com",
+                        "password": "BenchP@ssw0rd123"
+                    })
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code == 200:
+                    login_latencies.append(t.ms)
+
+        async def reader():
+            while not done.is_set():
+                with Timer() as t:
+                    await client.get(args.read_path)
+                read_latencies.append(t.ms)
+
+        # Référence : latence de lecture sans charge
+        for _ in range(50):
+            with Timer() as t:
+                await client.get(args.read_path)
+            read_latencies.append(t.ms)
+        idle = list(read_latencies)
+        read_latencies.clear()
+
+        reader_task = asyncio.create_task(reader())
+        start = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await reader_task
+
+    print(f"Rafale de {args.logins} connexions, concurrence {args.concurrency}")
+    print(f"Statuts : {dict(sorted(statuses.items()))}")
+    print(summarize("POST /auth/login (200)", login_latencies, elapsed))
+    print(summarize(f"GET {args.read_path} (repos)", idle, sum(idle) / 1000))
+    print(summarize(f"GET {args.read_path} (rafale)", read_latencies, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--logins", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=60)
+    parser.add_argument("--read-path", default="/api/v1/players/")
+    args = parser.parse_args()
+
+    use_temp_database()
+    create_schema()
+    seed_users(args.users)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark : génération automatique du planning des poules.
+
+Crée `--teams` équipes réparties en `--pools` poules et `--events` événements,
+puis mesure le calcul seul (plan_schedule) et la génération complète via
+generate_schedule (simulation puis création en une transaction).
+
+    python -m benchmarks.bench_schedule --teams 60 --pools 6 --courts 10
+    python -m benchmarks.bench_schedule --teams 50 --pools 1 --events 200
+"""
+
+import argparse
+from collections import Counter
+from datetime import date, time as dtime, timedelta
+
+from benchmarks.common import use_temp_database, create_schema, Timer
+
+
+def seed_pools(teams: int, pools: int, events: int):
+    """Crée les joueurs, équipes, poules et événements ; retourne les ids des poules"""
+    from app.database import SessionLocal
+    from app.models.models import User, Player, Team, Pool, Event
+
+    db = SessionLocal()
+    try:
+        pool_rows = [Pool(name=f"Poule {i}") for i in range(pools)]
+        db.add_all(pool_rows)
+        users = [User(email=f"s{i}@bench.com", password_hash="x", is_active=True) for i in range(teams * 2)]
+        db.add_all(users)
+        db.flush()
+        players = [
+            Player(first_name="Joueur", last_name=f"N{i}", company="Bench", license_number=f"L{i:06d}", user_id=user.id)
+            for i, user in enumerate(users)
+        ]
+        db.add_all(players)
+        db.flush()
+        db.add_all([
+            Team(company="Bench", player1_id=players[2 * i].id, player2_id=players[2 * i + 1].id,
+                 pool_id=pool_rows[i % pools].id)
+            for i in range(teams)
+        ])
+        start = date.today() + timedelta(days=1)
+        db.add_all([Event(event_date=start + timedelta(days=d), start_time=dtime(19, 0)) for d in range(events)])
+        db.commit()
+        return [pool.id for pool in pool_rows], start, start + timedelta(days=events - 1)
+    finally:
+        db.close()
+
+
+def check(scheduled, courts):
+    """Vérifie l'absence de conflit (pistes par créneau, équipe une fois par créneau)"""
+    per_slot = Counter((m.match_date, m.match_time) for m in scheduled)
+    per_team = Counter((m.match_date, m.match_time, t) for m in scheduled for t in (m.team1_id, m.team2_id))
+    assert not per_slot or max(per_slot.values()) <= courts
+    assert not per_team or max(per_team.values()) == 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=60)
+    parser.add_argument("--pools", type=int, default=6)
+    parser.add_argument("--courts", type=int, default=10)
+    parser.add_argument("--events", type=int, default=60)
+    args = parser.parse_args()
+
+    use_temp_database()
+    create_schema()
+    from app.database import SessionLocal
+    from app.crud.schedule import plan_schedule, pool_teams, generate_schedule
+    from app.schemas.pool import ScheduleRequest
+
+    pool_ids, start, end = seed_pools(args.teams, args.pools, args.events)
+    db = SessionLocal()
+    try:
+        pools = pool_teams(db, pool_ids)
+        slots = [(i, start + timedelta(days=i), dtime(19, 0)) for i in range(args.events)]
+        with Timer() as t:
+            scheduled, unscheduled = plan_schedule(pools, slots, args.courts)
+        check(scheduled, args.courts)
+        used = len({(m.match_date, m.match_time) for m in scheduled})
+        print(f"--- {args.teams} équipes, {args.pools} poules, {args.courts} pistes, {args.events} événements")
+        print(f"{'plan_schedule':<28} {t.ms:8.1f} ms  placés={len(scheduled)}  non placés={len(unscheduled)}  créneaux utilisés={used}")
+
+        request = dict(pool_ids=pool_ids, start_date=start, end_date=end, courts=args.courts)
+        with Timer() as t:
+            result = generate_schedule(db, ScheduleRequest(dry_run=True, **request))
+        print(f"{'generate_schedule (dry_run)':<28} {t.ms:8.1f} ms  placés={len(result.scheduled)}")
+
+        with Timer() as t:
+            result = generate_schedule(db, ScheduleRequest(dry_run=False, **request))
+        check(result.scheduled, args.courts)
+        print(f"{'generate_schedule (création)':<28} {t.ms:8.1f} ms  créés={result.created}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
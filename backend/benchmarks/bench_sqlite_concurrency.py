@@ -0,0 +1,77 @@
+"""
+Benchmark : lectures concurrentes de GET /events pendant des saisies de scores.
+
+Des lecteurs interrogent le planning en parallèle pendant qu'un administrateur
+termine les matchs un par un (PATCH /matches/{id}). À lancer avec les deux
+modes de journal pour comparer :
+
+    python -m benchmarks.bench_sqlite_concurrency --journal-mode DELETE
+    python -m benchmarks.bench_sqlite_concurrency --journal-mode WAL
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import use_temp_database, create_schema, asgi_client, seed_schedule, summarize, Timer
+
+
+async def run(args, admin_id, start, end):
+    from app.main import app
+    from app.core.security import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin_id)})}"}
+    read_path = f"/api/v1/events/?start={start.isoformat()}&end={end.isoformat()}"
+    read_latencies, write_latencies, errors = [], [], 0
+    writing = True
+
+    async with asgi_client(app) as client:
+        async def reader():
+            nonlocal errors
+            while writing:
+                with Timer() as t:
+                    response = await client.get(read_path, headers=headers)
+                if response.status_code != 200:
+                    errors += 1
+                read_latencies.append(t.ms)
+
+        async def writer():
+            nonlocal writing, errors
+            for match_id in range(1, args.updates + 1):
+                with Timer() as t:
+                    response = await client.patch(f"/api/v1/matches/{match_id}", headers=headers, json={
+                        "status": "TERMINE", "score_team1": "6-4, 6-3", "score_team2": "4-6, 3-6"
+                    })
+                if response.status_code != 200:
+                    errors += 1
+                write_latencies.append(t.ms)
+            writing = False
+
+        began = time.perf_counter()
+        await asyncio.gather(writer(), *(reader() for _ in range(args.readers)))
+        elapsed = time.perf_counter() - began
+
+    print(f"journal_mode={os.environ['SQLITE_JOURNAL_MODE']}  lecteurs={args.readers}  "
+          f"matchs={args.matches}  mises à jour={args.updates}  erreurs={errors}")
+    print(summarize("GET /events", read_latencies, elapsed))
+    print(summarize("PATCH /matches/{id}", write_latencies, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--journal-mode", default="WAL", choices=["WAL", "DELETE"])
+    parser.add_argument("--readers", type=int, default=10)
+    parser.add_argument("--matches", type=int, default=300)
+    parser.add_argument("--updates", type=int, default=50)
+    args = parser.parse_args()
+
+    os.environ["SQLITE_JOURNAL_MODE"] = args.journal_mode
+    use_temp_database()
+    create_schema()
+    admin_id, start, end = seed_schedule(args.matches)
+    asyncio.run(run(args, admin_id, start, end))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark : démarrage à froid de l'API (nouveau process, jusqu'à la première réponse).
+
+Chaque démarrage est un process neuf qui mesure : import de app.main, création
+de l'application, démarrage (lifespan : vérification du schéma, préchargement
+de l'occupation des pistes) et première réponse (/health). Le premier
+démarrage d'une base applique le schéma, les suivants ne font que le vérifier.
+
+    python -m benchmarks.bench_startup --runs 10
+    python -m benchmarks.bench_startup --matches 200000           # base peuplée (scripts.generate_league)
+    python -m benchmarks.bench_startup --compare main HEAD        # deux révisions git
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from statistics import median
+
+from benchmarks.common import use_temp_database, asgi_client, revision_worktree
+
+PHASES = ("import", "create_app", "startup", "first_response", "total")
+
+
+async def measure() -> dict:
+    """Démarrage mesuré dans ce process (appelé avec --child)"""
+    began = time.perf_counter()
+    marks = {}
+    import app.main as main_module
+    marks["import"] = time.perf_counter()
+    # Révisions antérieures à create_app() : l'application est construite à l'import
+    app = main_module.create_app() if hasattr(main_module, "create_app") else main_module.app
+    marks["create_app"] = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        marks["startup"] = time.perf_counter()
+        async with asgi_client(app) as client:
+            response = await client.get("/health")
+            response.raise_for_status()
+        marks["first_response"] = time.perf_counter()
+
+    durations, previous = {}, began
+    for phase in PHASES[:-1]:
+        durations[phase] = (marks[phase] - previous) * 1000
+        previous = marks[phase]
+    durations["total"] = (previous - began) * 1000
+    return durations
+
+
+def seed(args) -> None:
+    """Base de la mesure : vide, ou ligue synthétique de `--matches` matchs"""
+    if not args.matches:
+        return
+    from app.database import engine, prepare_database
+    from scripts.generate_league import generate_league
+
+    prepare_database()
+    with engine.begin() as connection:
+        generate_league(connection, companies=args.matches // 1000 + 2, players_per_company=10, pools=4,
+                        matches=args.matches, password_hash="x", seed=1)
+
+
+def boot_times(args, app_dir: str = None) -> list:
+    """Démarre `--runs` process successifs sur une même base neuve, retourne leurs mesures"""
+    env = dict(os.environ, DATABASE_URL=use_temp_database(), LOG_LEVEL="ERROR")
+    subprocess.run([sys.executable, "-m", "benchmarks.bench_startup", "--seed-only", "--matches", str(args.matches)],
+                   env=env, check=True)
+    command = [sys.executable, "-m", "benchmarks.bench_startup", "--child"]
+    if app_dir:
+        command += ["--app-dir", app_dir]
+    runs = []
+    for _ in range(args.runs):
+        output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return runs
+
+
+def summarize(runs: list) -> dict:
+    """Premier démarrage (schéma appliqué si base vide) et médiane des redémarrages"""
+    restarts = runs[1:] or runs
+    return {
+        "premier": runs[0],
+        "redémarrage": {phase: median(run[phase] for run in restarts) for phase in PHASES},
+    }
+
+
+def report(summary: dict, title: str) -> None:
+    print(f"--- {title}")
+    print(f"{'':<14}" + "".join(f"{phase + ' ms':>18}" for phase in PHASES))
+    for label, values in summary.items():
+        print(f"{label:<14}" + "".join(f"{values[phase]:>18.1f}" for phase in PHASES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="démarrages successifs (le premier sur base neuve)")
+    parser.add_argument("--matches", type=int, default=0, help="matchs générés avant les démarrages")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"), help="compare deux révisions git")
+    parser.add_argument("--json", help="écrit les résultats dans ce fichier")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--seed-only", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--app-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        if args.app_dir:
+            sys.path.insert(0, args.app_dir)
+        print(json.dumps(asyncio.run(measure())))
+        return
+    if args.seed_only:
+        seed(args)
+        return
+
+    if args.compare:
+        results = {}
+        for rev in args.compare:
+            with revision_worktree(rev) as app_dir:
+                results[rev] = summarize(boot_times(args, app_dir))
+            report(results[rev], f"{rev}  démarrages={args.runs}  matchs={args.matches}")
+    else:
+        results = summarize(boot_times(args))
+        report(results, f"arbre courant  démarrages={args.runs}  matchs={args.matches}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
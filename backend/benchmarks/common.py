@@ -0,0 +1,205 @@
+"""
+Outils communs aux benchmarks (base temporaire, client ASGI, statistiques).
+
+Les benchmarks doivent appeler `use_temp_database()` AVANT d'importer `app`,
+car la configuration est lue à l'import.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, time as dtime, timedelta
+
+
+def use_temp_database(name: str = "bench.db") -> str:
+    """Pointe DATABASE_URL vers une base SQLite jetable et la retourne"""
+    path = os.path.join(tempfile.mkdtemp(prefix="padel-bench-"), name)
+    url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    return url
+
+
+@contextmanager
+def revision_worktree(rev: str):
+    """Extrait la révision git `rev` dans un worktree temporaire ; fournit le dossier backend/ correspondant"""
+    root = subprocess.run(["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True).stdout.strip()
+    worktree = tempfile.mkdtemp(prefix="padel-bench-rev-")
+    subprocess.run(["git", "-C", root, "worktree", "add", "--detach", worktree, rev], check=True, capture_output=True)
+    try:
+        yield os.path.join(worktree, os.path.relpath(os.getcwd(), root))
+    finally:
+        subprocess.run(["git", "-C", root, "worktree", "remove", "--force", worktree], check=True)
+        shutil.rmtree(worktree, ignore_errors=True)
+
+
+def create_schema():
+    """Crée le schéma de la base temporaire (révisions antérieures au démarrage par lifespan : import de app.main)"""
+    try:
+        from app.database import prepare_database
+    except ImportError:
+        import app.main  # noqa: F401
+        return
+    prepare_database()
+
+
+def asgi_client(app):
+    """Client HTTP en mémoire sur l'application ASGI (pas de réseau)"""
+    import httpx
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+
+def seed_schedule(matches: int):
+    """Crée un admin, 8 équipes, un événement par jour sur 30 jours et `matches` matchs.
+
+    Retourne (id de l'admin, premier jour, dernier jour).
+    """
+    from app.database import SessionLocal
+    from app.models.models import User, Player, Team, Event, Match
+
+    db = SessionLocal()
+    try:
+        admin = User(email="admin@bench.com", password_hash="x", is_admin=True, is_active=True)
+        db.add(admin)
+        players = []
+        for i in range(16):
+            user = User(email=f"p{i}@bench.com", password_hash="x", is_active=True)
+            db.add(user)
+            db.flush()
+            players.append(Player(
+                first_name="Joueur", last_name=f"N{i}", company="Bench",
+                license_number=f"L{i:06d}", user_id=user.id
+            ))
+        db.add_all(players)
+        db.flush()
+        teams = [Team(company="Bench", player1_id=players[2 * i].id, player2_id=players[2 * i + 1].id) for i in range(8)]
+        db.add_all(teams)
+        db.flush()
+
+        start = date.today()
+        events = [Event(event_date=start + timedelta(days=d), start_time=dtime(19, 0)) for d in range(30)]
+        db.add_all(events)
+        db.flush()
+        for i in range(matches):
+            event = events[i % len(events)]
+            db.add(Match(
+                team1_id=teams[i % 8].id, team2_id=teams[(i + 1) % 8].id, event_id=event.id,
+                match_date=event.event_date, match_time=dtime(19, 0),
+                court_number=1 + (i // len(events)) % 10, status="A_VENIR"
+            ))
+        db.commit()
+        return admin.id, start, start + timedelta(days=29)
+    finally:
+        db.close()
+
+
+BENCH_PASSWORD = "BenchP@ssw0rd123"
+
+
+def letters(number: int) -> str:
+    """Nom alphabétique unique (les noms de joueurs n'acceptent que des lettres) : 0 -> "Aa", 27 -> "Ab"..."""
+    name = ""
+    while True:
+        number, rest = divmod(number, 26)
+        name += "abcdefghijklmnopqrstuvwxyz"[rest]
+        if not number:
+            return "A" + name
+
+
+def seed_league(companies: int, players_per_company: int, matches: int, days: int = 30, courts: int = 10):
+    """Génère une ligue synthétique : un admin, `companies` entreprises de
+    `players_per_company` joueurs (comptes actifs, équipes de deux par entreprise),
+    un événement par jour sur `days` jours et `matches` matchs répartis sur les
+    pistes et créneaux de ces jours.
+
+    Tous les comptes partagent le mot de passe BENCH_PASSWORD (un seul hash bcrypt).
+    Retourne un dict : admin_id, admin_email, player_user_id, start, end.
+    """
+    from app.database import SessionLocal
+    from app.models.models import User, Player, Team, Event, Match
+    from app.core.security import get_password_hash
+
+    password_hash = get_password_hash(BENCH_PASSWORD)
+    slots = [dtime(hour, 0) for hour in range(9, 22)]
+    db = SessionLocal()
+    try:
+        admin = User(email="admin@bench.com", password_hash=password_hash, is_admin=True, is_active=True)
+        db.add(admin)
+        users = [
+            User(email=f"c{c}p{p}@bench.com", password_hash=password_hash, is_active=True)
+            for c in range(companies) for p in range(players_per_company)
+        ]
+        db.add_all(users)
+        db.flush()
+        players = [
+            Player(first_name="Joueur", last_name=letters(i), company=f"Entreprise {letters(i // players_per_company)}",
+                   license_number=f"L{i:06d}", user_id=user.id)
+            for i, user in enumerate(users)
+        ]
+        db.add_all(players)
+        db.flush()
+        teams = [
+            Team(company=players[i].company, player1_id=players[i].id, player2_id=players[i + 1].id)
+            for c in range(companies)
+            for i in range(c * players_per_company, (c + 1) * players_per_company - 1, 2)
+        ]
+        db.add_all(teams)
+        db.flush()
+
+        start = date.today()
+        events = [Event(event_date=start + timedelta(days=d), start_time=slots[0]) for d in range(days)]
+        db.add_all(events)
+        db.flush()
+        per_day = len(slots) * courts
+        for i in range(matches):
+            event = events[(i // per_day) % days]
+            slot = i % per_day
+            db.add(Match(
+                team1_id=teams[i % len(teams)].id, team2_id=teams[(i + 1) % len(teams)].id, event_id=event.id,
+                match_date=event.event_date, match_time=slots[slot // courts],
+                court_number=1 + slot % courts, status="A_VENIR"
+            ))
+            if i % 1000 == 999:
+                db.flush()
+        db.commit()
+        return {
+            "admin_id": admin.id, "admin_email": admin.email, "player_user_id": players[0].user_id,
+            "start": start, "end": start + timedelta(days=days - 1),
+        }
+    finally:
+        db.close()
+
+
+def percentile(values, pct: float) -> float:
+    """Percentile (méthode du rang le plus proche), en millisecondes si values en ms"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(label: str, latencies_ms, elapsed_s: float) -> str:
+    count = len(latencies_ms)
+    rate = count / elapsed_s if elapsed_s else 0.0
+    return (
+        f"{label:<28} n={count:<6} {rate:8.1f} req/s  "
+        f"p50={percentile(latencies_ms, 50):7.1f} ms  "
+        f"p95={percentile(latencies_ms, 95):7.1f} ms  "
+        f"p99={percentile(latencies_ms, 99):7.1f} ms"
+    )
+
+
+class Timer:
+    """Chronomètre simple : `with Timer() as t: ...` puis `t.ms`"""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.ms = (time.perf_counter() - self.start) * 1000
+        return False
@@ -0,0 +1,297 @@
+"""
+Génère une ligue synthétique de taille quelconque (tests de charge, démos).
+Usage: python -m scripts.generate_league --companies 50 --players-per-company 12 --pools 8 --matches 100000
+
+Crée des entreprises, leurs joueurs (un compte chacun, même mot de passe),
+des équipes de deux joueurs d'une même entreprise réparties en poules, puis
+une saison de matchs en round-robin par poule : un événement par jour, des
+créneaux horaires x pistes. Les matchs passés sont terminés (scores en 2 ou
+3 sets, quelques annulés), les suivants à venir.
+
+Les insertions passent par des INSERT Core groupés (executemany, identifiants
+attribués par le script, un seul hash bcrypt) : 1M de matchs en environ
+40 s sur SQLite. Les tables dérivées (team_members, search_documents,
+match_sets, team_standings) sont tenues à jour pour les lignes générées.
+Les données existantes ne sont pas modifiées et la saison est placée après
+leur dernier jour planifié ; redémarrer l'API ensuite
+(index d'occupation et caches propres au process).
+"""
+
+import argparse
+import math
+import random
+import time
+from datetime import date, time as dtime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Connection
+
+from app.core.etag import ALL_RESOURCES, bump_resource_versions
+from app.crud.search import sync_users
+from app.crud.standings import rebuild_standings
+from app.crud.team_members import sync_teams
+from app.models.models import Event, Match, MatchSet, Player, Pool, Team, User
+
+FIRST_NAMES = (
+    "Camille", "Léa", "Manon", "Chloé", "Emma", "Inès", "Julie", "Sarah", "Claire", "Lucie",
+    "Lucas", "Hugo", "Louis", "Jules", "Arthur", "Nathan", "Thomas", "Antoine", "Paul", "Maxime",
+)
+LAST_NAMES = (
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+    "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier",
+)
+COMPANY_NAMES = (
+    "Airbus", "Orange", "Capgemini", "Thales", "Safran", "Decathlon", "Michelin", "Renault",
+    "Sopra Steria", "Atos", "Dassault", "Alstom", "Veolia", "Legrand", "Schneider", "Valeo",
+)
+# Scores d'un set gagné (jeux du vainqueur, jeux du perdant)
+SET_SCORES = ((6, 0), (6, 1), (6, 2), (6, 3), (6, 4), (7, 5), (7, 6))
+# Taille des listes IN (...) des synchronisations des tables dérivées
+SYNC_CHUNK = 500
+
+
+def next_id(connection: Connection, model) -> int:
+    return (connection.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def chunks(values: List[int], size: int = SYNC_CHUNK) -> Iterator[List[int]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def insert_rows(connection: Connection, model, rows: Iterable[dict], batch_size: int) -> int:
+    """INSERT groupé (executemany) par paquets de `batch_size` lignes"""
+    count, batch = 0, []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            connection.execute(insert(model.__table__), batch)
+            count, batch = count + len(batch), []
+    if batch:
+        connection.execute(insert(model.__table__), batch)
+        count += len(batch)
+    return count
+
+
+def license_numbers(connection: Connection) -> Iterator[str]:
+    """Numéros de licence L000001... libres (absents de la base)"""
+    taken = set(connection.execute(select(Player.license_number)).scalars())
+    for number in range(1, 1_000_000):
+        license_number = f"L{number:06d}"
+        if license_number not in taken:
+            yield license_number
+    raise ValueError("Plus de numéro de licence disponible (L000001 à L999999)")
+
+
+def round_robin(team_ids: List[int]) -> List[List[Tuple[int, int]]]:
+    """Journées d'un round-robin (méthode du cercle) : chaque équipe joue une fois par journée"""
+    teams = list(team_ids) + ([None] if len(team_ids) % 2 else [])
+    rounds = []
+    for _ in range(len(teams) - 1):
+        half = len(teams) // 2
+        pairs = [(teams[i], teams[-1 - i]) for i in range(half)]
+        rounds.append([pair for pair in pairs if None not in pair])
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+    return rounds
+
+
+def matchdays(groups: List[List[int]]) -> Iterator[List[Tuple[int, int]]]:
+    """Journées de toutes les poules en parallèle, répétées (aller, retour...) indéfiniment"""
+    schedules = [round_robin(group) for group in groups if len(group) >= 2]
+    if not schedules:
+        raise ValueError("Il faut au moins une poule de deux équipes")
+    leg = 0
+    while True:
+        for index in range(max(len(schedule) for schedule in schedules)):
+            day = [pair for schedule in schedules for pair in schedule[index % len(schedule)]]
+            yield day if leg % 2 == 0 else [(team2, team1) for team1, team2 in day]
+        leg += 1
+
+
+def random_score(rng: random.Random) -> Tuple[List[Tuple[int, int]], str, str]:
+    """Sets (jeux équipe 1, jeux équipe 2) d'un match en 2 ou 3 sets, et les deux scores texte"""
+    team1_wins = rng.random() < 0.5
+    outcomes = [True, True] if rng.random() < 0.6 else rng.choice(([True, False, True], [False, True, True]))
+    sets = []
+    for winner_side_won in outcomes:
+        won, lost = rng.choice(SET_SCORES)
+        team1_won_set = winner_side_won == team1_wins
+        sets.append((won, lost) if team1_won_set else (lost, won))
+    score_team1 = ", ".join(f"{games1}-{games2}" for games1, games2 in sets)
+    score_team2 = ", ".join(f"{games2}-{games1}" for games1, games2 in sets)
+    return sets, score_team1, score_team2
+
+
+def generate_league(connection: Connection, companies: int = 10, players_per_company: int = 8, pools: int = 4,
+                    matches: int = 1000, courts: int = 10, hours: Tuple[int, int] = (9, 21),
+                    finished_ratio: float = 0.5, cancelled_ratio: float = 0.02, password_hash: str = "",
+                    email_domain: str = "league.test", batch_size: int = 10000, today: Optional[date] = None,
+                    seed: Optional[int] = None) -> Dict[str, int]:
+    """
+    Insère une ligue synthétique sur `connection` (sans commit) et retourne le
+    nombre de lignes créées par table. Voir la docstring du module.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    slots = [dtime(hour, 0) for hour in range(hours[0], hours[1] + 1)]
+    slots_per_day = len(slots) * courts
+
+    # Comptes et joueurs (identifiants attribués ici : pas de RETURNING)
+    first_user, first_player = next_id(connection, User), next_id(connection, Player)
+    licenses = license_numbers(connection)
+    players = []  # (player_id, user_id, entreprise)
+    company_names = [
+        f"{COMPANY_NAMES[c % len(COMPANY_NAMES)]} {c // len(COMPANY_NAMES) + 1}" for c in range(companies)
+    ]
+    for company in company_names:
+        for _ in range(players_per_company):
+            players.append((first_player + len(players), first_user + len(players), company))
+
+    counts = {}
+    counts["users"] = insert_rows(connection, User, (
+        {"id": user_id, "email": f"joueur{user_id}@{email_domain}", "password_hash": password_hash,
+         "is_admin": False, "is_active": True, "must_change_password": False}
+        for _, user_id, _ in players
+    ), batch_size)
+    counts["players"] = insert_rows(connection, Player, (
+        {"id": player_id, "first_name": rng.choice(FIRST_NAMES), "last_name": rng.choice(LAST_NAMES),
+         "company": company, "license_number": next(licenses), "user_id": user_id,
+         "birth_date": date(1965, 1, 1) + timedelta(days=rng.randrange(365 * 35))}
+        for player_id, user_id, company in players
+    ), batch_size)
+
+    # Poules puis équipes de deux joueurs d'une même entreprise, réparties entre les poules
+    first_pool = next_id(connection, Pool)
+    pool_ids = [first_pool + n for n in range(pools)]
+    counts["pools"] = insert_rows(connection, Pool, ({"id": pool_id, "name": f"Poule {pool_id}"} for pool_id in pool_ids),
+                                  batch_size)
+    first_team = next_id(connection, Team)
+    pairs = [
+        (players[i], players[i + 1])
+        for c in range(companies)
+        for i in range(c * players_per_company, (c + 1) * players_per_company - 1, 2)
+    ]
+    rng.shuffle(pairs)
+    teams = [
+        {"id": first_team + n, "company": player1[2], "player1_id": player1[0], "player2_id": player2[0],
+         "pool_id": pool_ids[n % pools] if pools else None}
+        for n, (player1, player2) in enumerate(pairs)
+    ]
+    counts["teams"] = insert_rows(connection, Team, teams, batch_size)
+    groups = [[team["id"] for team in teams if team["pool_id"] == pool_id] for pool_id in pool_ids] if pools \
+        else [[team["id"] for team in teams]]
+
+    # Saison : environ `finished_ratio` des journées avant aujourd'hui
+    season_days = math.ceil(matches / slots_per_day)
+    start = today - timedelta(days=math.ceil(season_days * finished_ratio))
+    # Base non vide : la saison commence après le dernier jour déjà planifié (pas de piste
+    # réservée deux fois, pas de second événement à une même date)
+    latest = max(
+        (day for day in (connection.execute(select(func.max(Match.match_date))).scalar(),
+                         connection.execute(select(func.max(Event.event_date))).scalar()) if day),
+        default=None,
+    )
+    if latest is not None and latest >= start:
+        start = latest + timedelta(days=1)
+    first_event, first_match = next_id(connection, Event), next_id(connection, Match)
+    events, match_rows, set_rows = [], [], []
+    counts.update(events=0, matches=0, finished=0, match_sets=0)
+
+    def flush():
+        counts["events"] += insert_rows(connection, Event, events, batch_size)
+        counts["matches"] += insert_rows(connection, Match, match_rows, batch_size)
+        counts["match_sets"] += insert_rows(connection, MatchSet, set_rows, batch_size)
+        events.clear()
+        match_rows.clear()
+        set_rows.clear()
+
+    position, last_day = 0, -1
+    days = matchdays(groups)
+    while counts["matches"] + len(match_rows) < matches:
+        # Chaque journée commence sur un nouveau créneau : une équipe ne joue pas deux fois à la même heure
+        position = math.ceil(position / courts) * courts
+        for team1_id, team2_id in next(days):
+            if counts["matches"] + len(match_rows) >= matches:
+                break
+            day, slot = divmod(position, slots_per_day)
+            match_date = start + timedelta(days=day)
+            if day != last_day:
+                events.append({"id": first_event + day, "event_date": match_date, "start_time": slots[0]})
+                last_day = day
+            match_id = first_match + counts["matches"] + len(match_rows)
+            row = {"id": match_id, "team1_id": team1_id, "team2_id": team2_id, "event_id": first_event + day,
+                   "match_date": match_date, "match_time": slots[slot // courts], "court_number": slot % courts + 1,
+                   "status": "A_VENIR", "score_team1": None, "score_team2": None}
+            if match_date < today:
+                if rng.random() < cancelled_ratio:
+                    row["status"] = "ANNULE"
+                else:
+                    sets, row["score_team1"], row["score_team2"] = random_score(rng)
+                    row["status"] = "TERMINE"
+                    counts["finished"] += 1
+                    set_rows.extend(
+                        {"match_id": match_id, "set_no": set_no, "games_team1": games1, "games_team2": games2}
+                        for set_no, (games1, games2) in enumerate(sets, start=1)
+                    )
+            match_rows.append(row)
+            position += 1
+            if len(match_rows) >= batch_size:
+                flush()
+    flush()
+
+    # Tables dérivées des lignes générées
+    for user_ids in chunks([user_id for _, user_id, _ in players]):
+        sync_users(connection, user_ids)
+    team_ids = [team["id"] for team in teams]
+    for ids in chunks(team_ids):
+        sync_teams(connection, ids)
+        rebuild_standings(connection, ids)
+    # Lignes insérées hors ORM : les ETags des lectures doivent changer
+    bump_resource_versions(connection, ALL_RESOURCES)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=10)
+    parser.add_argument("--players-per-company", type=int, default=8, help="nombre pair : équipes de deux")
+    parser.add_argument("--pools", type=int, default=4, help="0 : équipes sans poule (un seul round-robin)")
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--courts", type=int, default=10, choices=range(1, 11), metavar="1-10")
+    parser.add_argument("--first-hour", type=int, default=9)
+    parser.add_argument("--last-hour", type=int, default=21)
+    parser.add_argument("--finished-ratio", type=float, default=0.5, help="part de la saison déjà jouée")
+    parser.add_argument("--cancelled-ratio", type=float, default=0.02, help="part des matchs passés annulés")
+    parser.add_argument("--password", default="User@2025!", help="mot de passe de tous les comptes générés")
+    parser.add_argument("--email-domain", default="league.test")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--seed", type=int, help="graine aléatoire (génération reproductible)")
+    args = parser.parse_args()
+
+    # Imports tardifs : la base (DATABASE_URL) n'est ouverte qu'une fois les arguments validés
+    from app.core.security import get_password_hash
+    from app.database import engine, init_db
+
+    init_db()
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        counts = generate_league(
+            connection, companies=args.companies, players_per_company=args.players_per_company, pools=args.pools,
+            matches=args.matches, courts=args.courts, hours=(args.first_hour, args.last_hour),
+            finished_ratio=args.finished_ratio, cancelled_ratio=args.cancelled_ratio,
+            password_hash=get_password_hash(args.password), email_domain=args.email_domain,
+            batch_size=args.batch_size, seed=args.seed
+        )
+        example = connection.execute(
+            select(User.email).where(User.email.like(f"%@{args.email_domain}")).order_by(User.id.desc()).limit(1)
+        ).scalar()
+    elapsed = time.perf_counter() - started
+
+    print(", ".join(f"{count} {name}" for name, count in counts.items()) + f" en {elapsed:.1f} s")
+    if example:
+        print(f"Exemple de compte : {example} / {args.password}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Import en masse de comptes, joueurs et équipes depuis un CSV
+(même traitement que POST /api/v1/users/users/import).
+Usage: python -m scripts.import_csv joueurs.csv [--dry-run] [--report rapport.json]
+
+Colonnes : email, first_name, last_name, company, license_number, birth_date,
+is_admin, team (deux lignes avec le même `team` forment une équipe).
+"""
+
+import argparse
+
+from app.database import SessionLocal, register_listeners
+from app.crud.imports import import_rows, read_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("csv_file")
+    parser.add_argument("--dry-run", action="store_true", help="valider sans rien créer")
+    parser.add_argument("--report", help="écrire le rapport complet (JSON) dans ce fichier")
+    args = parser.parse_args()
+
+    with open(args.csv_file, encoding="utf-8-sig") as f:
+        rows = read_csv(f.read())
+
+    # Tables dérivées (recherche, membres d'équipe) et versions ETag tenues à jour par les écouteurs ORM
+    register_listeners()
+    session = SessionLocal()
+    try:
+        report = import_rows(session, rows, dry_run=args.dry_run)
+    finally:
+        session.close()
+
+    for row in report.rows:
+        if row.status == "error":
+            print(f"ligne {row.line} ({row.email or '?'}) : {' ; '.join(row.errors)}")
+    print(f"{report.created} créés, {report.failed} en erreur{' (simulation)' if report.dry_run else ''}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report.model_dump_json(indent=2))
+
+
+if __name__ == '__main__':
+    main()
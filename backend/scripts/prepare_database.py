@@ -0,0 +1,24 @@
+"""
+Met la base au niveau du schéma des modèles (tables, index, tables dérivées).
+À lancer une fois par déploiement, avant les workers (SCHEMA_CHECK_ON_STARTUP=false).
+Usage: python -m scripts.prepare_database [--force]
+"""
+
+import argparse
+
+from app.database import prepare_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="appliquer même si l'empreinte du schéma n'a pas changé")
+    args = parser.parse_args()
+
+    if prepare_database(force=args.force):
+        print("Schéma appliqué")
+    else:
+        print("Schéma déjà à jour")
+
+
+if __name__ == '__main__':
+    main()
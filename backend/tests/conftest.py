@@ -8,6 +8,10 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.database import Base, get_db
+from app.api.deps import principal_cache
+from app.api.auth import login_throttle
+from app.crud.occupancy import court_occupancy
+from app.crud.planning_cache import invalidate_planning
 from app.models.models import User
 from app.core.security import get_password_hash
 
@@ -99,6 +103,9 @@ def db_session(test_db):
     connection = engine.connect()
     transaction = connection.begin()
     session = TestingSessionLocal(bind=connection)
+    # Index d'occupation propre au process : ne pas garder l'état d'un autre test
+    court_occupancy.clear()
+    invalidate_planning()
     
     yield session
     
@@ -116,6 +123,8 @@ def client(db_session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    principal_cache.clear()
+    login_throttle.clear(db_session)
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -0,0 +1,119 @@
+# ============================================
+# FICHIER : backend/tests/test_async_db.py
+# ============================================
+
+import asyncio
+import pytest
+from datetime import date, time, timedelta
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, create_db_engine, create_async_db_engine, async_database_url
+from app.models.models import User, Player, Team, Event, Match
+from app.crud.match import get_upcoming_matches, get_upcoming_matches_async, get_match_by_id_async
+from app.api.planning import events_range, events_range_async, my_events, my_events_async
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    """Base SQLite fichier peuplée via le moteur synchrone"""
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        users = [User(email=f"async{i}@test.com", password_hash="x", is_active=True) for i in range(4)]
+        db.add_all(users)
+        db.flush()
+        players = [
+            Player(first_name=f"P{i}", last_name="Async", company="Corp", license_number=f"L{i}11111", user_id=u.id)
+            for i, u in enumerate(users)
+        ]
+        db.add_all(players)
+        db.flush()
+        teams = [
+            Team(company="Corp", player1_id=players[0].id, player2_id=players[1].id),
+            Team(company="Corp", player1_id=players[2].id, player2_id=players[3].id),
+        ]
+        db.add_all(teams)
+        db.flush()
+        event = Event(event_date=date.today() + timedelta(days=2), start_time=time(19, 0))
+        db.add(event)
+        db.flush()
+        for court in (1, 2):
+            db.add(Match(
+                team1_id=teams[0].id, team2_id=teams[1].id, event_id=event.id,
+                match_date=event.event_date, match_time=time(19, 0), court_number=court, status="A_VENIR"
+            ))
+        db.commit()
+        yield url
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def run_async(url, coro_factory):
+    """Exécute coro_factory(session) sur une session asynchrone"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async def main():
+        engine = create_async_db_engine(url)
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                return await coro_factory(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_async_database_url():
+    """Test conversion des URL vers les pilotes asynchrones"""
+    assert async_database_url("sqlite:///./padel.db") == "sqlite+aiosqlite:///./padel.db"
+    assert async_database_url("postgresql://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+def test_upcoming_matches_async_matches_sync(database_url):
+    """Test mêmes matchs (et graphe chargé) en asynchrone qu'en synchrone"""
+    engine = create_db_engine(database_url)
+    db = sessionmaker(bind=engine)()
+    try:
+        expected = [(m.id, m.team1.player1.first_name) for m in get_upcoming_matches(db)]
+        user = db.query(User).filter(User.email == "async0@test.com").first()
+        db.expunge(user)
+    finally:
+        db.close()
+        engine.dispose()
+
+    async def load(db):
+        matches = await get_upcoming_matches_async(db, user=user)
+        return [(m.id, m.team1.player1.first_name) for m in matches]
+
+    assert len(expected) == 2
+    assert run_async(database_url, load) == expected
+
+def test_match_by_id_async_not_found(database_url):
+    """Test 404 en asynchrone"""
+    from fastapi import HTTPException
+
+    with pytest.raises(HTTPException) as exc:
+        run_async(database_url, lambda db: get_match_by_id_async(db, 999))
+    assert exc.value.status_code == 404
+
+def test_planning_async_matches_sync(database_url):
+    """Test réponses identiques des endpoints de planning synchrones et asynchrones"""
+    engine = create_db_engine(database_url)
+    db = sessionmaker(bind=engine)()
+    start = date.today().isoformat()
+    end = (date.today() + timedelta(days=7)).isoformat()
+    try:
+        user = db.query(User).filter(User.email == "async2@test.com").first()
+        expected_range = events_range(start, end, db=db, current_user=user)
+        expected_mine = my_events(db=db, current_user=user)
+        db.expunge(user)
+    finally:
+        db.close()
+        engine.dispose()
+
+    assert len(expected_range[0]["matches"]) == 2
+    assert run_async(database_url, lambda db: events_range_async(start, end, db=db, current_user=user)) == expected_range
+    assert run_async(database_url, lambda db: my_events_async(db=db, current_user=user)) == expected_mine
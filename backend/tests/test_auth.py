@@ -3,7 +3,13 @@
 # ============================================
 
 import pytest
+from dataclasses import FrozenInstanceError
 from fastapi import status
+from threading import BoundedSemaphore
+from sqlalchemy import event, update
+from app.api.deps import principal_cache
+from app.models.models import User
+from app.core import security
 
 def test_login_success(client, test_user):
     """Test connexion avec credentials valides"""
@@ -65,6 +71,20 @@ def test_brute_force_protection(client, test_user):
     assert "locked_until" in data["detail"]
     assert "minutes_remaining" in data["detail"]
 
+def test_login_hasher_saturated(client, test_user, monkeypatch):
+    """Test 503 + Retry-After quand le pool bcrypt est saturé"""
+    saturated = BoundedSemaphore(1)
+    saturated.acquire()
+    monkeypatch.setattr(security, "_hash_slots", saturated)
+
+    response = client.post("/api/v1/auth/login", json={
+        "email": "test@example.com",
+        "password": "ValidP@ssw0rd123"
+    })
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert "Retry-After" in response.headers
+
 def test_login_inactive_user(client, db_session, test_user):
     """Test connexion avec compte désactivé"""
     test_user.is_active = False
@@ -98,4 +118,100 @@ def test_invalid_token(client):
     headers = {"Authorization": "Bearer invalid_token"}
     response = client.post("/api/v1/auth/logout", headers=headers)
     
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
\ No newline at end of file
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+def login_headers(client):
+    response = client.post("/api/v1/auth/login", json={
+        "email": "test@example.com",
+        "password": "ValidP@ssw0rd123"
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def test_current_user_is_cached(client, db_session, test_user):
+    """Test aucune requête sur users pour un utilisateur déjà authentifié"""
+    headers = login_headers(client)
+    client.post("/api/v1/auth/logout", headers=headers)
+
+    statements = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.post("/api/v1/auth/logout", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not [s for s in statements if "FROM users" in s]
+
+def test_cached_user_deactivation_is_applied(client, db_session, test_user):
+    """Test la désactivation d'un compte invalide le cache"""
+    headers = login_headers(client)
+    assert client.post("/api/v1/auth/logout", headers=headers).status_code == status.HTTP_200_OK
+
+    test_user.is_active = False
+    db_session.commit()
+
+    response = client.post("/api/v1/auth/logout", headers=headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+def test_change_password_with_cached_user(client, db_session, test_user):
+    """Test changement de mot de passe quand l'utilisateur provient du cache"""
+    headers = login_headers(client)
+    client.post("/api/v1/auth/logout", headers=headers)
+
+    response = client.post("/api/v1/auth/change-password", json={
+        "current_password": "ValidP@ssw0rd123",
+        "new_password": "NewValidP@ss456",
+        "confirm_password": "NewValidP@ss456"
+    }, headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    db_session.refresh(test_user)
+    assert test_user.must_change_password == False
+    assert principal_cache.get(test_user.id) is None
+
+def test_principal_invalidated_on_commit_not_flush(client, db_session, test_user):
+    """Test cache des utilisateurs : entrée conservée au flush, retirée au commit ; principal en lecture seule"""
+    headers = login_headers(client)
+    client.post("/api/v1/auth/logout", headers=headers)
+    principal = principal_cache.get(test_user.id)
+    with pytest.raises(FrozenInstanceError):
+        principal.is_admin = True
+
+    test_user.is_admin = True
+    db_session.flush()
+    assert principal_cache.get(test_user.id) is principal
+    db_session.commit()
+    assert principal_cache.get(test_user.id) is None
+
+def test_principals_cleared_on_bulk_update(client, db_session, test_user):
+    """Test UPDATE en masse des utilisateurs : cache vidé au commit"""
+    headers = login_headers(client)
+    client.post("/api/v1/auth/logout", headers=headers)
+    assert principal_cache.get(test_user.id) is not None
+
+    db_session.execute(update(User).values(is_active=False))
+    db_session.commit()
+    assert principal_cache.get(test_user.id) is None
+
+def test_login_success_without_writes(client, db_session, test_user):
+    """Test aucune écriture en base pour une connexion réussie"""
+    statements = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.post("/api/v1/auth/login", json={
+            "email": "test@example.com",
+            "password": "ValidP@ssw0rd123"
+        })
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not [s for s in statements if s.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))]
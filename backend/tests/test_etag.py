@@ -0,0 +1,80 @@
+# ============================================
+# FICHIER : backend/tests/test_etag.py
+# ============================================
+
+from fastapi import status
+from app.core.config import settings
+from app.core.etag import bump_resource_versions
+from app.models.models import User, Player
+
+
+def add_player(db_session, i=0):
+    user = User(email=f"etag{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+    db_session.add(user)
+    db_session.flush()
+    player = Player(first_name="Jean", last_name="Etag", company="Corp", license_number=f"L{i}99999", user_id=user.id)
+    db_session.add(player)
+    db_session.commit()
+    return player
+
+
+def test_unchanged_list_returns_304(client, db_session):
+    """Test même ETag renvoyé : 304 sans corps"""
+    add_player(db_session)
+    response = client.get("/api/v1/players/players")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v1/players/players", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert "Authorization" in response.headers["Vary"]
+
+def test_write_changes_etag(client, db_session):
+    """Test création d'un joueur : nouvel ETag, réponse complète"""
+    add_player(db_session, 0)
+    etag = client.get("/api/v1/players/players").headers["ETag"]
+
+    add_player(db_session, 1)
+    response = client.get("/api/v1/players/players", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+def test_etag_depends_on_query_and_user(client, db_session, test_user):
+    """Test paramètres ou utilisateur différents : ETag différent"""
+    add_player(db_session)
+    first = client.get("/api/v1/players/players").headers["ETag"]
+    limited = client.get("/api/v1/players/players?limit=1").headers["ETag"]
+    assert first != limited
+
+    login = client.post("/api/v1/auth/login", json={"email": "test@example.com", "password": "ValidP@ssw0rd123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert client.get("/api/v1/players/players", headers=headers).headers["ETag"] != first
+
+def test_unversioned_routes_have_no_etag(client):
+    """Test route hors périmètre (pools) : pas d'ETag"""
+    response = client.get("/api/v1/pools/pools")
+    assert "ETag" not in response.headers
+
+def test_write_outside_orm_changes_etag(client, db_session):
+    """Test version en base : une écriture d'un autre process (script, SQL brut) change l'ETag"""
+    add_player(db_session)
+    etag = client.get("/api/v1/players/players").headers["ETag"]
+
+    bump_resource_versions(db_session.connection(), ["players"])
+    db_session.commit()
+    response = client.get("/api/v1/players/players", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+
+def test_not_modified_keeps_cors_headers(client, db_session):
+    """Test 304 sous le middleware CORS : en-têtes CORS présents"""
+    add_player(db_session)
+    origin = {"Origin": settings.allowed_origins[0]}
+    etag = client.get("/api/v1/players/players", headers=origin).headers["ETag"]
+
+    response = client.get("/api/v1/players/players", headers={**origin, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["access-control-allow-origin"] == origin["Origin"]
@@ -0,0 +1,85 @@
+# ============================================
+# FICHIER : backend/tests/test_generate_league.py
+# ============================================
+
+from collections import Counter
+from datetime import date
+from sqlalchemy import func, select
+from app.crud.match_sets import finished_sets
+from app.crud.standings import standings_totals_statement
+from app.models.models import Event, Match, MatchSet, Player, Team, TeamMember, TeamStanding, SearchDocument, User
+from scripts.generate_league import generate_league, round_robin
+
+TODAY = date(2025, 3, 1)
+
+
+def test_round_robin_each_team_once_per_day():
+    """Test round-robin : chaque paire une fois, chaque équipe au plus une fois par journée"""
+    rounds = round_robin([1, 2, 3, 4, 5])
+    assert len(rounds) == 5
+    pairs = [frozenset(pair) for day in rounds for pair in day]
+    assert len(pairs) == len(set(pairs)) == 10
+    for day in rounds:
+        teams = [team for pair in day for team in pair]
+        assert len(teams) == len(set(teams))
+
+def test_generate_league_consistent(db_session):
+    """Test génération : volumes demandés, planning sans doublon, tables dérivées à jour"""
+    connection = db_session.connection()
+    counts = generate_league(connection, companies=3, players_per_company=4, pools=2, matches=40, courts=2,
+                             hours=(18, 20), password_hash="x", today=TODAY, seed=7)
+    assert counts["users"] == counts["players"] == 12
+    assert counts["teams"] == 6
+    assert counts["matches"] == 40
+
+    matches = db_session.execute(select(Match)).scalars().all()
+    slots = Counter((team_id, m.match_date, m.match_time) for m in matches for team_id in (m.team1_id, m.team2_id))
+    assert max(slots.values()) == 1
+    courts = Counter((m.match_date, m.match_time, m.court_number) for m in matches)
+    assert max(courts.values()) == 1
+    for m in matches:
+        assert m.status in (("TERMINE", "ANNULE") if m.match_date < TODAY else ("A_VENIR",))
+        if m.status == "TERMINE":
+            stored = db_session.execute(
+                select(MatchSet.games_team1, MatchSet.games_team2).where(MatchSet.match_id == m.id).order_by(MatchSet.set_no)
+            ).all()
+            assert [tuple(row) for row in stored] == finished_sets(m.status, m.score_team1)
+    assert counts["finished"] == sum(1 for m in matches if m.status == "TERMINE") > 0
+
+    # Équipes d'une même entreprise, dans les poules ; membres, index de recherche et bilans
+    for team in db_session.execute(select(Team)).scalars():
+        assert team.pool_id is not None
+        assert db_session.get(Player, team.player1_id).company == db_session.get(Player, team.player2_id).company
+    assert db_session.execute(select(func.count()).select_from(TeamMember)).scalar() == 12
+    assert db_session.execute(select(func.count()).select_from(SearchDocument)).scalar() == 12
+    standings = {tuple(row[:2]): tuple(row[2:]) for row in db_session.execute(standings_totals_statement())}
+    stored = {
+        tuple(row[:2]): tuple(row[2:]) for row in db_session.execute(select(
+            TeamStanding.pool_id, TeamStanding.team_id, TeamStanding.played, TeamStanding.wins, TeamStanding.losses, TeamStanding.sets_won,
+            TeamStanding.sets_lost, TeamStanding.games_won, TeamStanding.games_lost
+        ))
+    }
+    assert stored == standings
+
+def test_generate_league_appends_to_existing_data(db_session, test_user):
+    """Test génération sur une base non vide : identifiants à la suite, données existantes intactes"""
+    connection = db_session.connection()
+    generate_league(connection, companies=2, players_per_company=2, pools=0, matches=1, password_hash="x", seed=1)
+    generate_league(connection, companies=2, players_per_company=2, pools=0, matches=1, password_hash="x", seed=1)
+    emails = db_session.execute(select(User.email).order_by(User.id)).scalars().all()
+    assert emails[0] == "test@example.com"
+    assert len(emails) == len(set(emails)) == 9
+    licenses = db_session.execute(select(Player.license_number)).scalars().all()
+    assert len(set(licenses)) == 8
+
+
+def test_generate_league_rerun_does_not_overlap(db_session):
+    """Test deux générations sur la même base : aucune piste réservée deux fois, un événement par date"""
+    connection = db_session.connection()
+    for seed in (1, 2):
+        generate_league(connection, companies=4, players_per_company=4, pools=2, matches=60, courts=2,
+                        hours=(9, 12), password_hash="x", today=date(2025, 6, 1), seed=seed)
+    slots = db_session.execute(select(Match.match_date, Match.match_time, Match.court_number)).all()
+    assert len(slots) == len(set(slots)) == 120
+    dates = db_session.execute(select(Event.event_date)).scalars().all()
+    assert len(dates) == len(set(dates))
@@ -0,0 +1,111 @@
+# ============================================
+# FICHIER : backend/tests/test_import.py
+# ============================================
+
+import pytest
+from fastapi import status
+from app.models.models import User, Player, Team
+from app.crud.imports import batches, import_rows, read_csv
+
+HEADER = "email,first_name,last_name,company,license_number,birth_date,is_admin,team\n"
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def upload(client, headers, content, dry_run=False):
+    return client.post(
+        "/api/v1/users/users/import", params={"dry_run": dry_run},
+        files={"file": ("joueurs.csv", content.encode(), "text/csv")}, headers=headers
+    )
+
+
+def test_import_creates_users_players_and_teams(client, db_session, admin_headers):
+    """Test comptes, joueurs et équipe créés ; mots de passe temporaires renvoyés"""
+    content = HEADER + (
+        "Alice@Corp.com,Alice,Martin,Corp,L123456,1990-01-01,,A\n"
+        "bob@corp.com,Bob,Durand,Corp,L100002,,,A\n"
+        "carla@corp.com,Carla,Petit,Corp,L654321,,,\n"
+    )
+    response = upload(client, admin_headers, content)
+    assert response.status_code == status.HTTP_200_OK
+    report = response.json()
+    assert (report["created"], report["failed"]) == (3, 0)
+    assert [row["line"] for row in report["rows"]] == [2, 3, 4]
+    assert all(row["temporary_password"] for row in report["rows"])
+
+    alice = db_session.query(User).filter(User.email == "alice@corp.com").one()
+    assert alice.must_change_password
+    team = db_session.query(Team).filter(Team.id == report["rows"][0]["team_id"]).one()
+    assert {team.player1_id, team.player2_id} == {row["player_id"] for row in report["rows"][:2]}
+    assert report["rows"][2]["team_id"] is None
+
+def test_import_reports_every_bad_row(client, db_session, admin_headers):
+    """Test doublons (fichier et base), licence invalide, équipe incomplète : lignes valides créées quand même"""
+    content = HEADER + (
+        "admin@example.com,Alice,Martin,Corp,L200001,,,\n"   # email existant
+        "dup@corp.com,Bob,Durand,Corp,L200002,,,\n"
+        "dup@corp.com,Carla,Petit,Corp,L200003,,,\n"         # email en double
+        "dan@corp.com,Dan,Leroy,Corp,X1,,,\n"                # licence invalide
+        "eve@corp.com,Eve,Roux,Corp,L200005,,,B\n"           # coéquipier invalide
+        "fred@corp.com,Fred,Noir,Corp,BAD,,,B\n"
+        "gina@corp.com,Gina,Blanc,Corp,L200007,,,C\n"        # équipe d'un seul joueur
+        "hugo@corp.com,Hugo,Vert,Corp,L200008,,,\n"
+    )
+    report = upload(client, admin_headers, content).json()
+    statuses = {row["line"]: row["status"] for row in report["rows"]}
+    assert statuses == {2: "error", 3: "error", 4: "error", 5: "error", 6: "error", 7: "error", 8: "error", 9: "created"}
+    errors = {row["line"]: " ; ".join(row["errors"]) for row in report["rows"]}
+    assert "Email déjà utilisé" in errors[2]
+    assert "Email en double" in errors[3]
+    assert "license_number" in errors[5]
+    assert "Coéquipier invalide (ligne 7)" in errors[6]
+    assert "exactement 2 joueurs" in errors[8]
+    assert db_session.query(Player).filter(Player.last_name == "Vert").count() == 1
+
+def test_import_dry_run_creates_nothing(client, db_session, admin_headers):
+    """Test simulation : lignes validées, aucune écriture"""
+    report = upload(client, admin_headers, HEADER + "zoe@corp.com,Zoe,Martin,Corp,L300001,,,\n", dry_run=True).json()
+    assert report["rows"][0]["status"] == "valid"
+    assert report["created"] == 0
+    assert db_session.query(User).filter(User.email == "zoe@corp.com").count() == 0
+
+def test_import_requires_admin_and_columns(client, admin_headers):
+    """Test réservé aux administrateurs ; colonnes obligatoires vérifiées"""
+    assert upload(client, {}, HEADER).status_code in (401, 403)
+    response = upload(client, admin_headers, "email,company\nx@corp.com,Corp\n")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_batches_keep_teams_together(db_session):
+    """Test lots de 2 lignes : une équipe n'est jamais coupée entre deux transactions"""
+    assert list(batches([[1], [2, 3], [4], [5]], 2)) == [[[1], [2, 3]], [[4], [5]]]
+
+    rows = read_csv(HEADER + "a@corp.com,Anna,Martin,Corp,L400001,,,\nb@corp.com,Bea,Martin,Corp,L400002,,,T\nc@corp.com,Cleo,Martin,Corp,L400003,,,T\n")
+    report = import_rows(db_session, rows, batch_size=1)
+    assert report.created == 3
+    assert report.rows[1].team_id == report.rows[2].team_id is not None
+
+
+def test_import_script_maintains_derived_tables(tmp_path):
+    """Test script d'import (process séparé) : recherche, membres d'équipe et versions ETag à jour"""
+    import os
+    import sqlite3
+    import subprocess
+    import sys
+
+    database = tmp_path / "import.db"
+    csv_file = tmp_path / "joueurs.csv"
+    csv_file.write_text(HEADER + "alice@corp.com,Alice,Martin,Corp,L123456,,,A\nbob@corp.com,Bob,Durand,Corp,L100002,,,A\n")
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{database}", LOG_LEVEL="ERROR")
+    subprocess.run([sys.executable, "-c", "from app.database import prepare_database; prepare_database()"],
+                   env=env, check=True)
+    subprocess.run([sys.executable, "-m", "scripts.import_csv", str(csv_file)], env=env, check=True, capture_output=True)
+
+    with sqlite3.connect(database) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM search_documents").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM team_members").fetchone()[0] == 2
+        versions = dict(conn.execute("SELECT resource, version FROM resource_versions").fetchall())
+    assert versions.get("teams") and versions.get("players")
@@ -0,0 +1,84 @@
+# ============================================
+# FICHIER : backend/tests/test_instrumentation.py
+# ============================================
+
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app.core.instrumentation import install_instrumentation
+
+
+@pytest.fixture
+def instrumented(db_session):
+    """Application minimale instrumentée (budget de 3 requêtes SQL) sur la session de test"""
+    app = FastAPI()
+    install_instrumentation(app, statement_budget=3)
+
+    @app.get("/queries/{count}")
+    def run_queries(count: int):
+        rows = 0
+        for _ in range(count):
+            rows += len(db_session.execute(text("SELECT 1 UNION ALL SELECT 2")).all())
+        return {"rows": rows}
+
+    @app.get("/stream/{count}")
+    def stream_queries(count: int):
+        def lines():
+            for _ in range(count):
+                for row in db_session.execute(text("SELECT 1 UNION ALL SELECT 2")).all():
+                    yield f"{row[0]}\n"
+        return StreamingResponse(lines(), media_type="text/plain")
+
+    @app.get("/failing")
+    def failing_query():
+        connection = db_session.connection()
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM table_absente"))
+        return {"pending": len(connection.info.get("query_started", []))}
+
+    return TestClient(app)
+
+
+def test_server_timing_counts_statements_and_rows(instrumented):
+    """Test Server-Timing : durée totale, temps base, requêtes et lignes de la requête"""
+    response = instrumented.get("/queries/2")
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("app;dur=")
+    assert 'desc="sql=2 rows=4"' in timing
+
+def test_statement_budget_flags_n_plus_one(instrumented, caplog):
+    """Test au-delà du budget : avertissement avec la requête la plus répétée"""
+    with caplog.at_level(logging.WARNING, logger="app.core.instrumentation"):
+        instrumented.get("/queries/2")
+        assert not caplog.records
+        instrumented.get("/queries/5")
+    assert "5 requêtes SQL (budget 3)" in caplog.records[0].getMessage()
+    assert "SELECT 1 UNION ALL SELECT 2" in caplog.records[0].getMessage()
+
+def test_metrics_prometheus_text(instrumented):
+    """Test /metrics : compteurs par route au format Prometheus"""
+    instrumented.get("/queries/5")
+    response = instrumented.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE http_requests_total counter" in body
+    assert 'http_requests_total{method="GET",route="/queries/{count}",status="200"}' in body
+    assert 'sql_budget_exceeded_total{method="GET",route="/queries/{count}"}' in body
+    assert 'cache_hits_total{cache="planning"}' in body
+
+def test_streamed_body_statements_counted(instrumented):
+    """Test corps en flux (export) : requêtes et lignes du corps comptées dans /metrics"""
+    assert instrumented.get("/stream/3").text == "1\n2\n" * 3
+    body = instrumented.get("/metrics").text
+    assert 'db_statements_total{method="GET",route="/stream/{count}"} 3' in body
+    assert 'db_rows_total{method="GET",route="/stream/{count}"} 6' in body
+
+def test_failed_statement_leaves_no_start_time(instrumented):
+    """Test requête SQL en échec : son horodatage ne reste pas sur la connexion"""
+    assert instrumented.get("/failing").json() == {"pending": 0}
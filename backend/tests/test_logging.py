@@ -0,0 +1,119 @@
+# ============================================
+# FICHIER : backend/tests/test_logging.py
+# ============================================
+
+import io
+import json
+import logging
+import queue
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core import logs
+from app.core.logs import (
+    REQUEST_ID_HEADER, DebugSampler, NonBlockingQueueHandler,
+    RequestIdMiddleware, parse_levels, setup_logging, shutdown_logging
+)
+
+
+@pytest.fixture
+def captured():
+    """Logs JSON écrits dans un buffer ; configuration par défaut restaurée ensuite"""
+    stream = io.StringIO()
+    setup_logging(level="INFO", levels="tests.logging=DEBUG", log_format="json", debug_sample_rate=1.0, stream=stream)
+
+    def lines():
+        shutdown_logging()  # vide la file
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield lines
+    logging.getLogger("tests.logging").setLevel(logging.NOTSET)
+    setup_logging()
+
+
+@pytest.fixture
+def app_client():
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/ping")
+    def ping():
+        logging.getLogger("tests.logging").info("ping %s", 1, extra={"match_id": 7})
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_request_id_generated_and_propagated(app_client):
+    """Test X-Request-ID : tiré si absent, repris tel quel sinon"""
+    generated = app_client.get("/ping").headers[REQUEST_ID_HEADER]
+    assert len(generated) == 32
+    assert app_client.get("/ping", headers={REQUEST_ID_HEADER: "abc-123"}).headers[REQUEST_ID_HEADER] == "abc-123"
+
+def test_json_records_carry_request_id(app_client, captured):
+    """Test enregistrement JSON : message formaté, request_id de la requête et champs extra"""
+    app_client.get("/ping", headers={REQUEST_ID_HEADER: "req-42"})
+    records = [record for record in captured() if record["logger"] == "tests.logging"]
+    assert records == [{
+        "ts": records[0]["ts"], "level": "INFO", "logger": "tests.logging",
+        "message": "ping 1", "request_id": "req-42", "match_id": 7,
+    }]
+
+def test_module_levels(captured):
+    """Test niveaux par module : DEBUG pour le module configuré, INFO ailleurs"""
+    logging.getLogger("tests.logging").debug("visible")
+    logging.getLogger("tests.other").debug("masqué")
+    messages = [record["message"] for record in captured()]
+    assert "visible" in messages
+    assert "masqué" not in messages
+
+def test_exception_formatted_by_listener(captured):
+    """Test logger.exception : trace incluse dans l'enregistrement"""
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logging.getLogger("tests.logging").exception("échec")
+    record = next(record for record in captured() if record["message"] == "échec")
+    assert record["level"] == "ERROR"
+    assert "RuntimeError: boom" in record["exception"]
+    assert record["request_id"] == "-"
+
+def test_debug_sampling():
+    """Test échantillonnage : seuls les DEBUG sont filtrés"""
+    sampler = DebugSampler(0)
+    debug = logging.makeLogRecord({"levelno": logging.DEBUG})
+    info = logging.makeLogRecord({"levelno": logging.INFO})
+    assert not sampler.filter(debug)
+    assert sampler.filter(info)
+    assert DebugSampler(1).filter(debug)
+
+def test_full_queue_drops_without_blocking():
+    """Test file pleine : l'enregistrement est abandonné et compté, sans attente"""
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(logging.makeLogRecord({"msg": "un %s", "args": ("a",)}))
+    handler.handle(logging.makeLogRecord({"msg": "deux"}))
+    assert handler.dropped == 1
+    assert handler.queue.get_nowait().msg == "un a"
+
+def test_parse_levels():
+    """Test spécification des niveaux par module"""
+    assert parse_levels("app.api.match=debug, sqlalchemy.engine=WARNING,") == {
+        "app.api.match": logging.DEBUG, "sqlalchemy.engine": logging.WARNING,
+    }
+    with pytest.raises(ValueError):
+        parse_levels("app.api.match=BAVARD")
+
+def test_setup_is_idempotent():
+    """Test reconfiguration : un seul handler de file sur le logger racine"""
+    setup_logging()
+    setup_logging()
+    handlers = [handler for handler in logging.getLogger().handlers if isinstance(handler, NonBlockingQueueHandler)]
+    assert handlers == [logs.queue_handler]
+
+def test_shutdown_removes_queue_handler():
+    """Test arrêt : plus de handler de file sur le logger racine (rien ne s'accumule)"""
+    setup_logging()
+    shutdown_logging()
+    assert not [handler for handler in logging.getLogger().handlers if isinstance(handler, NonBlockingQueueHandler)]
+    assert logs.queue_handler is None
+    setup_logging()
@@ -0,0 +1,348 @@
+# ============================================
+# FICHIER : backend/tests/test_match.py
+# ============================================
+
+import csv
+import io
+import json
+import pytest
+from contextlib import contextmanager
+from datetime import date, time, timedelta
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models.models import User, Player, Team, Match, Event
+from app.crud.match import (
+    get_upcoming_matches, get_match_by_id, check_court_availability, create_match, create_matches_bulk, EXPORT_COLUMNS
+)
+from app.crud.occupancy import court_occupancy, warm_court_occupancy
+from app.schemas.match import MatchCreate
+
+
+@contextmanager
+def count_queries(db_session):
+    """Compte les requêtes SQL émises sur la connexion de la session."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def match_teams(db_session):
+    """Crée deux équipes de deux joueurs (sans hash bcrypt pour rester rapide)"""
+    players = []
+    for i in range(4):
+        user = User(email=f"match{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(
+            first_name=f"Player{i}",
+            last_name=f"Match{i}",
+            company="Company",
+            license_number=f"L{i}00000",
+            user_id=user.id
+        )
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+
+    teams = []
+    for i in range(2):
+        team = Team(company=f"Team {i}", player1_id=players[i * 2].id, player2_id=players[i * 2 + 1].id)
+        db_session.add(team)
+        db_session.flush()
+        teams.append(team)
+    db_session.commit()
+    return teams
+
+
+def add_matches(db_session, teams, count):
+    """Ajoute `count` matchs à venir entre les deux équipes (créneaux distincts, à la suite des existants)"""
+    today = date.today()
+    first = db_session.query(Match).count()
+    for i in range(first, first + count):
+        db_session.add(Match(
+            team1_id=teams[0].id,
+            team2_id=teams[1].id,
+            match_date=today + timedelta(days=1 + i % 20),
+            match_time=time(18 + i % 4, 0),
+            court_number=1 + (i % 10 + i // 20) % 10,
+            status="A_VENIR"
+        ))
+    db_session.commit()
+
+
+def load_and_walk(db_session, **kwargs):
+    """Charge les matchs à venir et parcourt tout le graphe équipes/joueurs"""
+    db_session.expire_all()
+    user = kwargs.get("user")
+    if user is not None:
+        # Recharger l'utilisateur hors comptage (il provient de get_current_user)
+        db_session.refresh(user)
+    with count_queries(db_session) as statements:
+        matches = get_upcoming_matches(db_session, **kwargs)
+        for match in matches:
+            for team in (match.team1, match.team2):
+                assert team.player1.first_name
+                assert team.player2.first_name
+    return matches, len(statements)
+
+
+def test_upcoming_matches_query_count_is_constant(db_session, match_teams):
+    """Le nombre de requêtes ne dépend pas du nombre de matchs"""
+    add_matches(db_session, match_teams, 2)
+    matches, small_count = load_and_walk(db_session)
+    assert len(matches) == 2
+
+    add_matches(db_session, match_teams, 40)
+    matches, large_count = load_and_walk(db_session)
+    assert len(matches) == 42
+
+    assert large_count == small_count == 1
+
+
+def test_upcoming_matches_for_player_query_count_is_constant(db_session, match_teams):
+    """Vue joueur : requêtes joueur + équipes + matchs, quel que soit le volume"""
+    user = db_session.query(User).filter(User.email == "match0@test.com").first()
+
+    add_matches(db_session, match_teams, 3)
+    _, small_count = load_and_walk(db_session, user=user)
+
+    add_matches(db_session, match_teams, 30)
+    matches, large_count = load_and_walk(db_session, user=user)
+    assert len(matches) == 33
+
+    assert large_count == small_count == 3
+
+
+def test_get_match_by_id_loads_graph_in_one_query(db_session, match_teams):
+    """Le détail d'un match utilise la même stratégie de chargement"""
+    add_matches(db_session, match_teams, 1)
+    match_id = db_session.query(Match.id).scalar()
+    db_session.expire_all()
+
+    with count_queries(db_session) as statements:
+        match = get_match_by_id(db_session, match_id)
+        assert match.team1.player1.last_name == "Match0"
+        assert match.team2.player2.last_name == "Match3"
+
+    assert len(statements) == 1
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def bulk_payload(teams, slots):
+    """Corps de POST /matches/bulk pour des créneaux (jours, heure, piste)"""
+    return {"matches": [
+        {
+            "team1_id": teams[0].id,
+            "team2_id": teams[1].id,
+            "match_date": (date.today() + timedelta(days=days)).isoformat(),
+            "match_time": match_time,
+            "court_number": court,
+        }
+        for days, match_time, court in slots
+    ]}
+
+
+def test_bulk_create_matches(client, db_session, match_teams, admin_headers):
+    """Test création d'une soirée complète en une requête et une vérification de disponibilité"""
+    slots = [(3, f"{hour}:00", court) for hour in (18, 19, 20) for court in range(1, 11)]
+
+    with count_queries(db_session) as statements:
+        response = client.post("/api/v1/matches/bulk", json=bulk_payload(match_teams, slots), headers=admin_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 30
+    assert response.json()[0]["team1"]["player1"]["last_name"] == "Match0"
+    assert db_session.query(Match).count() == 30
+    # Occupation de la date chargée une fois (index), rechargement du lot créé
+    assert sum("FROM matches" in statement and statement.lstrip().startswith("SELECT") for statement in statements) == 2
+
+def test_bulk_create_reports_all_conflicts(client, db_session, match_teams, admin_headers):
+    """Test conflits avec l'existant et dans le lot : tous signalés, rien n'est créé"""
+    add_matches(db_session, match_teams, 1)  # J+1, 18:00, piste 1
+    slots = [(1, "18:00", 1), (2, "18:00", 1), (2, "18:00", 1), (2, "18:00", 2)]
+
+    response = client.post("/api/v1/matches/bulk", json=bulk_payload(match_teams, slots), headers=admin_headers)
+
+    assert response.status_code == 409
+    conflicts = response.json()["detail"]["conflicts"]
+    assert [conflict["index"] for conflict in conflicts] == [0, 2]
+    assert conflicts[1]["conflicts_with"] == 1
+    assert db_session.query(Match).count() == 1
+
+def test_bulk_create_ignores_cancelled_matches(client, db_session, match_teams, admin_headers):
+    """Test un match annulé ne bloque pas le créneau"""
+    add_matches(db_session, match_teams, 1)
+    db_session.query(Match).update({Match.status: "ANNULE"})
+    db_session.commit()
+
+    response = client.post("/api/v1/matches/bulk", json=bulk_payload(match_teams, [(1, "18:00", 1)]), headers=admin_headers)
+    assert response.status_code == 200
+
+def test_bulk_create_requires_admin(client, match_teams):
+    """Test réservé aux administrateurs"""
+    response = client.post("/api/v1/matches/bulk", json=bulk_payload(match_teams, [(1, "18:00", 1)]))
+    assert response.status_code in (401, 403)
+
+
+def availability(client, headers, day):
+    response = client.get("/api/v1/matches/availability", params={"date": day.isoformat()}, headers=headers)
+    assert response.status_code == 200
+    return {slot["match_time"]: slot["occupied_courts"] for slot in response.json()["slots"]}
+
+
+def test_availability_lists_event_slots_and_occupied_courts(client, db_session, match_teams, admin_headers):
+    """Test créneaux du jour : heures des événements et pistes occupées"""
+    day = date.today() + timedelta(days=1)
+    db_session.add(Event(event_date=day, start_time=time(20, 0)))
+    db_session.commit()
+    add_matches(db_session, match_teams, 1)  # J+1, 18:00, piste 1
+
+    assert availability(client, admin_headers, day) == {"18:00:00": [1], "20:00:00": []}
+
+def test_availability_follows_match_changes(client, db_session, match_teams, admin_headers):
+    """Test index mis à jour à la création, au déplacement, à l'annulation et à la suppression"""
+    day = date.today() + timedelta(days=2)
+    assert availability(client, admin_headers, day) == {}
+
+    response = client.post("/api/v1/matches/", json=bulk_payload(match_teams, [(2, "18:00", 3)])["matches"][0], headers=admin_headers)
+    match_id = response.json()["id"]
+    assert availability(client, admin_headers, day) == {"18:00:00": [3]}
+
+    client.patch(f"/api/v1/matches/{match_id}", json={"court_number": 4}, headers=admin_headers)
+    assert availability(client, admin_headers, day) == {"18:00:00": [4]}
+
+    client.patch(f"/api/v1/matches/{match_id}", json={"status": "ANNULE"}, headers=admin_headers)
+    assert availability(client, admin_headers, day) == {"18:00:00": []}
+
+    db_session.query(Match).filter(Match.id == match_id).first().status = "A_VENIR"
+    db_session.commit()
+    assert client.delete(f"/api/v1/matches/{match_id}", headers=admin_headers).status_code == 200
+    assert availability(client, admin_headers, day) == {"18:00:00": []}
+
+def test_court_check_reads_index_only(db_session, match_teams):
+    """Test date chargée dans l'index : piste occupée ou libre, aucune requête"""
+    add_matches(db_session, match_teams, 1)
+    day = date.today() + timedelta(days=1)
+    assert check_court_availability(db_session, day, time(18, 0), 1) is False
+
+    with count_queries(db_session) as statements:
+        assert check_court_availability(db_session, day, time(18, 0), 1) is False
+        assert check_court_availability(db_session, day, time(18, 0), 2) is True
+    assert statements == []
+
+def test_occupancy_loads_a_date_in_one_query(db_session, match_teams):
+    """Test chargement d'une date : événements et matchs en une requête"""
+    day = date.today() + timedelta(days=1)
+    db_session.add(Event(event_date=day, start_time=time(20, 0)))
+    db_session.commit()
+    add_matches(db_session, match_teams, 1)
+    court_occupancy.clear()
+
+    with count_queries(db_session) as statements:
+        slots = court_occupancy.load(db_session, [day])[day]
+    assert len(statements) == 1
+    assert slots == {time(18, 0): 1, time(20, 0): 0}
+
+def test_startup_warms_a_bounded_window(db_session, match_teams):
+    """Test préchargement au démarrage limité aux prochains jours"""
+    add_matches(db_session, match_teams, 1)  # J+1
+    court_occupancy.clear()
+    warm_court_occupancy(db_session, date.today(), 1)
+    assert court_occupancy._fresh(date.today()) == {}
+    assert court_occupancy._fresh(date.today() + timedelta(days=1)) is None
+
+def test_booking_outside_index_refused_by_database(db_session, match_teams):
+    """Test match réservé hors de l'index du process (autre worker, script) : refusé au flush, 409"""
+    day = date.today() + timedelta(days=1)
+    court_occupancy.load(db_session, [day])
+    db_session.execute(Match.__table__.insert().values(
+        team1_id=match_teams[0].id, team2_id=match_teams[1].id, match_date=day,
+        match_time=time(18, 0), court_number=1, status="A_VENIR"
+    ))
+    db_session.commit()
+    assert court_occupancy.is_free(db_session, day, time(18, 0), 1)
+
+    # Session d'un point de sauvegarde : son rollback n'annule pas la transaction du test
+    session = Session(bind=db_session.connection(), join_transaction_mode="create_savepoint")
+    matches = [
+        MatchCreate(team1_id=match_teams[0].id, team2_id=match_teams[1].id, match_date=day,
+                    match_time=time(18, 0), court_number=court)
+        for court in (1, 2)
+    ]
+    with pytest.raises(HTTPException) as error:
+        create_match(session, matches[0])
+    assert error.value.status_code == 409
+    with pytest.raises(HTTPException) as error:
+        create_matches_bulk(session, matches)
+    assert error.value.status_code == 409
+    assert [conflict["index"] for conflict in error.value.detail["conflicts"]] == [0]
+    assert db_session.query(Match).count() == 1
+
+def test_update_keeps_own_slot_available(client, db_session, match_teams, admin_headers):
+    """Test un match peut être modifié sans changer de piste (son créneau ne le bloque pas)"""
+    add_matches(db_session, match_teams, 1)
+    match_id = db_session.query(Match.id).scalar()
+    response = client.patch(f"/api/v1/matches/{match_id}", json={"court_number": 1}, headers=admin_headers)
+    assert response.status_code == 200
+
+def test_rolled_back_changes_are_discarded(db_session, match_teams):
+    """Test un match non validé n'occupe pas la piste"""
+    day = date.today() + timedelta(days=1)
+    court_occupancy.load(db_session, [day])
+    nested = db_session.begin_nested()
+    db_session.add(Match(team1_id=match_teams[0].id, team2_id=match_teams[1].id, match_date=day,
+                         match_time=time(18, 0), court_number=5, status="A_VENIR"))
+    db_session.flush()
+    nested.rollback()
+
+    assert "court_occupancy_changes" not in db_session.info
+    assert check_court_availability(db_session, day, time(18, 0), 5) is True
+
+
+def test_export_ndjson(client, db_session, match_teams, admin_headers):
+    """Test export NDJSON : une ligne par match, triée par date, avec équipes et joueurs"""
+    add_matches(db_session, match_teams, 3)
+    response = client.get("/api/v1/matches/export", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 3
+    assert list(rows[0]) == list(EXPORT_COLUMNS)
+    assert [row["match_date"] for row in rows] == sorted(row["match_date"] for row in rows)
+    assert rows[0]["team1_company"] == match_teams[0].company
+    assert rows[0]["team1_player1"] == "Player0 Match0"
+
+def test_export_csv_with_date_filter(client, db_session, match_teams, admin_headers):
+    """Test export CSV : en-tête puis les matchs de la période"""
+    add_matches(db_session, match_teams, 3)
+    day = (date.today() + timedelta(days=2)).isoformat()
+    response = client.get("/api/v1/matches/export", params={"format": "csv", "start": day, "end": day},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert [row[1] for row in rows[1:]] == [day]
+
+def test_export_rejects_unknown_format_and_non_admin(client, admin_headers):
+    """Test format inconnu : 400 ; sans droits administrateur : refusé"""
+    response = client.get("/api/v1/matches/export", params={"format": "xml"}, headers=admin_headers)
+    assert response.status_code == 400
+    assert client.get("/api/v1/matches/export").status_code in (401, 403)
@@ -0,0 +1,82 @@
+# ============================================
+# FICHIER : backend/tests/test_match_sets.py
+# ============================================
+
+import pytest
+from datetime import date, time, timedelta
+from fastapi import status
+from sqlalchemy import func, select
+from app.models.models import User, Player, Team, Match, MatchSet
+from app.crud.match_sets import backfill_match_sets
+
+
+@pytest.fixture
+def two_teams(db_session):
+    """Deux équipes (sans hash bcrypt)"""
+    players = []
+    for i in range(4):
+        user = User(email=f"sets{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(first_name="Jean", last_name="Sets", company="Corp", license_number=f"L{i}77777", user_id=user.id)
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+    teams = [Team(company="Corp", player1_id=players[2 * i].id, player2_id=players[2 * i + 1].id) for i in range(2)]
+    db_session.add_all(teams)
+    db_session.commit()
+    return teams
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def make_match(db_session, teams, court=1, **values):
+    match = Match(team1_id=teams[0].id, team2_id=teams[1].id, match_date=date.today() - timedelta(days=1),
+                  match_time=time(19, 0), court_number=court, **values)
+    db_session.add(match)
+    db_session.commit()
+    return match
+
+
+def stored_sets(db_session, match):
+    return db_session.execute(
+        select(MatchSet.set_no, MatchSet.games_team1, MatchSet.games_team2)
+        .where(MatchSet.match_id == match.id).order_by(MatchSet.set_no)
+    ).all()
+
+
+def test_sets_stored_when_match_finished(client, db_session, two_teams, admin_headers):
+    """Test match terminé : un enregistrement par set ; aucun tant qu'il est à venir"""
+    match = make_match(db_session, two_teams, status="A_VENIR")
+    assert stored_sets(db_session, match) == []
+
+    response = client.patch(f"/api/v1/matches/{match.id}", json={
+        "status": "TERMINE", "score_team1": "6-4, 3-6, 7-5", "score_team2": "4-6, 6-3, 5-7"
+    }, headers=admin_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert stored_sets(db_session, match) == [(1, 6, 4), (2, 3, 6), (3, 7, 5)]
+
+def test_sets_aggregate_in_sql(db_session, two_teams):
+    """Test sets gagnés par l'équipe 1 calculés par une agrégation SQL"""
+    make_match(db_session, two_teams, court=1, status="TERMINE", score_team1="6-4, 6-4", score_team2="4-6, 4-6")
+    make_match(db_session, two_teams, court=2, status="TERMINE", score_team1="2-6, 6-4, 1-6", score_team2="6-2, 4-6, 6-1")
+
+    sets_won = db_session.execute(
+        select(func.count()).select_from(MatchSet).join(Match, Match.id == MatchSet.match_id)
+        .where(Match.team1_id == two_teams[0].id, MatchSet.games_team1 > MatchSet.games_team2)
+    ).scalar_one()
+    assert sets_won == 3
+
+def test_backfill_from_score_strings(db_session, two_teams):
+    """Test matchs terminés sans sets (insérés hors ORM) : décomposés par le backfill"""
+    match = make_match(db_session, two_teams, status="TERMINE", score_team1="7-5, 6-4", score_team2="5-7, 4-6")
+    db_session.query(MatchSet).delete()
+    db_session.commit()
+
+    assert backfill_match_sets(db_session.connection()) == 1
+    assert stored_sets(db_session, match) == [(1, 7, 5), (2, 6, 4)]
+    assert backfill_match_sets(db_session.connection()) == 0
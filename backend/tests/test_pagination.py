@@ -0,0 +1,91 @@
+# ============================================
+# FICHIER : backend/tests/test_pagination.py
+# ============================================
+
+import pytest
+from fastapi import status
+from app.models.models import User, Player, Team, Pool
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+
+
+@pytest.fixture
+def many_players(db_session):
+    """Crée 7 joueurs et 3 équipes (sans hash bcrypt pour rester rapide)"""
+    players = []
+    for i in range(7):
+        user = User(email=f"page{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(first_name="Jean", last_name="Page", company="Corp", license_number=f"L{i}33333", user_id=user.id)
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+    for i in range(3):
+        db_session.add(Team(company="Corp", player1_id=players[2 * i].id, player2_id=players[2 * i + 1].id))
+    for i in range(3):
+        db_session.add(Pool(name=f"Poule {i}"))
+    db_session.commit()
+    return players
+
+
+def walk_pages(client, url, limit, headers=None):
+    """Parcourt toutes les pages et retourne (identifiants, nombre de pages)"""
+    ids, pages, cursor = [], 0, None
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        ids.extend(item["id"] for item in response.json())
+        pages += 1
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return ids, pages
+
+
+def test_cursor_roundtrip():
+    """Test encodage / décodage du curseur opaque"""
+    assert decode_cursor(encode_cursor(42)) == 42
+
+def test_invalid_cursor(client):
+    """Test curseur invalide : 400"""
+    response = client.get("/api/v1/teams/teams", params={"cursor": "pas-un-curseur"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.parametrize("url, total", [
+    ("/api/v1/players/players", 7),
+    ("/api/v1/teams/teams", 3),
+    ("/api/v1/pools/pools", 3),
+    ("/api/v1/users/users/select", 7),
+])
+def test_list_endpoints_paginate(client, many_players, url, total):
+    """Test listes paginées : chaque élément une seule fois, ordre croissant"""
+    ids, pages = walk_pages(client, url, limit=2)
+
+    assert len(ids) == total
+    assert ids == sorted(set(ids))
+    assert pages == (total + 1) // 2
+
+def test_last_page_has_no_cursor(client, many_players):
+    """Test pas d'en-tête X-Next-Cursor quand tout tient dans la page"""
+    response = client.get("/api/v1/players/players")
+    assert len(response.json()) == 7
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+def test_limit_is_bounded(client):
+    """Test taille de page maximale"""
+    response = client.get("/api/v1/teams/teams", params={"limit": 10000})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_users_paginate_newest_first(client, many_players, test_admin):
+    """Test /users : du plus récent au plus ancien, filtres conservés"""
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    ids, _ = walk_pages(client, "/api/v1/users/users", limit=3, headers=headers)
+    assert len(ids) == 8
+    assert ids == sorted(ids, reverse=True)
+
+    response = client.get("/api/v1/users/users", params={"is_admin": True}, headers=headers)
+    assert [user["id"] for user in response.json()] == [test_admin.id]
@@ -0,0 +1,100 @@
+# ============================================
+# FICHIER : backend/tests/test_planning_cache.py
+# ============================================
+
+import pytest
+from datetime import date, time, timedelta
+from fastapi import status
+from sqlalchemy import text, update
+from app.core.etag import bump_resource_versions
+from app.models.models import User, Player, Team, Event, Match
+from app.crud.planning_cache import planning_cache
+
+
+@pytest.fixture
+def planned_match(db_session):
+    """Un événement demain avec un match (sans hash bcrypt)"""
+    players = []
+    for i in range(4):
+        user = User(email=f"cache{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(first_name="Jean", last_name="Cache", company="Corp", license_number=f"L{i}88888", user_id=user.id)
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+    teams = [Team(company="Corp", player1_id=players[2 * i].id, player2_id=players[2 * i + 1].id) for i in range(2)]
+    event = Event(event_date=date.today() + timedelta(days=1), start_time=time(19, 0))
+    db_session.add_all(teams + [event])
+    db_session.flush()
+    match = Match(team1_id=teams[0].id, team2_id=teams[1].id, event_id=event.id, match_date=event.event_date,
+                  match_time=event.start_time, court_number=1, status="A_VENIR")
+    db_session.add(match)
+    db_session.commit()
+    return match
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def get_day(client, match):
+    response = client.get(f"/api/v1/events/day/{match.match_date.isoformat()}")
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def test_day_served_from_cache(client, planned_match):
+    """Test deuxième lecture du même jour : succès de cache, réponse identique"""
+    before = planning_cache.stats()
+    first = get_day(client, planned_match)
+    second = get_day(client, planned_match)
+
+    assert first == second
+    assert planning_cache.stats()["misses"] == before["misses"] + 1
+    assert planning_cache.stats()["hits"] == before["hits"] + 1
+
+def test_update_match_invalidates(client, planned_match, admin_headers):
+    """Test modification d'un match : la lecture suivante reflète le changement"""
+    assert get_day(client, planned_match)["matches"][0]["court_number"] == 1
+
+    response = client.patch(f"/api/v1/matches/{planned_match.id}", json={"court_number": 3}, headers=admin_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert get_day(client, planned_match)["matches"][0]["court_number"] == 3
+
+def test_team_edit_invalidates(client, db_session, planned_match):
+    """Test modification d'une équipe (hors API matchs) : cache vidé au commit"""
+    assert get_day(client, planned_match)["matches"][0]["team1"]["company"] == "Corp"
+
+    planned_match.team1.company = "Autre"
+    db_session.commit()
+    assert get_day(client, planned_match)["matches"][0]["team1"]["company"] == "Autre"
+
+def test_rollback_keeps_cache(client, db_session, planned_match):
+    """Test modification annulée : le cache n'est pas vidé"""
+    get_day(client, planned_match)
+    planned_match.court_number = 5
+    db_session.flush()
+    db_session.rollback()
+
+    assert len(planning_cache) == 1
+
+def test_write_from_other_process_invalidates(client, db_session, planned_match):
+    """Test écriture hors de cette session (autre worker, script) : versions en base, nouvelle clé"""
+    assert get_day(client, planned_match)["matches"][0]["court_number"] == 1
+
+    connection = db_session.connection()
+    connection.execute(text("UPDATE matches SET court_number = 4 WHERE id = :id"), {"id": planned_match.id})
+    bump_resource_versions(connection, ["matches"])
+    db_session.commit()
+    assert get_day(client, planned_match)["matches"][0]["court_number"] == 4
+
+def test_bulk_update_invalidates(client, db_session, planned_match):
+    """Test UPDATE en masse (style 2.0) : la lecture suivante reflète le changement"""
+    assert get_day(client, planned_match)["matches"][0]["court_number"] == 1
+
+    db_session.execute(update(Match).where(Match.id == planned_match.id).values(court_number=6))
+    db_session.commit()
+    assert get_day(client, planned_match)["matches"][0]["court_number"] == 6
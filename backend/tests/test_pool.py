@@ -269,4 +269,57 @@ def test_delete_pool_not_found(client, test_admin):
     response = client.delete("/api/v1/pools/pools/999", headers=headers)
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert "introuvable" in response.json()["detail"]
\ No newline at end of file
+    assert "introuvable" in response.json()["detail"]
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def test_create_pool_lists_every_bad_team(client, admin_headers, test_teams):
+    """Test plusieurs équipes inexistantes : toutes citées, rien n'est créé"""
+    response = client.post("/api/v1/pools/pools", json={
+        "name": "Poule Partielle",
+        "team_ids": [test_teams[0].id, 998, 999]
+    }, headers=admin_headers)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Équipes 998, 999 introuvables"
+    assert client.get("/api/v1/pools/pools").json() == []
+
+
+def test_create_pool_assigns_teams(client, db_session, admin_headers, test_teams):
+    """Test équipes affectées à la nouvelle poule"""
+    response = client.post("/api/v1/pools/pools", json={
+        "name": "Poule Affectee",
+        "team_ids": [team.id for team in test_teams]
+    }, headers=admin_headers)
+
+    pool_id = response.json()["id"]
+    db_session.expire_all()
+    assert {team.pool_id for team in db_session.query(Team).all()} == {pool_id}
+
+
+def test_move_teams_between_pools(client, db_session, admin_headers, test_pool):
+    """Test déplacement d'une équipe vers une autre poule"""
+    other = client.post("/api/v1/pools/pools", json={"name": "Autre Poule"}, headers=admin_headers).json()
+    team_ids = sorted(team.id for team in test_pool.teams)
+    moved = team_ids[0]
+
+    response = client.post(f"/api/v1/pools/pools/{other['id']}/teams", json={"team_ids": [moved]}, headers=admin_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert [team["id"] for team in response.json()] == [moved]
+    db_session.expire_all()
+    assert sorted(team.id for team in db_session.get(Pool, test_pool.id).teams) == team_ids[1:]
+
+
+def test_move_teams_unknown_ids(client, admin_headers, test_pool):
+    """Test équipe ou poule inexistante : 404"""
+    response = client.post(f"/api/v1/pools/pools/{test_pool.id}/teams", json={"team_ids": [999]}, headers=admin_headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Équipe 999 introuvable"
+
+    response = client.post("/api/v1/pools/pools/999/teams", json={"team_ids": [1]}, headers=admin_headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
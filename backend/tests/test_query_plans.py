@@ -0,0 +1,132 @@
+# ============================================
+# FICHIER : backend/tests/test_query_plans.py
+# ============================================
+
+import pytest
+from contextlib import contextmanager
+from datetime import date, time, timedelta
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, create_db_engine
+from app.models.models import User, Player, Team, Pool, Event, Match
+from app.crud.match import check_court_availability, get_upcoming_matches
+from app.crud.occupancy import court_occupancy
+from app.api.planning import EVENTS_RANGE_SQL, PLANNING_DAY_SQL, MY_EVENTS_SQL
+
+
+@pytest.fixture
+def plan_db(tmp_path):
+    """Base fichier dédiée, créée depuis les modèles ORM (avec leurs index)"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'plans.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    pool = Pool(name="Poule A")
+    db.add(pool)
+    players = []
+    for i in range(4):
+        user = User(email=f"plan{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db.add(user)
+        db.flush()
+        player = Player(first_name=f"P{i}", last_name="Plan", company="Company", license_number=f"L{i}11111", user_id=user.id)
+        db.add(player)
+        db.flush()
+        players.append(player)
+    teams = [
+        Team(company="Company", player1_id=players[0].id, player2_id=players[1].id, pool_id=pool.id),
+        Team(company="Other", player1_id=players[2].id, player2_id=players[3].id, pool_id=pool.id),
+    ]
+    db.add_all(teams)
+    db.flush()
+    today = date.today()
+    for i in range(10):
+        evt = Event(event_date=today + timedelta(days=i), start_time=time(18, 0))
+        db.add(evt)
+        db.flush()
+        db.add(Match(team1_id=teams[0].id, team2_id=teams[1].id, match_date=evt.event_date,
+                     match_time=evt.start_time, event_id=evt.id, court_number=1 + i % 3, status="A_VENIR"))
+    db.commit()
+    db.info["user"] = players[0].user
+    db.info["teams"] = teams
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+@contextmanager
+def capture_statements(db):
+    """Capture les requêtes SQL (texte + paramètres) émises par la session"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def full_scans(db, statements):
+    """Retourne les étapes du plan qui parcourent une table entière"""
+    scans = []
+    for statement, parameters in statements:
+        plan = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        for row in plan:
+            detail = row[-1]
+            if detail.startswith("SCAN ") and "CONSTANT ROW" not in detail:
+                scans.append(f"{detail}  <-  {statement.split()[0]} ...")
+    return scans
+
+
+def assert_no_full_scan(db, run):
+    db.expire_all()
+    with capture_statements(db) as statements:
+        run()
+    assert statements
+    assert full_scans(db, statements) == []
+
+
+def test_upcoming_matches_admin_uses_index(plan_db):
+    """Test matchs à venir (admin) : recherche par plage de dates"""
+    assert_no_full_scan(plan_db, lambda: get_upcoming_matches(plan_db, days=30, status_filter="A_VENIR"))
+
+def test_upcoming_matches_filters_use_index(plan_db):
+    """Test filtres entreprise / poule : sous-requêtes indexées sur teams"""
+    assert_no_full_scan(plan_db, lambda: get_upcoming_matches(plan_db, days=30, company_filter="Company"))
+    assert_no_full_scan(plan_db, lambda: get_upcoming_matches(plan_db, days=30, pool_filter=1))
+
+def test_upcoming_matches_player_uses_index(plan_db):
+    """Test vue joueur : joueur par user_id, équipes par joueur, matchs par équipe"""
+    user = plan_db.info["user"]
+    assert_no_full_scan(plan_db, lambda: get_upcoming_matches(plan_db, days=30, user=user))
+
+def test_court_availability_uses_index(plan_db):
+    """Test chargement de l'occupation d'une date : recherche par date"""
+    court_occupancy.clear()
+    assert_no_full_scan(plan_db, lambda: check_court_availability(plan_db, date.today(), time(18, 0), 1))
+
+def test_team_matches_lookup_uses_index(plan_db):
+    """Test matchs d'une équipe (modification / suppression d'équipe)"""
+    team_id = plan_db.info["teams"][0].id
+    assert_no_full_scan(plan_db, lambda: plan_db.query(Match).filter(
+        (Match.team1_id == team_id) | (Match.team2_id == team_id)
+    ).count())
+
+def test_planning_queries_use_index(plan_db):
+    """Test planning : événements par date puis matchs par événement"""
+    today = date.today()
+    params = {"start_date": today.isoformat(), "end_date": (today + timedelta(days=7)).isoformat(), "uid": 1}
+    assert_no_full_scan(plan_db, lambda: plan_db.execute(EVENTS_RANGE_SQL, params).fetchall())
+    assert_no_full_scan(plan_db, lambda: plan_db.execute(PLANNING_DAY_SQL, {"target_date": today.isoformat()}).fetchall())
+
+def test_my_events_uses_team_members(plan_db):
+    """Test mes matchs : équipes de l'utilisateur puis matchs par équipe"""
+    uid = plan_db.info["user"].id
+    rows = []
+    assert_no_full_scan(plan_db, lambda: rows.extend(plan_db.execute(MY_EVENTS_SQL, {"uid": uid}).fetchall()))
+    assert len(rows) == 10
@@ -0,0 +1,130 @@
+# ============================================
+# FICHIER : backend/tests/test_schedule.py
+# ============================================
+
+import pytest
+from collections import Counter
+from datetime import date, time, timedelta
+from fastapi import status
+from app.models.models import User, Player, Team, Pool, Event, Match
+from app.crud.schedule import round_robin, plan_schedule
+
+
+def make_slots(count, first_id=1):
+    today = date.today()
+    return [(first_id + i, today + timedelta(days=1 + i), time(19, 0)) for i in range(count)]
+
+
+def assert_conflict_free(scheduled, courts):
+    per_slot = Counter((m.match_date, m.match_time) for m in scheduled)
+    assert max(per_slot.values()) <= courts
+    teams_per_slot = Counter((m.match_date, m.match_time, team) for m in scheduled for team in (m.team1_id, m.team2_id))
+    assert max(teams_per_slot.values()) == 1
+    assert len({(m.match_date, m.match_time, m.court_number) for m in scheduled}) == len(scheduled)
+
+
+@pytest.mark.parametrize("teams", [2, 5, 8])
+def test_round_robin_every_pair_once(teams):
+    """Test chaque équipe rencontre toutes les autres une fois, une fois par ronde"""
+    rounds = round_robin(list(range(1, teams + 1)))
+    pairs = [frozenset(pair) for pairs in rounds for pair in pairs]
+
+    assert len(pairs) == len(set(pairs)) == teams * (teams - 1) // 2
+    for pairs_of_round in rounds:
+        teams_of_round = [team for pair in pairs_of_round for team in pair]
+        assert len(teams_of_round) == len(set(teams_of_round))
+
+def test_plan_schedule_is_conflict_free():
+    """Test 56 équipes, 7 poules, 10 pistes : tout est placé sans conflit"""
+    pools = {pool_id: list(range(pool_id * 100, pool_id * 100 + 8)) for pool_id in range(1, 8)}
+    scheduled, unscheduled = plan_schedule(pools, make_slots(30), courts=10)
+
+    assert unscheduled == []
+    assert len(scheduled) == 7 * 28
+    assert_conflict_free(scheduled, courts=10)
+
+def test_plan_schedule_respects_existing_matches():
+    """Test pistes et équipes déjà occupées, rencontres déjà programmées ignorées"""
+    slots = make_slots(3)
+    key = (slots[0][1], slots[0][2])
+    scheduled, _ = plan_schedule(
+        {1: [1, 2, 3, 4]}, slots, courts=2,
+        occupied_courts={key: {1}}, busy_teams={key: {1}}, played={frozenset((3, 4))}
+    )
+
+    assert frozenset((3, 4)) not in {frozenset((m.team1_id, m.team2_id)) for m in scheduled}
+    first_slot = [m for m in scheduled if (m.match_date, m.match_time) == key]
+    assert all(m.court_number == 2 and 1 not in (m.team1_id, m.team2_id) for m in first_slot)
+
+def test_plan_schedule_reports_unscheduled():
+    """Test pas assez de créneaux : rencontres restantes signalées"""
+    scheduled, unscheduled = plan_schedule({1: [1, 2, 3, 4]}, make_slots(1), courts=10)
+    assert len(scheduled) == 2
+    assert len(unscheduled) == 4
+
+
+@pytest.fixture
+def schedule_pool(db_session):
+    """Une poule de 4 équipes et 5 événements à venir (sans hash bcrypt)"""
+    players = []
+    for i in range(8):
+        user = User(email=f"sched{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(first_name="Jean", last_name="Planning", company="Corp", license_number=f"L{i}55555", user_id=user.id)
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+    pool = Pool(name="Poule Planning")
+    db_session.add(pool)
+    db_session.flush()
+    db_session.add_all([
+        Team(company="Corp", player1_id=players[2 * i].id, player2_id=players[2 * i + 1].id, pool_id=pool.id)
+        for i in range(4)
+    ])
+    for day in range(1, 6):
+        db_session.add(Event(event_date=date.today() + timedelta(days=day), start_time=time(19, 0)))
+    db_session.commit()
+    return pool
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def schedule(client, headers, pool, dry_run):
+    today = date.today()
+    return client.post("/api/v1/pools/pools/schedule", json={
+        "pool_ids": [pool.id],
+        "start_date": today.isoformat(),
+        "end_date": (today + timedelta(days=10)).isoformat(),
+        "courts": 2,
+        "dry_run": dry_run,
+    }, headers=headers)
+
+
+def test_schedule_endpoint_dry_run_then_create(client, db_session, schedule_pool, admin_headers):
+    """Test simulation sans écriture, puis création ; une nouvelle génération ne duplique rien"""
+    response = schedule(client, admin_headers, schedule_pool, dry_run=True)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["scheduled"]) == 6
+    assert response.json()["created"] == 0
+    assert db_session.query(Match).count() == 0
+
+    response = schedule(client, admin_headers, schedule_pool, dry_run=False)
+    assert response.json()["created"] == 6
+    assert db_session.query(Match).count() == 6
+
+    response = schedule(client, admin_headers, schedule_pool, dry_run=False)
+    assert response.json()["scheduled"] == []
+    assert db_session.query(Match).count() == 6
+
+def test_schedule_unknown_pool(client, admin_headers):
+    """Test poule inexistante : 404"""
+    today = date.today().isoformat()
+    response = client.post("/api/v1/pools/pools/schedule", json={
+        "pool_ids": [999], "start_date": today, "end_date": today
+    }, headers=admin_headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,94 @@
+# ============================================
+# FICHIER : backend/tests/test_search.py
+# ============================================
+
+import pytest
+from fastapi import status
+from app.models.models import User, Player, SearchDocument
+from app.crud.search import rebuild_search_documents
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+@pytest.fixture
+def search_players(db_session):
+    """Trois joueurs aux noms proches (sans hash bcrypt pour rester rapide)"""
+    rows = [
+        ("jean.dupont@corp.com", "Jean", "Dupont", "Corp"),
+        ("marie.durand@acme.fr", "Marie", "Durand", "Acme"),
+        ("paul@dupuis.fr", "Paul", "Martin", "Dupuis SA"),
+    ]
+    players = []
+    for i, (email, first_name, last_name, company) in enumerate(rows):
+        user = User(email=email, password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(first_name=first_name, last_name=last_name, company=company, license_number=f"L{i}44444", user_id=user.id)
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+    db_session.commit()
+    return players
+
+
+def search(client, headers, q, mode="substring"):
+    response = client.get("/api/v1/users/users/search", params={"q": q, "mode": mode}, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    return [result["email"] for result in response.json()]
+
+
+def test_search_substring(client, admin_headers, search_players):
+    """Test sous-chaîne dans l'email, le nom ou l'entreprise"""
+    assert set(search(client, admin_headers, "dup")) == {"jean.dupont@corp.com", "paul@dupuis.fr"}
+    assert search(client, admin_headers, "ACME") == ["marie.durand@acme.fr"]
+    assert search(client, admin_headers, "an.d") == ["jean.dupont@corp.com"]
+
+def test_search_prefix(client, admin_headers, search_players):
+    """Test préfixe : un des champs commence par la saisie"""
+    assert set(search(client, admin_headers, "mar", mode="prefix")) == {"marie.durand@acme.fr", "paul@dupuis.fr"}
+    assert search(client, admin_headers, "ont", mode="prefix") == []
+
+def test_search_short_query_uses_field_prefix(client, admin_headers, search_players):
+    """Test moins de 3 caractères : préfixe d'un des champs, sans tenir compte de la casse"""
+    assert search(client, admin_headers, "pa") == ["paul@dupuis.fr"]
+    assert search(client, admin_headers, "DU") == ["jean.dupont@corp.com", "marie.durand@acme.fr", "paul@dupuis.fr"]
+    assert search(client, admin_headers, "nt") == []
+
+def test_search_email_case_insensitive(client, admin_headers, db_session):
+    """Test email indexé en minuscules : trouvé quelle que soit la casse saisie"""
+    db_session.add(User(email="Zoe.Martin@Corp.com", password_hash="x", is_admin=False, is_active=True))
+    db_session.commit()
+    assert search(client, admin_headers, "zo") == ["zoe.martin@corp.com"]
+    assert search(client, admin_headers, "ZOE.M") == ["zoe.martin@corp.com"]
+
+def test_search_follows_player_updates(client, admin_headers, search_players, db_session):
+    """Test index tenu à jour à la modification et à la suppression du joueur"""
+    player = search_players[0]
+    player.last_name = "Lefebvre"
+    db_session.commit()
+    assert search(client, admin_headers, "lefeb") == ["jean.dupont@corp.com"]
+
+    db_session.delete(player)
+    db_session.commit()
+    assert search(client, admin_headers, "lefeb") == []
+    assert search(client, admin_headers, "jean.du") == ["jean.dupont@corp.com"]
+
+def test_search_invalid_mode(client, admin_headers):
+    """Test mode inconnu : 400"""
+    response = client.get("/api/v1/users/users/search", params={"q": "abc", "mode": "fuzzy"}, headers=admin_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_users_list_search_uses_index(client, admin_headers, search_players):
+    """Test filtre `search` de la liste des utilisateurs"""
+    response = client.get("/api/v1/users/users", params={"search": "durand"}, headers=admin_headers)
+    assert [user["email"] for user in response.json()] == ["marie.durand@acme.fr"]
+
+def test_rebuild_search_documents(db_session, search_players):
+    """Test reconstruction complète de l'index"""
+    db_session.query(SearchDocument).delete()
+    rebuild_search_documents(db_session.connection())
+    assert db_session.query(SearchDocument).count() == 3
@@ -2,12 +2,18 @@
 # FICHIER : backend/tests/test_security.py
 # ============================================
 
+import asyncio
 import pytest
+from threading import BoundedSemaphore
+from app.core import security
 from app.core.security import (
     verify_password, 
+    verify_password_bounded,
+    submit_password_check,
     get_password_hash, 
     create_access_token,
-    decode_token
+    decode_token,
+    PasswordHasherBusy
 )
 
 def test_password_hashing():
@@ -24,6 +30,35 @@ def test_password_hashing():
     # Un mauvais mot de passe ne doit pas passer
     assert verify_password("WrongPassword", hashed) is False
 
+def test_password_verification_on_pool():
+    """Test de la vérification sur le pool dédié"""
+    hashed = get_password_hash("TestP@ssw0rd123")
+
+    assert verify_password_bounded("TestP@ssw0rd123", hashed) is True
+    assert verify_password_bounded("WrongPassword", hashed) is False
+
+def test_password_check_awaited_releases_slot(monkeypatch):
+    """Test de la vérification attendue depuis une boucle asyncio : créneau rendu à la fin"""
+    hashed = get_password_hash("TestP@ssw0rd123")
+    slots = BoundedSemaphore(1)
+    monkeypatch.setattr(security, "_hash_slots", slots)
+
+    async def check():
+        return await asyncio.wrap_future(submit_password_check("TestP@ssw0rd123", hashed))
+
+    assert asyncio.run(check()) is True
+    assert slots.acquire(blocking=False)
+
+def test_password_verification_pool_saturated(monkeypatch):
+    """Test du refus immédiat quand le pool est saturé"""
+    hashed = get_password_hash("TestP@ssw0rd123")
+    saturated = BoundedSemaphore(1)
+    saturated.acquire()
+    monkeypatch.setattr(security, "_hash_slots", saturated)
+
+    with pytest.raises(PasswordHasherBusy):
+        verify_password_bounded("TestP@ssw0rd123", hashed)
+
 def test_jwt_token_creation():
     """Test de la création de token JWT"""
     data = {"sub": "123", "email": "test@example.com", "is_admin": False}
@@ -0,0 +1,132 @@
+# ============================================
+# FICHIER : backend/tests/test_standings.py
+# ============================================
+
+import pytest
+from datetime import date, time, timedelta
+from fastapi import status
+from app.models.models import User, Player, Team, Pool, Match, TeamStanding
+
+
+@pytest.fixture
+def standings_pool(db_session):
+    """Une poule de 3 équipes et leurs 3 rencontres à venir (sans hash bcrypt)"""
+    players = []
+    for i in range(6):
+        user = User(email=f"rank{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(first_name="Jean", last_name="Classement", company="Corp", license_number=f"L{i}66666", user_id=user.id)
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+    pool = Pool(name="Poule Classement")
+    db_session.add(pool)
+    db_session.flush()
+    teams = [
+        Team(company=f"Corp {i}", player1_id=players[2 * i].id, player2_id=players[2 * i + 1].id, pool_id=pool.id)
+        for i in range(3)
+    ]
+    db_session.add_all(teams)
+    db_session.flush()
+    day = date.today() - timedelta(days=1)
+    matches = [
+        Match(team1_id=teams[a].id, team2_id=teams[b].id, match_date=day, match_time=time(19, 0),
+              court_number=court, status="A_VENIR")
+        for court, (a, b) in enumerate([(0, 1), (0, 2), (1, 2)], start=1)
+    ]
+    db_session.add_all(matches)
+    db_session.commit()
+    return pool, teams, matches
+
+
+@pytest.fixture
+def admin_headers(client, test_admin):
+    login = client.post("/api/v1/auth/login", json={"email": "admin@example.com", "password": "AdminP@ssw0rd123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def finish(client, headers, match, score1, score2):
+    response = client.patch(f"/api/v1/matches/{match.id}", json={
+        "status": "TERMINE", "score_team1": score1, "score_team2": score2
+    }, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def standings(client, pool):
+    response = client.get(f"/api/v1/pools/pools/{pool.id}/standings")
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def test_standings_without_matches(client, standings_pool):
+    """Test équipes sans match terminé : toutes à zéro"""
+    pool, teams, _ = standings_pool
+    rows = standings(client, pool)
+
+    assert [row["team_id"] for row in rows] == [team.id for team in teams]
+    assert [row["rank"] for row in rows] == [1, 2, 3]
+    assert all(row["played"] == 0 and row["wins"] == 0 and row["game_diff"] == 0 for row in rows)
+
+def test_standings_updated_when_match_finished(client, standings_pool, admin_headers):
+    """Test victoires, sets et jeux mis à jour à chaque match terminé, puis classement"""
+    pool, teams, matches = standings_pool
+    finish(client, admin_headers, matches[0], "6-4, 3-6, 6-3", "4-6, 6-3, 3-6")
+    finish(client, admin_headers, matches[1], "4-6, 6-3, 2-6", "6-4, 3-6, 6-2")
+    finish(client, admin_headers, matches[2], "6-0, 6-0", "0-6, 0-6")
+
+    rows = {row["team_id"]: row for row in standings(client, pool)}
+    first = rows[teams[0].id]
+    assert (first["played"], first["wins"], first["losses"]) == (2, 1, 1)
+    assert (first["sets_won"], first["sets_lost"], first["set_diff"]) == (3, 3, 0)
+    assert (first["games_won"], first["games_lost"], first["game_diff"]) == (15 + 12, 13 + 15, -1)
+
+    # Toutes les équipes ont 1 victoire : départage à la différence de sets
+    ranking = [row["team_id"] for row in standings(client, pool)]
+    assert ranking == [teams[1].id, teams[0].id, teams[2].id]
+
+def test_recompute_repairs_standings(client, db_session, standings_pool, admin_headers):
+    """Test table des bilans effacée : le recalcul la reconstruit à l'identique"""
+    pool, _, matches = standings_pool
+    finish(client, admin_headers, matches[0], "6-4, 6-3", "4-6, 3-6")
+    expected = standings(client, pool)
+
+    db_session.query(TeamStanding).delete()
+    db_session.commit()
+    assert standings(client, pool) != expected
+
+    response = client.post(f"/api/v1/pools/pools/{pool.id}/standings/recompute", headers=admin_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == expected
+
+def test_standings_count_only_matches_within_pool(client, db_session, standings_pool, admin_headers):
+    """Test équipe déplacée : ses matchs ne comptent plus dans l'ancienne poule ni dans la nouvelle"""
+    pool, teams, matches = standings_pool
+    finish(client, admin_headers, matches[0], "6-4, 6-3", "4-6, 3-6")  # équipe 0 bat équipe 1
+    other = Pool(name="Autre poule")
+    db_session.add(other)
+    db_session.commit()
+
+    response = client.post(f"/api/v1/pools/pools/{other.id}/teams", json={"team_ids": [teams[1].id]}, headers=admin_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert all(row["played"] == 0 for row in standings(client, pool))
+    assert [row["played"] for row in standings(client, other)] == [0]
+
+    # Retour dans la poule : le match redevient un match de poule
+    teams[1].pool_id = pool.id
+    db_session.commit()
+    rows = {row["team_id"]: row for row in standings(client, pool)}
+    assert (rows[teams[0].id]["wins"], rows[teams[1].id]["losses"]) == (1, 1)
+
+    # Match entre équipes de poules différentes : compté nulle part
+    finish(client, admin_headers, matches[1], "6-0, 6-0", "0-6, 0-6")
+    teams[2].pool_id = other.id
+    db_session.commit()
+    assert {row["team_id"]: row["played"] for row in standings(client, pool)} == {teams[0].id: 1, teams[1].id: 1}
+    finish(client, admin_headers, matches[2], "6-0, 6-0", "0-6, 0-6")
+    assert {row["team_id"]: row["played"] for row in standings(client, pool)} == {teams[0].id: 1, teams[1].id: 1}
+
+def test_standings_unknown_pool(client):
+    """Test poule inexistante : 404"""
+    response = client.get("/api/v1/pools/pools/999/standings")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,91 @@
+# ============================================
+# FICHIER : backend/tests/test_team_members.py
+# ============================================
+
+import pytest
+from app.models.models import User, Player, Team, TeamMember
+from app.crud.team_members import rebuild_team_members
+
+
+@pytest.fixture
+def members_players(db_session):
+    """Crée quatre joueurs rattachés chacun à un utilisateur"""
+    players = []
+    for i in range(4):
+        user = User(email=f"member{i}@test.com", password_hash="x", is_admin=False, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        player = Player(first_name=f"P{i}", last_name="Member", company="Corp", license_number=f"L{i}22222", user_id=user.id)
+        db_session.add(player)
+        db_session.flush()
+        players.append(player)
+    db_session.commit()
+    return players
+
+
+def members(db_session):
+    return set(db_session.query(TeamMember.user_id, TeamMember.team_id).all())
+
+
+def test_team_create_adds_members(db_session, members_players):
+    """Test création d'équipe : ses deux joueurs deviennent membres"""
+    p1, p2 = members_players[:2]
+    team = Team(company="Corp", player1_id=p1.id, player2_id=p2.id)
+    db_session.add(team)
+    db_session.commit()
+
+    assert members(db_session) == {(p1.user_id, team.id), (p2.user_id, team.id)}
+
+def test_team_update_players_resyncs_members(db_session, members_players):
+    """Test changement de joueur : l'ancien membre est remplacé"""
+    p1, p2, p3, _ = members_players
+    team = Team(company="Corp", player1_id=p1.id, player2_id=p2.id)
+    db_session.add(team)
+    db_session.commit()
+
+    team.player2_id = p3.id
+    db_session.commit()
+
+    assert members(db_session) == {(p1.user_id, team.id), (p3.user_id, team.id)}
+
+def test_team_delete_removes_members(db_session, members_players):
+    """Test suppression d'équipe"""
+    team = Team(company="Corp", player1_id=members_players[0].id, player2_id=members_players[1].id)
+    db_session.add(team)
+    db_session.commit()
+
+    db_session.delete(team)
+    db_session.commit()
+
+    assert members(db_session) == set()
+
+def test_player_changes_resync_members(db_session, members_players):
+    """Test joueur rattaché à un autre compte puis supprimé"""
+    p1, p2, _, _ = members_players
+    team = Team(company="Corp", player1_id=p1.id, player2_id=p2.id)
+    db_session.add(team)
+    other = User(email="other@test.com", password_hash="x", is_admin=False, is_active=True)
+    db_session.add(other)
+    db_session.commit()
+
+    p1.user_id = other.id
+    db_session.commit()
+    assert members(db_session) == {(other.id, team.id), (p2.user_id, team.id)}
+
+    db_session.delete(p2)
+    db_session.commit()
+    assert members(db_session) == {(other.id, team.id)}
+
+def test_rebuild_team_members(db_session, members_players):
+    """Test reconstruction complète après une désynchronisation"""
+    p1, p2, p3, p4 = members_players
+    teams = [Team(company="Corp", player1_id=p1.id, player2_id=p2.id), Team(company="Corp", player1_id=p3.id, player2_id=p4.id)]
+    db_session.add_all(teams)
+    db_session.commit()
+    expected = members(db_session)
+    db_session.query(TeamMember).delete()
+
+    rebuild_team_members(db_session.connection())
+
+    assert members(db_session) == expected
+    assert len(expected) == 4
@@ -0,0 +1,95 @@
+# ============================================
+# FICHIER : backend/tests/test_throttle.py
+# ============================================
+
+import pytest
+from datetime import timedelta
+from app.core.throttle import LoginThrottle, MemoryLoginThrottle, DatabaseLoginThrottle, build_login_throttle
+from app.models.models import LoginAttempt
+
+EMAIL = "throttle@example.com"
+
+
+@pytest.fixture(params=["memory", "database"])
+def throttle(request, test_db):
+    return build_login_throttle(request.param, max_attempts=3, lockout_minutes=30)
+
+
+def test_lock_after_max_attempts(throttle, db_session):
+    """Test blocage au bout de max_attempts échecs"""
+    assert throttle.record_failure(db_session, EMAIL) == (1, None)
+    assert throttle.record_failure(db_session, EMAIL) == (2, None)
+    assert throttle.locked_until(db_session, EMAIL) is None
+
+    count, locked_until = throttle.record_failure(db_session, EMAIL)
+    assert count == 3
+    assert locked_until is not None
+    assert throttle.locked_until(db_session, EMAIL) == locked_until
+
+def test_reset_after_success(throttle, db_session):
+    """Test réinitialisation du compteur après succès"""
+    throttle.record_failure(db_session, EMAIL)
+    throttle.record_failure(db_session, EMAIL)
+    throttle.reset(db_session, EMAIL)
+
+    assert throttle.record_failure(db_session, EMAIL) == (1, None)
+
+def test_emails_are_independent(throttle, db_session):
+    """Test les compteurs sont propres à chaque email"""
+    for _ in range(3):
+        throttle.record_failure(db_session, EMAIL)
+
+    assert throttle.locked_until(db_session, "other@example.com") is None
+
+def test_clear_removes_locks(throttle, db_session):
+    """Test effacement de tous les compteurs et blocages"""
+    for _ in range(3):
+        throttle.record_failure(db_session, EMAIL)
+    throttle.clear(db_session)
+
+    assert throttle.locked_until(db_session, EMAIL) is None
+    assert throttle.record_failure(db_session, EMAIL) == (1, None)
+
+def test_memory_old_failures_expire(db_session):
+    """Test fenêtre glissante en mémoire : les échecs anciens ne comptent plus"""
+    throttle = MemoryLoginThrottle(max_attempts=3, lockout_minutes=30)
+    throttle.record_failure(db_session, EMAIL)
+    throttle.record_failure(db_session, EMAIL)
+
+    entries, _ = throttle._shard(EMAIL)
+    failures = entries[EMAIL][0]
+    for i in range(len(failures)):
+        failures[i] -= timedelta(minutes=31)
+
+    assert throttle.record_failure(db_session, EMAIL) == (1, None)
+
+def test_database_old_failures_expire(db_session):
+    """Test fenêtre en base : compteur remis à zéro après une fenêtre sans échec"""
+    throttle = DatabaseLoginThrottle(max_attempts=3, lockout_minutes=30)
+    throttle.record_failure(db_session, EMAIL)
+    throttle.record_failure(db_session, EMAIL)
+
+    attempt = db_session.query(LoginAttempt).filter(LoginAttempt.email == EMAIL).first()
+    attempt.last_attempt -= timedelta(minutes=31)
+    db_session.commit()
+
+    assert throttle.record_failure(db_session, EMAIL) == (1, None)
+
+def test_unknown_backend():
+    """Test backend inconnu"""
+    with pytest.raises(ValueError):
+        build_login_throttle("redis", max_attempts=3, lockout_minutes=30)
+
+def test_auto_backend_shared_across_workers():
+    """Test "auto" : compteurs en mémoire pour un worker, en base dès qu'il y en a plusieurs"""
+    assert isinstance(build_login_throttle("auto", max_attempts=3, lockout_minutes=30), MemoryLoginThrottle)
+    assert isinstance(build_login_throttle("auto", max_attempts=3, lockout_minutes=30, workers=4), DatabaseLoginThrottle)
+
+def test_incomplete_backend_rejected():
+    """Test un backend doit implémenter toute l'interface"""
+    class PartialThrottle(LoginThrottle):
+        def locked_until(self, db, email):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialThrottle(max_attempts=3, lockout_minutes=30)
@@ -39,6 +39,23 @@ api.interceptors.response.use(
   }
 )
 
+// Listes paginées : une page par appel, le curseur de la suivante dans l'en-tête X-Next-Cursor
+// (absent sur la dernière page). getAllPages suit toutes les pages : réservé aux listes
+// de sélection qui ont besoin de l'ensemble (formulaires, correspondance id -> nom)
+export const nextCursor = (response) => response.headers['x-next-cursor'] || null
+
+const getAllPages = async (url, params = {}) => {
+  const response = await api.get(url, { params })
+  const data = [...response.data]
+  let cursor = nextCursor(response)
+  while (cursor) {
+    const next = await api.get(url, { params: { ...params, cursor } })
+    data.push(...next.data)
+    cursor = nextCursor(next)
+  }
+  return { ...response, data }
+}
+
 // API d'authentification
 export const authAPI = {
   login: (email, password) => 
@@ -59,8 +76,8 @@ export const userAPI = {
   createUser: (userData) =>
     api.post('/users/users', userData),
 
-  getUsers: () =>
-    api.get(`/users/users`),
+  getUsers: (params) =>
+    api.get('/users/users', { params }),
 
   getUser: (userId) =>
     api.get(`/users/users/${userId}`),
@@ -75,7 +92,7 @@ export const userAPI = {
     api.get('/users/users/generate-password'),
 
   getUsersForSelect: () =>
-    api.get('/users/users/select')
+    getAllPages('/users/users/select')
 }
 
 export const matchAPI = {
@@ -96,8 +113,11 @@ export const matchAPI = {
 }
 
 export const playerAPI = {
-  getPlayers: () =>
-    api.get("/players/players"),
+  getPlayers: (params) =>
+    api.get("/players/players", { params }),
+
+  getAllPlayers: () =>
+    getAllPages("/players/players"),
 
   getPlayer: (id) =>
     api.get(`/players/players/${id}`),
@@ -113,8 +133,11 @@ export const playerAPI = {
 }
 
 export const teamAPI = {
-  getTeams: () =>
-    api.get("/teams/teams"),
+  getTeams: (params) =>
+    api.get("/teams/teams", { params }),
+
+  getAllTeams: () =>
+    getAllPages("/teams/teams"),
 
   getTeam: (id) =>
     api.get(`/teams/teams/${id}`),
@@ -130,8 +153,8 @@ export const teamAPI = {
 }
 
 export const poolAPI = {
-  getPools: () =>
-    api.get("/pools/pools"),
+  getPools: (params) =>
+    api.get("/pools/pools", { params }),
 
   getPool: (id) =>
     api.get(`/pools/pools/${id}`),
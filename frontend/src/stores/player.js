@@ -1,15 +1,28 @@
 import { defineStore } from "pinia"
 import { ref } from "vue"
-import { playerAPI } from "@/services/api"
+import { playerAPI, nextCursor } from "@/services/api"
 
 export const usePlayerStore = defineStore("player", () => {
   const players = ref([])
   const loading = ref(false)
+  const cursor = ref(null)
 
+  // Première page ; les suivantes avec loadMorePlayers()
   async function getPlayers() {
     loading.value = true
     const res = await playerAPI.getPlayers()
     players.value = res.data
+    cursor.value = nextCursor(res)
+    loading.value = false
+    return res.data
+  }
+
+  async function loadMorePlayers() {
+    if (!cursor.value) return []
+    loading.value = true
+    const res = await playerAPI.getPlayers({ cursor: cursor.value })
+    players.value.push(...res.data)
+    cursor.value = nextCursor(res)
     loading.value = false
     return res.data
   }
@@ -40,7 +53,9 @@ export const usePlayerStore = defineStore("player", () => {
   return {
     players,
     loading,
+    cursor,
     getPlayers,
+    loadMorePlayers,
     getPlayer,
     updatePlayer,
     deletePlayer,
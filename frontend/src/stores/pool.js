@@ -1,15 +1,28 @@
 import { defineStore } from "pinia"
 import { ref } from "vue"
-import { poolAPI } from "@/services/api"
+import { poolAPI, nextCursor } from "@/services/api"
 
 export const usePoolStore = defineStore("pool", () => {
   const pools = ref([])
   const loading = ref(false)
+  const cursor = ref(null)
 
+  // Première page ; les suivantes avec loadMorePools()
   async function getPools() {
     loading.value = true
     const res = await poolAPI.getPools()
     pools.value = res.data
+    cursor.value = nextCursor(res)
+    loading.value = false
+    return res.data
+  }
+
+  async function loadMorePools() {
+    if (!cursor.value) return []
+    loading.value = true
+    const res = await poolAPI.getPools({ cursor: cursor.value })
+    pools.value.push(...res.data)
+    cursor.value = nextCursor(res)
     loading.value = false
     return res.data
   }
@@ -40,7 +53,9 @@ export const usePoolStore = defineStore("pool", () => {
   return {
     pools,
     loading,
+    cursor,
     getPools,
+    loadMorePools,
     getPool,
     updatePool,
     deletePool,
@@ -1,15 +1,38 @@
 import { defineStore } from "pinia"
 import { ref } from "vue"
-import { teamAPI } from "@/services/api"
+import { teamAPI, nextCursor } from "@/services/api"
 
 export const useTeamStore = defineStore("team", () => {
     const teams = ref([])
     const loading = ref(false)
+    const cursor = ref(null)
 
+    // Première page ; les suivantes avec loadMoreTeams()
     async function getTeams() {
         loading.value = true
         const res = await teamAPI.getTeams()
         teams.value = res.data  
+        cursor.value = nextCursor(res)
+        loading.value = false
+        return res.data
+    }
+
+    async function loadMoreTeams() {
+        if (!cursor.value) return []
+        loading.value = true
+        const res = await teamAPI.getTeams({ cursor: cursor.value })
+        teams.value.push(...res.data)
+        cursor.value = nextCursor(res)
+        loading.value = false
+        return res.data
+    }
+
+    // Toutes les équipes (composition des poules)
+    async function getAllTeams() {
+        loading.value = true
+        const res = await teamAPI.getAllTeams()
+        teams.value = res.data
+        cursor.value = null
         loading.value = false
         return res.data
     }
@@ -39,7 +62,10 @@ export const useTeamStore = defineStore("team", () => {
     return {
         teams,
         loading,
+        cursor,
         getTeams,
+        loadMoreTeams,
+        getAllTeams,
         getTeam,
         updateTeam,
         deleteTeam,
@@ -4,7 +4,7 @@
 
 import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
-import { userAPI } from '@/services/api'
+import { userAPI, nextCursor } from '@/services/api'
 
 export const useUserStore = defineStore('user', () => {
   const user = ref(null)
@@ -12,6 +12,7 @@ export const useUserStore = defineStore('user', () => {
   const loading = ref(false)
   const error = ref(null)
   const users = ref([])
+  const usersCursor = ref(null)
 
   const isAuthenticated = computed(() => !!token.value)
   const isAdmin = computed(() => user.value?.is_admin === true)
@@ -34,12 +35,14 @@ export const useUserStore = defineStore('user', () => {
     }
   }
 
+  // Première page des utilisateurs ; les suivantes avec loadMoreUsers()
   async function getUsers() {
     loading.value = true
     error.value = null
     try {
       const res = await userAPI.getUsers()
       users.value = res.data
+      usersCursor.value = nextCursor(res)
       console.log(res)
       return res
     } catch (err) {
@@ -50,6 +53,23 @@ export const useUserStore = defineStore('user', () => {
     }
   }
 
+  async function loadMoreUsers() {
+    if (!usersCursor.value) return
+    loading.value = true
+    error.value = null
+    try {
+      const res = await userAPI.getUsers({ cursor: usersCursor.value })
+      users.value.push(...res.data)
+      usersCursor.value = nextCursor(res)
+      return res
+    } catch (err) {
+      error.value = err.response?.data || 'Erreur lors de la récupération'
+      throw err
+    } finally {
+      loading.value = false
+    }
+  }
+
   // Supprimer un utilisateur
   async function deleteUser(userId) {
     loading.value = true
@@ -84,10 +104,12 @@ export const useUserStore = defineStore('user', () => {
     loading,
     error,
     users,
+    usersCursor,
     isAuthenticated,
     isAdmin,
     createUser,
     getUsers,
+    loadMoreUsers,
     deleteUser,
     regeneratePassword
   }